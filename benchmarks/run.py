@@ -0,0 +1,288 @@
+# ==========================================
+# Benchmarks: Parsing, Matching & Ranking at Scale
+# ==========================================
+"""
+Suite de benchmarks sur données synthétiques déterministes.
+
+Mesure :
+- le débit de parsing par format (TXT, DOCX, PDF) ;
+- le débit de compute_match (paires/s) et de compute_match_matrix ;
+- la latence p50/p99 de recommend_candidates à plusieurs tailles de vivier ;
+- le rappel@k et la latence de la recherche approximative (MinHash/LSH) selon
+  le nombre de bandes ;
+- le classement groupé de plusieurs offres en une lecture d'un vivier projeté
+  en mémoire, comparé à une boucle offre par offre ;
+- l'écriture et le rechargement d'un instantané binaire du vivier (démarrage à chaud) ;
+- le temps d'import à froid des modules de service (démarrage des processus de calcul).
+
+Les résultats sont écrits dans un fichier JSON comparable entre versions.
+
+Usage:
+    python -m benchmarks.run --output bench_results.json
+    python -m benchmarks.run --sizes 1000 100000 --compare bench_results.json
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
+
+from benchmarks.synthetic import SyntheticGenerator
+from src.services.analyzer import CVAnalyzer
+from src.services.lsh import MinHashLSHIndex, measure_recall
+from src.services.matcher import MatchingEngine
+from src.services.pool import CandidatePool
+from src.services.recommender import RecommendationSystem
+from src.services.sharding import ShardedRecommender
+from src.services.snapshot import load_snapshot, save_snapshot
+
+SCHEMA_VERSION = 1
+
+
+def _record(results: List[Dict], benchmark: str, case: str, metric: str, value: float, unit: str, **params) -> None:
+    results.append({"benchmark": benchmark, "case": case, "metric": metric,
+                    "value": round(float(value), 6), "unit": unit, "params": params})
+    print(f"  {benchmark:<10} {case:<22} {metric:<16} {value:>14.3f} {unit}")
+
+
+def bench_parsing(gen: SyntheticGenerator, files: int, workers: int, results: List[Dict]) -> None:
+    """Débit de parsing par format, en traitement par lot."""
+    analyzer = CVAnalyzer()
+    writers = {"txt": gen.write_txt, "docx": gen.write_docx, "pdf": gen.write_pdf}
+    with tempfile.TemporaryDirectory() as tmp:
+        for fmt, write in writers.items():
+            paths = []
+            for i in range(files):
+                path = Path(tmp) / f"CAND_{i:07d}.{fmt}"
+                write(path, i)
+                paths.append(str(path))
+            start = time.perf_counter()
+            parsed = sum(1 for _ in analyzer.parse_many(paths, max_workers=workers))
+            elapsed = time.perf_counter() - start
+            _record(results, "parse", fmt, "files_per_sec", parsed / elapsed, "files/s",
+                    files=files, workers=workers)
+
+    texts = [gen.cv_text(i) for i in range(files)]
+    start = time.perf_counter()
+    for i, text in enumerate(texts):
+        analyzer.parse_from_text(text, str(i))
+    elapsed = time.perf_counter() - start
+    _record(results, "parse", "text", "docs_per_sec", files / elapsed, "docs/s", files=files)
+
+
+def bench_matching(gen: SyntheticGenerator, n_cvs: int, n_offers: int, results: List[Dict]) -> None:
+    """Débit de scoring paire par paire, puis vectorisé."""
+    matcher = MatchingEngine()
+    cvs, offers = gen.cvs(n_cvs), gen.offers(n_offers)
+
+    start = time.perf_counter()
+    for offer in offers:
+        for cv in cvs:
+            matcher.compute_match(cv, offer)
+    elapsed = time.perf_counter() - start
+    _record(results, "match", "compute_match", "pairs_per_sec", n_cvs * n_offers / elapsed, "pairs/s",
+            cvs=n_cvs, offers=n_offers)
+
+    start = time.perf_counter()
+    matcher.compute_match_matrix(cvs, offers)
+    elapsed = time.perf_counter() - start
+    _record(results, "match", "compute_match_matrix", "pairs_per_sec", n_cvs * n_offers / elapsed, "pairs/s",
+            cvs=n_cvs, offers=n_offers)
+
+
+def _latencies(run, offers) -> np.ndarray:
+    samples = []
+    for offer in offers:
+        start = time.perf_counter()
+        run(offer)
+        samples.append((time.perf_counter() - start) * 1000)
+    return np.array(samples)
+
+
+def bench_ranking(gen: SyntheticGenerator, sizes: List[int], queries: int, top_k: int, results: List[Dict],
+                  shard_workers: List[int] = ()) -> None:
+    """Latence p50/p99 de recommend_candidates (liste de CVs, vivier colonne, vivier réparti)."""
+    recommender = RecommendationSystem(MatchingEngine())
+    offers = gen.offers(queries)
+    all_cvs = gen.cvs(max(sizes))
+    for size in sorted(sizes):
+        cvs = all_cvs[:size]
+        pool = CandidatePool.from_cvs(cvs)
+        for case, candidates in (("list", cvs), ("pool", pool)):
+            samples = _latencies(lambda offer: recommender.recommend_candidates(offer, candidates, top_k), offers)
+            for q in (50, 99):
+                _record(results, "recommend", f"{case}@{size}", f"p{q}_ms", np.percentile(samples, q), "ms",
+                        candidates=size, queries=queries, top_k=top_k)
+        for workers in shard_workers:
+            with ShardedRecommender.from_pool(recommender.matcher, pool, workers=workers) as sharded:
+                sharded.recommend_candidates(offers[0], top_k)  # démarrage des processus
+                samples = _latencies(lambda offer: sharded.recommend_candidates(offer, top_k), offers)
+            for q in (50, 99):
+                _record(results, "recommend", f"sharded{workers}@{size}", f"p{q}_ms", np.percentile(samples, q),
+                        "ms", candidates=size, queries=queries, top_k=top_k, workers=workers)
+
+
+def bench_lsh(gen: SyntheticGenerator, size: int, queries: int, top_k: int, bands: List[int],
+              num_perm: int, results: List[Dict]) -> None:
+    """Rappel@k, taille de liste restreinte et latence de la recherche LSH, par nombre de bandes."""
+    recommender = RecommendationSystem(MatchingEngine())
+    offers = gen.offers(queries)
+    cvs = gen.cvs(size)
+    pool = CandidatePool.from_cvs(cvs)
+    for band_count in bands:
+        index = MinHashLSHIndex(cvs, num_perm=num_perm, bands=band_count)
+        case = f"bands={band_count}@{size}"
+        params = dict(candidates=size, queries=queries, top_k=top_k, num_perm=num_perm, bands=band_count)
+        shortlist = np.mean([len(index.candidates_for(offer)) for offer in offers])
+        _record(results, "lsh", case, "shortlist_ratio", shortlist / size, "ratio", **params)
+        _record(results, "lsh", case, f"recall@{top_k}", measure_recall(recommender, offers, pool, index, top_k),
+                "ratio", **params)
+        samples = _latencies(lambda offer: recommender.recommend_candidates(offer, index, top_k), offers)
+        _record(results, "lsh", case, "p50_ms", np.percentile(samples, 50), "ms", **params)
+
+
+def bench_batch(gen: SyntheticGenerator, size: int, n_offers: int, top_k: int, chunk_sizes: List[int],
+                results: List[Dict]) -> None:
+    """Durée du classement de `n_offers` offres sur un vivier mmap : boucle par offre puis par blocs."""
+    recommender = RecommendationSystem(MatchingEngine())
+    offers = gen.offers(n_offers)
+    with tempfile.TemporaryDirectory() as tmp:
+        CandidatePool.from_cvs(gen.cvs(size)).save(tmp)
+        pool = CandidatePool.load(tmp, mmap=True)
+        params = dict(candidates=size, offers=n_offers, top_k=top_k)
+        start = time.perf_counter()
+        for offer in offers:
+            recommender.recommend_candidates(offer, pool, top_k)
+        _record(results, "batch", f"loop@{size}", "total_s", time.perf_counter() - start, "s", **params)
+        for chunk_size in chunk_sizes:
+            start = time.perf_counter()
+            recommender.recommend_for_offers(offers, pool, top_k, chunk_size=chunk_size)
+            _record(results, "batch", f"chunk={chunk_size}@{size}", "total_s", time.perf_counter() - start, "s",
+                    chunk_size=chunk_size, **params)
+
+
+def bench_snapshot(gen: SyntheticGenerator, size: int, results: List[Dict]) -> None:
+    """Durée d'écriture et de rechargement d'un instantané de `size` CVs, et taille sur disque."""
+    cvs = gen.cvs(size)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "pool.snap"
+        start = time.perf_counter()
+        save_snapshot(str(path), cvs)
+        _record(results, "snapshot", f"cv@{size}", "save_s", time.perf_counter() - start, "s", candidates=size)
+        _record(results, "snapshot", f"cv@{size}", "bytes_per_cv", path.stat().st_size / size, "B",
+                candidates=size)
+        start = time.perf_counter()
+        load_snapshot(str(path))
+        _record(results, "snapshot", f"cv@{size}", "load_s", time.perf_counter() - start, "s", candidates=size)
+
+
+# Modules dont le temps d'import à froid est suivi (du plus léger au plus complet)
+STARTUP_MODULES = ("src.services.matcher", "src.services.recommender", "src.services.analyzer", "src.api")
+
+
+def bench_startup(repeat: int, results: List[Dict]) -> None:
+    """Temps d'import à froid (nouvel interpréteur, au-delà du démarrage de Python) par module."""
+    def run(code: str) -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True)
+        return time.perf_counter() - start
+
+    baseline = np.median([run("pass") for _ in range(repeat)])
+    for module in STARTUP_MODULES:
+        samples = [run(f"import {module}") for _ in range(repeat)]
+        _record(results, "startup", module, "import_ms", (np.median(samples) - baseline) * 1000, "ms",
+                repeat=repeat)
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(current: Dict, previous_path: str) -> None:
+    """Affiche le ratio de chaque mesure par rapport à un fichier de résultats précédent."""
+    with open(previous_path, "r", encoding="utf-8") as f:
+        previous = json.load(f)
+    before = {(r["benchmark"], r["case"], r["metric"]): r["value"] for r in previous["results"]}
+    print(f"\nComparaison avec {previous_path} ({previous['meta'].get('git_revision')}):")
+    for r in current["results"]:
+        old = before.get((r["benchmark"], r["case"], r["metric"]))
+        if old:
+            print(f"  {r['benchmark']:<10} {r['case']:<22} {r['metric']:<16} x{r['value'] / old:.2f}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--parse-files", type=int, default=200, help="Fichiers générés par format")
+    parser.add_argument("--parse-workers", type=int, default=1, help="Processus de parsing (1 = séquentiel)")
+    parser.add_argument("--match-cvs", type=int, default=2000)
+    parser.add_argument("--match-offers", type=int, default=100)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=20, help="Offres classées par taille de vivier")
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--shard-workers", type=int, nargs="*", default=[],
+                        help="Nombres de processus pour le classement réparti (ex: 2 4 8)")
+    parser.add_argument("--lsh-size", type=int, default=100_000, help="Taille du vivier pour le benchmark LSH")
+    parser.add_argument("--lsh-bands", type=int, nargs="+", default=[8, 16, 32])
+    parser.add_argument("--lsh-perm", type=int, default=64, help="Longueur des signatures MinHash")
+    parser.add_argument("--batch-size", type=int, default=200_000, help="Taille du vivier du classement groupé")
+    parser.add_argument("--batch-offers", type=int, default=200, help="Offres classées en une lecture du vivier")
+    parser.add_argument("--batch-chunks", type=int, nargs="+", default=[4_096, 65_536],
+                        help="Tailles de bloc comparées")
+    parser.add_argument("--snapshot-size", type=int, default=100_000, help="CVs écrits dans l'instantané")
+    parser.add_argument("--startup-repeat", type=int, default=5, help="Interpréteurs lancés par module importé")
+    parser.add_argument("--skip", nargs="*", default=[],
+                        choices=["parse", "match", "recommend", "lsh", "batch", "snapshot", "startup"])
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="Fichier de résultats précédent à comparer")
+    args = parser.parse_args(argv)
+
+    gen = SyntheticGenerator(args.seed)
+    results: List[Dict] = []
+    if "parse" not in args.skip:
+        bench_parsing(gen, args.parse_files, args.parse_workers, results)
+    if "match" not in args.skip:
+        bench_matching(gen, args.match_cvs, args.match_offers, results)
+    if "recommend" not in args.skip:
+        bench_ranking(gen, args.sizes, args.queries, args.top_k, results, args.shard_workers)
+    if "lsh" not in args.skip:
+        bench_lsh(gen, args.lsh_size, args.queries, args.top_k, args.lsh_bands, args.lsh_perm, results)
+    if "batch" not in args.skip:
+        bench_batch(gen, args.batch_size, args.batch_offers, args.top_k, args.batch_chunks, results)
+    if "snapshot" not in args.skip:
+        bench_snapshot(gen, args.snapshot_size, results)
+    if "startup" not in args.skip:
+        bench_startup(args.startup_repeat, results)
+
+    report = {
+        "schema": SCHEMA_VERSION,
+        "meta": {
+            "git_revision": _git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nRésultats écrits dans {args.output}")
+    if args.compare:
+        compare(report, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+# ==========================================
+# Benchmarks: Deterministic Synthetic Data
+# ==========================================
+"""
+Générateur déterministe de données synthétiques pour les benchmarks.
+
+Une même graine produit toujours les mêmes textes de CV, fichiers (PDF, DOCX,
+TXT), objets CV et offres : les résultats sont comparables d'une version à
+l'autre.
+"""
+
+import random
+from pathlib import Path
+from typing import List
+
+from src.models import CV, JobOffer, LocationEnum
+
+SKILLS = [
+    "python", "java", "sql", "machine learning", "react", "aws", "excel", "docker", "kubernetes",
+    "go", "rust", "typescript", "javascript", "spark", "airflow", "pandas", "pytorch", "tensorflow",
+    "postgresql", "mongodb", "redis", "kafka", "terraform", "linux", "git", "django", "flask",
+    "fastapi", "scala", "tableau", "power bi", "azure", "gcp", "c++", "c#", "php", "vue", "angular",
+]
+
+FIRST_NAMES = ["Alice", "Bob", "Chloé", "David", "Emma", "Farid", "Gabriel", "Hélène", "Inès", "Julien"]
+LAST_NAMES = ["Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau"]
+CITIES = {LocationEnum.PARIS: "Basé à Paris.", LocationEnum.LYON: "Basé à Lyon.",
+          LocationEnum.REMOTE: "Je cherche du télétravail (remote)."}
+TITLES = ["Data Scientist", "Data Engineer", "Développeur Backend", "Développeur Frontend", "DevOps", "Data Analyst"]
+
+FILLER = (
+    "Participation à la conception, au développement et à la mise en production de services. "
+    "Travail en équipe agile, revues de code, documentation et accompagnement des utilisateurs. "
+)
+
+
+class SyntheticGenerator:
+    """
+    Produit des CVs et des offres pseudo-aléatoires mais reproductibles.
+
+    Attributs:
+        seed (int): Graine de génération.
+    """
+    def __init__(self, seed: int = 42):
+        self.seed = seed
+
+    def _rng(self, kind: str, index: int) -> random.Random:
+        # Un générateur par élément : la donnée i ne dépend pas du nombre d'éléments générés
+        return random.Random(f"{self.seed}:{kind}:{index}")
+
+    def cv_text(self, index: int, paragraphs: int = 3) -> str:
+        """Texte brut d'un CV (nom, compétences, expérience, localisation, remplissage)."""
+        rng = self._rng("cv_text", index)
+        name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+        skills = rng.sample(SKILLS, rng.randint(2, 8))
+        years = rng.randint(0, 15)
+        location = rng.choice(list(LocationEnum))
+        lines = [
+            name,
+            f"{rng.choice(TITLES)} avec {years} ans d'expérience.",
+            f"Compétences : {', '.join(skills)}.",
+            CITIES[location],
+        ]
+        lines.extend(FILLER for _ in range(paragraphs))
+        return "\n".join(lines)
+
+    def cv(self, index: int) -> CV:
+        """Objet CV déjà structuré."""
+        rng = self._rng("cv", index)
+        return CV(
+            id=f"CAND_{index:07d}",
+            name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            skills=rng.sample(SKILLS, rng.randint(1, 8)),
+            years_experience=float(rng.randint(0, 15)),
+            location=rng.choice(list(LocationEnum)),
+            availability_immediate=rng.random() < 0.6
+        )
+
+    def cvs(self, count: int) -> List[CV]:
+        return [self.cv(i) for i in range(count)]
+
+    def offer(self, index: int) -> JobOffer:
+        """Offre d'emploi."""
+        rng = self._rng("offer", index)
+        return JobOffer(
+            id=f"JOB_{index:06d}",
+            title=rng.choice(TITLES),
+            required_skills=rng.sample(SKILLS, rng.randint(1, 5)),
+            min_years_experience=float(rng.randint(0, 8)),
+            location=rng.choice(list(LocationEnum)),
+            remote_allowed=rng.random() < 0.5
+        )
+
+    def offers(self, count: int) -> List[JobOffer]:
+        return [self.offer(i) for i in range(count)]
+
+    def write_txt(self, path: Path, index: int) -> None:
+        path.write_text(self.cv_text(index), encoding="utf-8")
+
+    def write_docx(self, path: Path, index: int) -> None:
+        from docx import Document
+
+        document = Document()
+        for line in self.cv_text(index).split("\n"):
+            document.add_paragraph(line)
+        document.save(str(path))
+
+    def write_pdf(self, path: Path, index: int) -> None:
+        # Une ligne du CV par page : suffisant pour mesurer le coût d'extraction par page
+        write_pdf(path, self.cv_text(index).split("\n"))
+
+
+def _pdf_escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def write_pdf(path: Path, pages: List[str]) -> None:
+    """Écrit un PDF minimal (une ligne Helvetica par page, WinAnsi), sans dépendance externe."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 11 Tf 72 720 Td ({_pdf_escape(text)}) Tj ET"
+        length = len(stream.encode("cp1252", errors="replace"))
+        objects.append(f"<< /Length {length} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("cp1252", errors="replace")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(out)
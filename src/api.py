@@ -0,0 +1,300 @@
+# ==========================================
+# 6. HTTP Service (ASGI - FastAPI)
+# ==========================================
+"""
+Service HTTP asynchrone exposant le parsing, le matching et la recommandation.
+
+Les services (analyseur, moteur de matching, vivier de candidats) sont créés une
+seule fois au démarrage. Le parsing des CVs (fichiers et texte), coûteux en CPU,
+est délégué à un pool de processus : la boucle d'événements n'est jamais bloquée
+et tous les cœurs servent au parsing. Le nombre de parsings en cours et la taille
+des fichiers reçus sont bornés : un afflux d'uploads attend son tour au lieu
+d'épuiser la mémoire.
+
+Le vivier de candidats (CandidateIndex) est conservé en mémoire dans le
+processus du serveur : le service se déploie avec un seul worker uvicorn.
+Plusieurs workers auraient chacun leur propre vivier, qui divergeraient au fil
+des ajouts et suppressions.
+
+Usage:
+    uvicorn --factory src.api:create_app
+"""
+
+import asyncio
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import List, Optional
+
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.responses import PlainTextResponse
+from pydantic import BaseModel, Field
+
+from src.models import CV, HardConstraints, JobOffer, LocationEnum
+from src.services.analyzer import CVAnalyzer, CVParsingError, SUPPORTED_EXTENSIONS
+from src.services.index import CandidateIndex
+from src.services.matcher import MatchingEngine, MatchResult
+from src.services.recommender import RecommendationSystem
+from src.utils.metrics import get_registry
+
+# Analyseur propre à chaque processus du pool de parsing
+_PARSER: Optional[CVAnalyzer] = None
+
+
+def _init_parser(analyzer: CVAnalyzer) -> None:
+    global _PARSER
+    _PARSER = analyzer
+
+
+def _parse_text(text: str, candidate_id: str) -> CV:
+    """Parse un CV texte (exécuté dans un processus du pool)."""
+    return _PARSER.parse_from_text(text, candidate_id)
+
+
+def _parse_upload(filename: str, content: bytes, candidate_id: str) -> CV:
+    """Parse un fichier reçu en mémoire (exécuté dans un processus du pool)."""
+    suffix = os.path.splitext(filename)[1].lower()
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return _PARSER._parse_file_strict(path, candidate_id)
+    finally:
+        os.unlink(path)
+
+
+# ==========================================
+# Schémas d'entrée / sortie
+# ==========================================
+
+class CVPayload(BaseModel):
+    id: str
+    name: str
+    skills: List[str] = []
+    years_experience: float = Field(ge=0)
+    location: LocationEnum
+    availability_immediate: bool = True
+
+    @classmethod
+    def from_cv(cls, cv: CV) -> "CVPayload":
+        return cls(id=cv.id, name=cv.name, skills=cv.skills, years_experience=cv.years_experience,
+                   location=cv.location, availability_immediate=cv.availability_immediate)
+
+    def to_cv(self) -> CV:
+        return CV(id=self.id, name=self.name, skills=self.skills, years_experience=self.years_experience,
+                  location=self.location, availability_immediate=self.availability_immediate)
+
+
+class OfferPayload(BaseModel):
+    id: str
+    title: str
+    required_skills: List[str] = []
+    min_years_experience: float = Field(ge=0)
+    location: LocationEnum
+    remote_allowed: bool = False
+    hard_constraints: Optional[HardConstraints] = None
+
+    def to_offer(self) -> JobOffer:
+        return JobOffer(id=self.id, title=self.title, required_skills=self.required_skills,
+                        min_years_experience=self.min_years_experience, location=self.location,
+                        remote_allowed=self.remote_allowed, hard_constraints=self.hard_constraints)
+
+
+class TextCVRequest(BaseModel):
+    candidate_id: str
+    text: str
+
+
+class MatchRequest(BaseModel):
+    cv: CVPayload
+    offer: OfferPayload
+
+
+class ScoreBreakdown(BaseModel):
+    """Décomposition du score (voir services.matcher.MatchResult)."""
+    skills: float
+    experience: float
+    location: float
+    missing_skills: List[str] = []
+    experience_gap: float = 0.0
+    location_compatible: bool = True
+
+    @classmethod
+    def from_match(cls, match: MatchResult) -> "ScoreBreakdown":
+        return cls(**match.subscores, missing_skills=list(match.missing_skills),
+                   experience_gap=match.experience_gap, location_compatible=match.location_compatible)
+
+
+class MatchResponse(BaseModel):
+    score: float
+    explanation: str
+    breakdown: ScoreBreakdown
+
+
+class RecommendRequest(BaseModel):
+    offer: OfferPayload
+    top_k: int = Field(default=5, ge=1, le=1000)
+
+
+class Recommendation(BaseModel):
+    cv_id: str
+    cv_name: str
+    score: float
+    explanation: str
+    breakdown: ScoreBreakdown
+
+
+# ==========================================
+# Application
+# ==========================================
+
+async def _read_body(request: Request, max_bytes: int) -> bytes:
+    """Lit le corps d'une requête ; HTTP 413 dès que `max_bytes` octets sont dépassés."""
+    too_large = HTTPException(status_code=413, detail=f"Fichier trop volumineux (maximum {max_bytes} octets)")
+    declared = request.headers.get("content-length")
+    if declared is not None and declared.isdigit() and int(declared) > max_bytes:
+        raise too_large
+    # La taille annoncée n'engage pas le client : la limite est aussi vérifiée pendant la lecture
+    body = bytearray()
+    async for chunk in request.stream():
+        body += chunk
+        if len(body) > max_bytes:
+            raise too_large
+    return bytes(body)
+
+
+def create_app(
+    analyzer: Optional[CVAnalyzer] = None,
+    matcher: Optional[MatchingEngine] = None,
+    candidates: Optional[CandidateIndex] = None,
+    parse_workers: Optional[int] = None,
+    max_upload_bytes: int = 10 * 1024 * 1024,
+    max_pending_parses: Optional[int] = None,
+) -> FastAPI:
+    """
+    Construit l'application ASGI et ses services (créés une seule fois par worker).
+
+    Fabrique à passer à uvicorn (`uvicorn --factory src.api:create_app`) : importer
+    le module ne démarre aucun service.
+
+    Args:
+        analyzer (CVAnalyzer, optional): Analyseur de CVs (défaut : taxonomie par défaut).
+        matcher (MatchingEngine, optional): Moteur de matching (défaut : poids par défaut).
+        candidates (CandidateIndex, optional): Vivier de candidats initial.
+        parse_workers (int, optional): Taille du pool de processus de parsing (défaut :
+                                       nombre de cœurs). 0 pour parser dans un thread
+                                       du processus courant (tests, petits volumes).
+        max_upload_bytes (int, optional): Taille maximale d'un fichier envoyé (HTTP 413 au-delà).
+        max_pending_parses (int, optional): Parsings en cours au plus, corps de requête compris
+                                            (défaut : deux par processus de parsing). Les
+                                            requêtes suivantes attendent qu'une place se libère.
+
+    Returns:
+        FastAPI: L'application.
+    """
+    if max_upload_bytes <= 0:
+        raise ValueError("max_upload_bytes must be > 0")
+    if max_pending_parses is None:
+        max_pending_parses = 2 * (parse_workers or os.cpu_count() or 1)
+    if max_pending_parses <= 0:
+        raise ValueError("max_pending_parses must be > 0")
+    analyzer = analyzer or CVAnalyzer()
+    matcher = matcher or MatchingEngine()
+    recommender = RecommendationSystem(matcher)
+    candidates = candidates if candidates is not None else CandidateIndex()
+    # L'index est modifié par les uploads et lu par les classements (threads différents)
+    candidates_lock = threading.Lock()
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        executor: Optional[Executor] = None
+        if parse_workers != 0:
+            executor = ProcessPoolExecutor(max_workers=parse_workers, initializer=_init_parser,
+                                           initargs=(analyzer,))
+        else:
+            _init_parser(analyzer)
+        app.state.parse_executor = executor
+        # Créé dans la boucle d'événements du serveur
+        app.state.parse_slots = asyncio.Semaphore(max_pending_parses)
+        try:
+            yield
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    app = FastAPI(title="AI Recruitment Platform", lifespan=lifespan)
+    app.state.analyzer = analyzer
+    app.state.matcher = matcher
+    app.state.candidates = candidates
+
+    def register(cv: CV) -> CVPayload:
+        with candidates_lock:
+            candidates.update(cv)
+        return CVPayload.from_cv(cv)
+
+    @app.get("/health")
+    def health() -> dict:
+        return {"status": "ok", "candidates": len(candidates)}
+
+    @app.get("/metrics", response_class=PlainTextResponse)
+    def metrics() -> str:
+        """Métriques du worker au format texte Prometheus."""
+        return get_registry().export_prometheus()
+
+    @app.post("/cvs/upload", response_model=CVPayload)
+    async def upload_cv(
+        request: Request,
+        candidate_id: str = Query(...),
+        filename: str = Query(..., description="Nom du fichier (l'extension détermine le format)"),
+    ) -> CVPayload:
+        """Parse un CV envoyé en corps brut (PDF, DOCX ou TXT) et l'ajoute au vivier."""
+        if os.path.splitext(filename)[1].lower() not in SUPPORTED_EXTENSIONS:
+            raise HTTPException(status_code=415, detail=f"Format de fichier non supporté : {filename}")
+        loop = asyncio.get_running_loop()
+        # La place est prise avant la lecture du corps : la mémoire des fichiers en attente est bornée
+        async with app.state.parse_slots:
+            content = await _read_body(request, max_upload_bytes)
+            try:
+                cv = await loop.run_in_executor(app.state.parse_executor, _parse_upload, filename, content,
+                                                candidate_id)
+            except CVParsingError as e:
+                raise HTTPException(status_code=422, detail=str(e))
+        return register(cv)
+
+    @app.post("/cvs/text", response_model=CVPayload)
+    async def parse_text(payload: TextCVRequest) -> CVPayload:
+        """Extrait un CV depuis du texte brut (dans le pool de parsing) et l'ajoute au vivier."""
+        loop = asyncio.get_running_loop()
+        async with app.state.parse_slots:
+            cv = await loop.run_in_executor(app.state.parse_executor, _parse_text, payload.text,
+                                            payload.candidate_id)
+        return register(cv)
+
+    @app.delete("/cvs/{cv_id}", status_code=204)
+    def delete_cv(cv_id: str) -> None:
+        with candidates_lock:
+            if cv_id not in candidates:
+                raise HTTPException(status_code=404, detail=f"Candidat inconnu : {cv_id}")
+            candidates.remove(cv_id)
+
+    @app.post("/match", response_model=MatchResponse)
+    def match(payload: MatchRequest) -> MatchResponse:
+        """Calcule le score de compatibilité d'une paire (CV, offre)."""
+        match = matcher.evaluate(payload.cv.to_cv(), payload.offer.to_offer())
+        return MatchResponse(score=match.score, explanation=match.explanation,
+                             breakdown=ScoreBreakdown.from_match(match))
+
+    @app.post("/recommendations", response_model=List[Recommendation])
+    def recommend(payload: RecommendRequest) -> List[Recommendation]:
+        """Classe les candidats du vivier pour une offre."""
+        offer = payload.offer.to_offer()
+        with candidates_lock:
+            shortlist = candidates.candidates_for(offer, similarity=matcher.similarity)
+        results = recommender.recommend_candidates(offer, shortlist, top_k=payload.top_k)
+        return [Recommendation(cv_id=r["cv_id"], cv_name=r["cv_name"], score=r["score"],
+                               explanation=r["explanation"], breakdown=ScoreBreakdown.from_match(r["match"]))
+                for r in results]
+
+    return app
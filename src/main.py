@@ -149,11 +149,11 @@ def main():
     print(f"Expected: ~90-100 (perfect skills, experience OK, location match)")
     
     try:
-        score = matcher.compute_match(test_candidate, job_data_scientist)
-        explanation = matcher.explain_score(test_candidate, job_data_scientist, score)
+        match = matcher.evaluate(test_candidate, job_data_scientist)
         
-        print(f"\n✓ Score Obtained: {score}/100")
-        print(f"✓ Explanation: {explanation}")
+        print(f"\n✓ Score Obtained: {match.score}/100")
+        print(f"✓ Sub-scores: {match.subscores}")
+        print(f"✓ Explanation: {match.explanation}")
         
     except Exception as e:
         logger.error(f"Matching failed: {e}")
@@ -2,14 +2,19 @@
 # 1. Data Structures (Mock Data)
 # ==========================================
 
+import sys
+import threading
 from dataclasses import dataclass
-from typing import List
+from typing import TYPE_CHECKING, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from enum import Enum
 
+if TYPE_CHECKING:
+    from src.services.normalizer import SkillNormalizer
+
 class LocationEnum(Enum):
     """
     Énumération des localisations possibles pour les candidats et les offres.
-    
+
     Attributs:
         PARIS (str): Localisation Paris.
         LYON (str): Localisation Lyon.
@@ -19,11 +24,100 @@ class LocationEnum(Enum):
     LYON = "Lyon"
     REMOTE = "Remote"
 
-@dataclass
+
+# Codes entiers compacts des localisations (stockage et calculs vectorisés)
+LOCATIONS: Tuple[LocationEnum, ...] = tuple(LocationEnum)
+LOCATION_CODES: Dict[LocationEnum, int] = {loc: code for code, loc in enumerate(LOCATIONS)}
+
+
+class SkillVocabulary:
+    """
+    Vocabulaire partagé des compétences : chaque libellé normalisé reçoit un identifiant entier.
+
+    Les CVs et offres ne stockent que ces identifiants ; les libellés ne sont
+    conservés qu'une seule fois, ici. Les identifiants sont propres au processus
+    (ils ne sont jamais sérialisés).
+    """
+    __slots__ = ("_ids", "_names", "_lock")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[str] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, skill: str) -> bool:
+        return skill in self._ids
+
+    def get(self, skill: str) -> Optional[int]:
+        """Renvoie l'identifiant d'une compétence normalisée, sans l'ajouter."""
+        return self._ids.get(skill)
+
+    def intern(self, skill: str) -> int:
+        """Renvoie l'identifiant d'une compétence normalisée, en l'ajoutant si nécessaire."""
+        skill_id = self._ids.get(skill)
+        if skill_id is None:
+            with self._lock:
+                skill_id = self._ids.get(skill)
+                if skill_id is None:
+                    skill_id = len(self._names)
+                    self._names.append(sys.intern(skill))
+                    self._ids[skill] = skill_id
+        return skill_id
+
+    def intern_all(self, skills: Iterable[str]) -> Tuple[int, ...]:
+        """Normalise et interne une liste de compétences (sans doublons, ordre conservé)."""
+        ids = dict.fromkeys(self.intern(s.lower().strip()) for s in skills)
+        return tuple(ids)
+
+    def name(self, skill_id: int) -> str:
+        return self._names[skill_id]
+
+    def names(self, skill_ids: Iterable[int]) -> List[str]:
+        names = self._names
+        return [names[i] for i in skill_ids]
+
+
+# Vocabulaire unique partagé par tous les CVs et offres du processus
+SKILL_VOCABULARY = SkillVocabulary()
+
+
+# Normaliseur appliqué aux compétences des CVs et offres (voir services.normalizer)
+_SKILL_NORMALIZER: Optional["SkillNormalizer"] = None
+
+
+def get_skill_normalizer() -> Optional["SkillNormalizer"]:
+    """Renvoie le normaliseur de compétences courant (None : minuscule et espaces retirés seulement)."""
+    return _SKILL_NORMALIZER
+
+
+def set_skill_normalizer(normalizer: Optional["SkillNormalizer"]) -> Optional["SkillNormalizer"]:
+    """
+    Installe le normaliseur utilisé par CV et JobOffer (None pour le désactiver). Renvoie l'ancien.
+
+    Les objets déjà construits ne sont pas renormalisés.
+    """
+    global _SKILL_NORMALIZER
+    previous, _SKILL_NORMALIZER = _SKILL_NORMALIZER, normalizer
+    return previous
+
+
+def _intern_skills(skills: Iterable[str]) -> Tuple[int, ...]:
+    if _SKILL_NORMALIZER is not None:
+        skills = _SKILL_NORMALIZER.normalize_all(skills)
+    return SKILL_VOCABULARY.intern_all(skills)
+
+
 class CV:
     """
     Modèle de données représentant le profil d'un candidat.
 
+    Représentation compacte (__slots__) : les compétences sont stockées sous forme
+    d'identifiants du vocabulaire partagé et la localisation sous forme d'un petit
+    entier ; les attributs publics restent inchangés.
+
     Attributs:
         id (str): Identifiant unique du candidat dans le système.
         name (str): Nom complet du candidat.
@@ -32,14 +126,10 @@ class CV:
         location (LocationEnum): Localisation géographique principale du candidat.
         availability_immediate (bool): Indique si le candidat est disponible immédiatement.
         raw_text (str): Texte brut extrait du CV original (utile pour re-traitement).
+        skill_ids (Tuple[int, ...]): Identifiants des compétences dans SKILL_VOCABULARY.
     """
-    id: str
-    name: str
-    skills: List[str]
-    years_experience: float
-    location: LocationEnum
-    availability_immediate: bool
-    raw_text: str = "" # Pour simuler le texte du CV
+    __slots__ = ("id", "name", "_skill_ids", "years_experience", "_location_code",
+                 "availability_immediate", "raw_text")
 
     def __init__(
         self,
@@ -57,19 +147,93 @@ class CV:
         self.id = id
         self.name = name
 
-        # ✅ NORMALISATION ICI
-        self.skills = [s.lower().strip() for s in skills]
+        # ✅ NORMALISATION ICI (via le setter : minuscule, variantes ramenées à la
+        # taxonomie si un normaliseur est installé, sans doublons, internées)
+        self.skills = skills
 
         self.years_experience = years_experience
         self.location = location
         self.availability_immediate = availability_immediate
         self.raw_text = raw_text
 
-@dataclass
+    @property
+    def skills(self) -> List[str]:
+        return SKILL_VOCABULARY.names(self._skill_ids)
+
+    @skills.setter
+    def skills(self, skills: Iterable[str]) -> None:
+        self._skill_ids = _intern_skills(skills)
+
+    @property
+    def skill_ids(self) -> Tuple[int, ...]:
+        return self._skill_ids
+
+    @property
+    def location(self) -> LocationEnum:
+        return LOCATIONS[self._location_code]
+
+    @location.setter
+    def location(self, location: LocationEnum) -> None:
+        self._location_code = LOCATION_CODES[location]
+
+    @property
+    def location_code(self) -> int:
+        return self._location_code
+
+    def _fields(self) -> tuple:
+        return (self.id, self.name, self.skills, self.years_experience, self.location,
+                self.availability_immediate, self.raw_text)
+
+    def __reduce__(self):
+        # Les identifiants de compétences sont propres au processus : on sérialise les libellés
+        return (CV, self._fields())
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"CV(id={self.id!r}, name={self.name!r}, skills={self.skills!r}, "
+                f"years_experience={self.years_experience!r}, location={self.location!r}, "
+                f"availability_immediate={self.availability_immediate!r})")
+
+
+@dataclass(frozen=True)
+class HardConstraints:
+    """
+    Critères éliminatoires d'une offre.
+
+    Un candidat qui ne satisfait pas l'un d'eux n'est pas noté du tout (au lieu
+    d'être simplement pénalisé par le score) ; voir services.planner.
+
+    Attributs:
+        location_compatible (bool): Écarter les candidats d'une autre ville (un candidat
+                                    Remote est admis si l'offre autorise le télétravail).
+        min_years_experience (float, optional): Plancher strict d'années d'expérience.
+        availability_immediate (bool): Écarter les candidats non disponibles immédiatement.
+    """
+    location_compatible: bool = False
+    min_years_experience: Optional[float] = None
+    availability_immediate: bool = False
+
+    def __post_init__(self):
+        if self.min_years_experience is not None and self.min_years_experience < 0:
+            raise ValueError("min_years_experience must be >= 0")
+
+    def __bool__(self) -> bool:
+        return self.location_compatible or self.min_years_experience is not None or self.availability_immediate
+
+
 class JobOffer:
     """
     Modèle de données représentant une offre de mission/emploi.
 
+    Représentation compacte (__slots__), comme CV : compétences internées et
+    localisation codée sur un petit entier.
+
     Attributs:
         id (str): Identifiant unique de l'offre.
         title (str): Intitulé du poste (ex: Data Scientist).
@@ -77,13 +241,11 @@ class JobOffer:
         min_years_experience (float): Nombre d'années d'expérience minimum requises.
         location (LocationEnum): Localisation du poste.
         remote_allowed (bool): Indique si le télétravail est autorisé pour ce poste.
+        hard_constraints (HardConstraints, optional): Critères éliminatoires, appliqués avant le scoring.
+        required_skill_ids (FrozenSet[int]): Identifiants des compétences requises.
     """
-    id: str
-    title: str
-    required_skills: List[str]
-    min_years_experience: float
-    location: LocationEnum
-    remote_allowed: bool
+    __slots__ = ("id", "title", "_skill_ids", "_skill_set", "min_years_experience",
+                 "_location_code", "remote_allowed", "hard_constraints")
 
     def __init__(
         self,
@@ -92,7 +254,8 @@ class JobOffer:
         required_skills: list[str],
         min_years_experience: float,
         location: LocationEnum,
-        remote_allowed: bool
+        remote_allowed: bool,
+        hard_constraints: Optional[HardConstraints] = None
     ):
         if min_years_experience < 0:
             raise ValueError("min_years_experience must be >= 0")
@@ -100,20 +263,57 @@ class JobOffer:
         self.id = id
         self.title = title
 
-        # ✅ NORMALISATION ICI
-        self.required_skills = [s.lower().strip() for s in required_skills]
+        # ✅ NORMALISATION ICI (via le setter, comme pour CV)
+        self.required_skills = required_skills
 
         self.min_years_experience = min_years_experience
         self.location = location
         self.remote_allowed = remote_allowed
+        self.hard_constraints = hard_constraints
 
-    def __post_init__(self):
-        """
-        Méthode appelée automatiquement après la création de l'objet.
-        Normalise les compétences en minuscule et supprime les doublons.
-        """
-        if self.skills:
-            # On convertit tout en minuscule et on supprime les doublons (set)
-            self.skills = list(set(s.lower() for s in self.skills))
-        else:
-            self.skills = []
\ No newline at end of file
+    @property
+    def required_skills(self) -> List[str]:
+        return SKILL_VOCABULARY.names(self._skill_ids)
+
+    @required_skills.setter
+    def required_skills(self, skills: Iterable[str]) -> None:
+        self._skill_ids = _intern_skills(skills)
+        # Les offres sont peu nombreuses : on garde l'ensemble prêt pour les intersections
+        self._skill_set = frozenset(self._skill_ids)
+
+    @property
+    def required_skill_ids(self) -> FrozenSet[int]:
+        return self._skill_set
+
+    @property
+    def location(self) -> LocationEnum:
+        return LOCATIONS[self._location_code]
+
+    @location.setter
+    def location(self, location: LocationEnum) -> None:
+        self._location_code = LOCATION_CODES[location]
+
+    @property
+    def location_code(self) -> int:
+        return self._location_code
+
+    def _fields(self) -> tuple:
+        return (self.id, self.title, self.required_skills, self.min_years_experience,
+                self.location, self.remote_allowed, self.hard_constraints)
+
+    def __reduce__(self):
+        return (JobOffer, self._fields())
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._fields() == other._fields()
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return (f"JobOffer(id={self.id!r}, title={self.title!r}, "
+                f"required_skills={self.required_skills!r}, "
+                f"min_years_experience={self.min_years_experience!r}, "
+                f"location={self.location!r}, remote_allowed={self.remote_allowed!r}"
+                + (f", hard_constraints={self.hard_constraints!r})" if self.hard_constraints else ")"))
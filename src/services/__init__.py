@@ -0,0 +1,13 @@
+"""
+Services métier.
+
+Le paquet n'importe aucun module à son chargement : chaque processus ne paie
+que ce qu'il utilise. Un processus de calcul des scores importe directement
+
+    from src.services.matcher import MatchingEngine
+    from src.services.recommender import RecommendationSystem
+
+sans charger les lecteurs de fichiers (pdfplumber, python-docx), RapidFuzz,
+SciPy ni scikit-learn ; seul NumPy est requis. Dans analyzer, pdfplumber et
+python-docx ne sont importés qu'à la lecture du premier fichier PDF ou DOCX.
+"""
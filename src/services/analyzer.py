@@ -4,15 +4,219 @@
 
 import re
 import os
-from src.models import LocationEnum, CV
-from typing import List
-
-# Imports des librairies (gestion d'erreur si non installées)
-try:
-    import pdfplumber
-    from docx import Document
-except ImportError:
-    raise ImportError("Les librairies 'pdfplumber' et 'python-docx' sont requises.")
+import time
+import hashlib
+import importlib
+import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from src.models import LocationEnum, CV, get_skill_normalizer
+from src.services.cache import ParseCache
+from src.services.normalizer import SkillNormalizer
+from src.utils.skill_index import SkillPhraseIndex, is_word_char, tokenize
+from src.utils.metrics import get_registry
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Version de la logique d'extraction : à incrémenter quand elle change (invalide le cache)
+ANALYZER_VERSION = "4"
+
+# Extensions prises en charge par parse_from_file
+SUPPORTED_EXTENSIONS = (".pdf", ".docx", ".txt")
+
+# Taxonomie par défaut (Mock) utilisée quand aucune taxonomie n'est fournie
+DEFAULT_TAXONOMY = ["python", "java", "sql", "machine learning", "react", "aws", "excel"]
+
+
+def _import_backend(module: str, package: str):
+    """
+    Importe une librairie de lecture de fichiers au premier usage.
+
+    pdfplumber et python-docx ne sont chargés que lorsqu'un fichier du format
+    correspondant est lu : les processus qui n'ouvrent aucun fichier (calcul des
+    scores, API de matching) n'en paient pas le coût d'import.
+
+    Raises:
+        ImportError: Si la librairie n'est pas installée.
+    """
+    try:
+        return importlib.import_module(module)
+    except ImportError as e:
+        raise ImportError(f"La librairie '{package}' est requise pour lire ce format.") from e
+
+
+@lru_cache(maxsize=32)
+def _compile_taxonomy(skills: Tuple[str, ...]) -> SkillPhraseIndex:
+    """Compile (et garde en cache) l'index de compétences associé à une taxonomie."""
+    return SkillPhraseIndex(skills)
+
+
+# Motifs précompilés des extracteurs de champs (appliqués au texte en minuscule)
+_YEARS_PATTERN = re.compile(r"(\d+)\s*(ans|years|\+)", re.IGNORECASE)
+_IMMEDIATE_PATTERN = re.compile(
+    r"disponib\w*\s+imm[ée]diat|imm[ée]diatement\s+disponible|available\s+immediately|immediately\s+available")
+_NOTICE_PATTERN = re.compile(
+    r"pr[ée]avis|notice\s+period|disponible\s+(?:à\s+partir|dans|en|au|le)\b|available\s+(?:from|in)\b")
+# Nom : 2 à 4 mots commençant par une majuscule, seuls sur la première ligne non vide
+_NAME_PATTERN = re.compile(r"[A-ZÀ-Ý][A-Za-zÀ-ÿ'\-]+(?:\s+[A-ZÀ-Ý][A-Za-zÀ-ÿ'\-]+){1,3}")
+_NOT_NAME_WORDS = frozenset((
+    "cv", "curriculum", "vitae", "profil", "data", "développeur", "developpeur", "developer", "engineer",
+    "ingénieur", "scientist", "analyst", "consultant", "chef", "manager", "lead", "senior", "junior",
+))
+DEFAULT_NAME = "Candidat Extrait"
+# Mots signalant une mention de disponibilité (évite d'appliquer les motifs aux autres segments)
+_AVAILABILITY_WORDS = frozenset((
+    "disponible", "disponibilité", "immédiatement", "préavis", "preavis", "notice", "available", "immediately",
+))
+
+# Mots-clés de localisation recherchés parmi les mots du texte (en minuscule)
+_LOCATION_KEYWORDS = frozenset(("paris", "lyon", "remote", "télétravail"))
+
+
+def _location_from_keywords(found: set) -> LocationEnum:
+    """Choisit la localisation selon les mots-clés trouvés (Paris > Lyon > Remote)."""
+    if "paris" in found:
+        return LocationEnum.PARIS
+    if "lyon" in found:
+        return LocationEnum.LYON
+    if "remote" in found or "télétravail" in found:
+        return LocationEnum.REMOTE
+        
+    # Valeur par défaut si rien n'est trouvé
+    return LocationEnum.PARIS
+
+
+def _extract_name(line: str) -> Optional[str]:
+    """Renvoie la ligne si elle ressemble à un nom de personne ("Alice Martin", "Jean DUPONT")."""
+    if not _NAME_PATTERN.fullmatch(line):
+        return None
+    if any(word.lower() in _NOT_NAME_WORDS for word in line.split()):
+        return None
+    return " ".join(line.split())
+
+
+class _FieldExtractor:
+    """
+    Extraction de tous les champs d'un CV en une seule passe sur ses segments.
+
+    Chaque segment est mis en minuscule et découpé en mots une seule fois ; les
+    extracteurs (compétences, expérience, localisation, disponibilité, nom)
+    consomment ce texte et ce flux de mots partagés.
+    """
+    __slots__ = ("_skill_index", "_fuzzy", "skills", "tokens", "years", "locations", "name",
+                 "_name_checked", "_immediate", "_notice")
+
+    def __init__(self, skill_index: SkillPhraseIndex, fuzzy: bool):
+        self._skill_index = skill_index
+        self._fuzzy = fuzzy
+        self.skills = {}
+        self.tokens = {}  # Mots et paires de mots soumis au normaliseur
+        self.years: Optional[float] = None
+        self.locations = set()
+        self.name: Optional[str] = None
+        self._name_checked = False
+        self._immediate = False
+        self._notice = False
+
+    def feed(self, segment: str) -> None:
+        lower = segment.lower()
+        tokens = tokenize(lower)
+
+        for skill in self._skill_index.match_tokens(tokens):
+            self.skills.setdefault(skill, None)
+        if self._fuzzy:
+            words = [token for token in tokens if is_word_char(token[0])]
+            self.tokens.update(dict.fromkeys(words))
+            self.tokens.update(dict.fromkeys(f"{a} {b}" for a, b in zip(words, words[1:])))
+        if self.years is None:
+            match = _YEARS_PATTERN.search(lower)
+            if match:
+                self.years = float(match.group(1))
+        self.locations.update(_LOCATION_KEYWORDS.intersection(tokens))
+        if not self._immediate and not _AVAILABILITY_WORDS.isdisjoint(tokens):
+            if _IMMEDIATE_PATTERN.search(lower):
+                self._immediate = True
+            elif _NOTICE_PATTERN.search(lower):
+                self._notice = True
+        if not self._name_checked and tokens:
+            # Le nom n'est cherché que sur la première ligne non vide du document
+            first_line = next(line for line in segment.splitlines() if line.strip())
+            self.name = _extract_name(first_line.strip())
+            self._name_checked = True
+
+    @property
+    def availability_immediate(self) -> bool:
+        # Disponible par défaut, sauf mention d'un préavis sans mention contraire
+        return self._immediate or not self._notice
+
+
+def _file_format(file_path: str) -> str:
+    return os.path.splitext(file_path)[1].lower().lstrip(".") or "unknown"
+
+
+def _count_file(file_path: str, ok: bool) -> None:
+    """Compte un fichier parsé (ou en échec) dans le registre de métriques, par format."""
+    if ok:
+        get_registry().counter("cv_files_parsed_total", "CVs parsés avec succès").inc(format=_file_format(file_path))
+    else:
+        get_registry().counter("cv_files_failed_total", "CVs en échec de parsing").inc(format=_file_format(file_path))
+
+
+class CVParsingError(Exception):
+    """Erreur de lecture ou d'extraction d'un fichier CV."""
+
+
+@dataclass
+class ParseFailure:
+    """
+    Échec de parsing d'un fichier lors d'un traitement en lot.
+
+    Attributs:
+        path (str): Chemin du fichier en échec.
+        error (str): Description de l'erreur.
+    """
+    path: str
+    error: str
+
+
+# Analyseur propre à chaque processus du pool (initialisé une seule fois par worker)
+_WORKER_ANALYZER: Optional["CVAnalyzer"] = None
+
+
+def _init_worker(analyzer: "CVAnalyzer") -> None:
+    global _WORKER_ANALYZER
+    _WORKER_ANALYZER = analyzer
+
+
+def _parse_chunk(chunk: Sequence[Tuple[int, str, str]]) -> List[Tuple[int, str, Optional[CV], Optional[str]]]:
+    """Tâche exécutée par un worker du pool avec son analyseur local."""
+    return _parse_chunk_with(_WORKER_ANALYZER, chunk)
+
+
+def _parse_chunk_with(
+    analyzer: "CVAnalyzer", chunk: Sequence[Tuple[int, str, str]]
+) -> List[Tuple[int, str, Optional[CV], Optional[str]]]:
+    """Parse un lot de fichiers ; les erreurs sont renvoyées, pas levées."""
+    results = []
+    for position, path, candidate_id in chunk:
+        try:
+            cv = analyzer._parse_file_strict(path, candidate_id)
+            results.append((position, path, cv, None))
+        except Exception as e:
+            results.append((position, path, None, str(e)))
+    return results
+
+
+def _record_segments(segments: Iterable[str], parts: List[str]) -> Iterator[str]:
+    """Transmet les segments d'un flux en les conservant dans `parts`."""
+    for segment in segments:
+        parts.append(segment)
+        yield segment
+
+
 class CVAnalyzer:
     """
     Service responsable de l'extraction et de la structuration des données de CVs.
@@ -23,32 +227,89 @@ class CVAnalyzer:
 
     Attributs:
         taxonomy (List[str]): Liste de référence des compétences à extraire (en minuscule).
+                              L'index de recherche est recompilé à chaque affectation.
+        cache (ParseCache, optional): Cache disque des fichiers déjà parsés.
+        max_pages (int, optional): Nombre maximal de pages PDF lues par document.
+        max_chars (int, optional): Nombre maximal de caractères extraits par document.
+        keep_raw_text (bool): Conserver le texte brut dans CV.raw_text (False pour
+                              réduire l'empreinte mémoire d'un grand vivier).
+        normalizer (SkillNormalizer, optional): Rattache aussi les variantes et fautes de
+                              frappe du texte (ex: "pyhton") aux compétences canoniques.
+                              Par défaut, le normaliseur installé pour CV et JobOffer.
     Simule l'extraction NLP d'un CV.
     Dans un cas réel, utiliserait spaCy/Transformers ici.
     """    
-    def __init__(self):
-        self.taxonomy = ["python", "java", "sql", "machine learning", "react", "aws", "excel"]
+    def __init__(
+        self,
+        taxonomy: Optional[List[str]] = None,
+        cache: Optional[ParseCache] = None,
+        max_pages: Optional[int] = None,
+        max_chars: Optional[int] = None,
+        keep_raw_text: bool = True,
+        normalizer: Optional[SkillNormalizer] = None,
+    ):
+        self.normalizer = normalizer if normalizer is not None else get_skill_normalizer()
+        self.taxonomy = taxonomy if taxonomy is not None else list(DEFAULT_TAXONOMY)
+        self.cache = cache
+        # Plafonds de lecture : bornent la mémoire par document quelle que soit sa taille
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self.keep_raw_text = keep_raw_text
+
+    @property
+    def taxonomy(self) -> List[str]:
+        return self._taxonomy
+
+    @taxonomy.setter
+    def taxonomy(self, skills: List[str]) -> None:
+        self._taxonomy = list(skills)
+        # Compilé une seule fois par taxonomie : le coût d'extraction ne dépend plus de sa taille
+        self._skill_index = _compile_taxonomy(tuple(self._taxonomy))
+        normalizer_version = self.normalizer.version if self.normalizer is not None else ""
+        fingerprint = hashlib.sha256("\n".join([ANALYZER_VERSION, normalizer_version] + self._taxonomy).encode("utf-8"))
+        self._taxonomy_version = fingerprint.hexdigest()[:16]
+
+    @property
+    def taxonomy_version(self) -> str:
+        """
+        Empreinte de la version de l'analyseur, de la taxonomie et des plafonds de
+        lecture (clé d'invalidation du cache) : un parsing tronqué par `max_pages`
+        ou `max_chars` n'est jamais servi à un analyseur sans plafond.
+        """
+        if self.max_pages is None and self.max_chars is None:
+            return self._taxonomy_version
+        caps = f"{self._taxonomy_version}\npages={self.max_pages}\nchars={self.max_chars}"
+        return hashlib.sha256(caps.encode("utf-8")).hexdigest()[:16]
+
+    def __getstate__(self) -> dict:
+        # L'index n'est pas sérialisé : il est recompilé dans le processus cible
+        state = self.__dict__.copy()
+        state.pop("_skill_index", None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        taxonomy = state.pop("_taxonomy")
+        self.__dict__.update(state)
+        self.taxonomy = taxonomy
 
     
     @staticmethod
     def extract_years(text: str) -> float:
         # Recherche basique de patterns "X ans d'expérience"
-        match = re.search(r'(\d+)\s*(ans|years|\+)', text, re.IGNORECASE)
-        if match:
-            return float(match.group(1))
-        return 0.0
-    
-    def _extract_years(self, text: str) -> float:
-        # Recherche basique de patterns "X ans d'expérience"
-        match = re.search(r'(\d+)\s*(ans|years|\+)', text, re.IGNORECASE)
+        match = _YEARS_PATTERN.search(text)
         if match:
             return float(match.group(1))
         return 0.0
 
+    _extract_years = extract_years
+
     
     def _extract_skills(self, text: str) -> List[str]:
         """
         Extrait les compétences du texte en se basant sur la taxonomie de l'analyseur.
+
+        Un seul passage sur le texte via l'index compilé, en respectant
+        les frontières de mots.
         
         Args:
             text (str): Texte du CV.
@@ -56,29 +317,29 @@ class CVAnalyzer:
         Returns:
             List[str]: Liste des compétences trouvées.
         """
-        text_lower = text.lower()
-        found_skills = []
-        # On parcourt la taxonomie définie dans __init__
-        for skill in self.taxonomy:
-            if skill in text_lower:
-                found_skills.append(skill)
-        return list(set(found_skills))
+        if self.normalizer is None:
+            return self._skill_index.find_all(text)
+        fields = _FieldExtractor(self._skill_index, fuzzy=True)
+        fields.feed(text)
+        fields.skills.update(dict.fromkeys(self._fuzzy_skills(fields.tokens)))
+        return list(fields.skills)
+
+    def _fuzzy_skills(self, tokens: Iterable[str]) -> List[str]:
+        # Un seul appel au normaliseur par document : les variantes connues sont mémorisées.
+        # Règle stricte des textes libres : un mot courant proche d'une compétence n'en devient pas une
+        return [skill for skill in self.normalizer.match_tokens(dict.fromkeys(tokens)) if skill is not None]
     
     @staticmethod
     def extract_skills(text: str, known_skills_db: List[str]) -> List[str]:
-        found_skills = []
-        text_lower = text.lower()
+        skill_index = _compile_taxonomy(tuple(known_skills_db))
+        # On renvoie les libellés tels qu'écrits dans la base de compétences
+        originals = {}
         for skill in known_skills_db:
-            # Normalisation simple
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-        return list(set(found_skills)) # Unique
+            originals.setdefault(skill.lower().strip(), skill)
+        return [originals[skill] for skill in skill_index.find_all(text)] # Unique
 
     def parse_cv(self, cv_text: str, candidate_id: str) -> CV:
-        # Base de données de compétences connues (Mock de taxonomie)
-        taxonomy = ["python", "java", "sql", "machine learning", "react", "aws", "excel"]
-        
-        skills = self.extract_skills(cv_text, taxonomy)
+        skills = self._extract_skills(cv_text)
         exp = self.extract_years(cv_text)
         
         # Simulation localisation (dans un vrai cas, NER pour lieux)
@@ -104,42 +365,204 @@ class CVAnalyzer:
         Returns:
             str: Texte extrait du document Word.
         """
-        text = ""
-        try:
-            doc = Document(file_path)
-            for para in doc.paragraphs:
-                text += para.text + "\n"
-        except Exception as e:
-            print(f"Erreur lecture DOCX {file_path}: {e}")
-            return ""
-        return text
+        return "".join(self._iter_docx_paragraphs(file_path))
+
+    @staticmethod
+    def _iter_docx_paragraphs(file_path: str) -> Iterator[str]:
+        doc = _import_backend("docx", "python-docx").Document(file_path)
+        for para in doc.paragraphs:
+            yield para.text + "\n"
     
     def parse_from_file(self, file_path: str, candidate_id: str) -> Optional[CV]:
         """
         Point d'entrée principal pour parser un CV depuis un fichier.
 
         Détecte l'extension du fichier (.pdf, .docx, .txt).
+        Renvoie None (et journalise l'erreur) si le fichier ne peut pas être lu.
         """
-        if not os.path.exists(file_path):
-            print(f"Fichier introuvable : {file_path}")
+        try:
+            cv = self._parse_file_strict(file_path, candidate_id)
+        except CVParsingError as e:
+            _count_file(file_path, ok=False)
+            logger.warning(str(e))
             return None
+        _count_file(file_path, ok=True)
+        return cv
+
+    def _parse_file_strict(self, file_path: str, candidate_id: str) -> CV:
+        """Variante de parse_from_file qui lève CVParsingError au lieu de renvoyer None."""
+        key = None
+        if self.cache is not None and os.path.exists(file_path):
+            key = self.cache.file_key(file_path)
+            entry = self.cache.get(key, self.taxonomy_version)
+            get_registry().counter("cv_parse_cache_total", "Consultations du cache de parsing").inc(
+                result="hit" if entry is not None else "miss")
+            if entry is not None:
+                # Cache hit : ni pdfplumber ni python-docx ne sont sollicités
+                return self._cv_from_cache(entry, candidate_id)
+
+        # Le texte est consommé page par page par les extracteurs de champs
+        segments = self._iter_text(file_path)
+        parts: List[str] = []
+        if key is not None and not self.keep_raw_text:
+            # L'entrée garde toujours le texte : keep_raw_text ne s'applique qu'au CV construit
+            segments = _record_segments(segments, parts)
+        cv = self.parse_from_stream(segments, candidate_id)
+        if key is not None:
+            self.cache.put(key, self.taxonomy_version, {
+                "text": cv.raw_text if self.keep_raw_text else "".join(parts),
+                "name": cv.name,
+                "skills": cv.skills,
+                "years_experience": cv.years_experience,
+                "location": cv.location.value,
+                "availability_immediate": cv.availability_immediate,
+            })
+        return cv
+
+    def _cv_from_cache(self, entry: dict, candidate_id: str) -> CV:
+        return CV(
+            id=candidate_id,
+            name=entry["name"],
+            skills=entry["skills"],
+            years_experience=entry["years_experience"],
+            location=LocationEnum(entry["location"]),
+            availability_immediate=entry["availability_immediate"],
+            raw_text=entry["text"] if self.keep_raw_text else None
+        )
+
+    def _extract_text(self, file_path: str) -> str:
+        """
+        Lit le texte brut d'un fichier selon son extension.
+
+        Raises:
+            CVParsingError: Fichier introuvable, format non supporté ou erreur de lecture.
+        """
+        return "".join(self._iter_text(file_path))
+
+    def _iter_text(self, file_path: str) -> Iterator[str]:
+        """
+        Produit le texte d'un fichier par segments (pages PDF, paragraphes DOCX, lignes TXT).
+
+        Le flux est tronqué à `max_chars` caractères ; la lecture du fichier
+        s'arrête dès que le plafond est atteint.
+
+        Raises:
+            CVParsingError: Fichier introuvable, format non supporté ou erreur de lecture.
+        """
+        if not os.path.exists(file_path):
+            raise CVParsingError(f"Fichier introuvable : {file_path}")
 
         ext = os.path.splitext(file_path)[1].lower()
-        
-        text_content = ""
         if ext == ".pdf":
-            text_content = self._read_pdf(file_path)
+            segments = self._iter_pdf_pages(file_path)
         elif ext == ".docx":
-            text_content = self._read_docx(file_path)
+            segments = self._iter_docx_paragraphs(file_path)
         elif ext == ".txt":
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text_content = f.read()
+            segments = self._iter_txt_lines(file_path)
         else:
-            print(f"Format de fichier non supporté : {ext}")
-            return None
+            raise CVParsingError(f"Format de fichier non supporté : {ext}")
+
+        try:
+            yield from self._limit_chars(segments)
+        except Exception as e:
+            raise CVParsingError(f"Erreur lecture {ext[1:].upper()} {file_path}: {e}") from e
+
+    def _limit_chars(self, segments: Iterator[str]) -> Iterator[str]:
+        """Tronque un flux de segments à `max_chars` caractères au total."""
+        if self.max_chars is None:
+            yield from segments
+            return
+        remaining = self.max_chars
+        try:
+            for segment in segments:
+                if len(segment) >= remaining:
+                    if remaining:
+                        yield segment[:remaining]
+                    return
+                remaining -= len(segment)
+                yield segment
+        finally:
+            # Ferme le document sous-jacent même si la lecture s'arrête avant la fin
+            segments.close()
+
+    @staticmethod
+    def _iter_txt_lines(file_path: str) -> Iterator[str]:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            yield from f
+
+    def parse_many(
+        self,
+        paths: Iterable[str],
+        max_workers: Optional[int] = None,
+        chunksize: int = 16,
+        ordered: bool = False,
+        on_error: Optional[Callable[[ParseFailure], None]] = None,
+    ) -> Iterator[CV]:
+        """
+        Parse un grand nombre de fichiers en parallèle sur un pool de processus.
 
-        # Une fois le texte extrait, on utilise la logique NLP existante
-        return self.parse_from_text(text_content, candidate_id)
+        Les fichiers sont regroupés en lots de `chunksize` pour amortir le coût
+        des échanges inter-processus. L'identifiant candidat est le nom du
+        fichier sans extension.
+
+        Args:
+            paths (Iterable[str]): Chemins des fichiers à parser.
+            max_workers (int, optional): Nombre de processus (défaut : nombre de cœurs).
+                                         Avec 1, le parsing se fait dans le processus courant.
+            chunksize (int, optional): Nombre de fichiers par tâche envoyée à un worker.
+            ordered (bool, optional): True pour produire les CVs dans l'ordre d'entrée,
+                                      False pour les produire dès qu'ils sont prêts.
+            on_error (Callable, optional): Appelé avec un ParseFailure pour chaque fichier
+                                           en échec (défaut : journalisation).
+
+        Yields:
+            CV: Les CVs parsés avec succès.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1")
+        report = on_error or (lambda failure: logger.warning("%s: %s", failure.path, failure.error))
+
+        jobs = [(position, str(path), Path(path).stem) for position, path in enumerate(paths)]
+        chunks = [jobs[i:i + chunksize] for i in range(0, len(jobs), chunksize)]
+
+        def emit(results):
+            for _, path, cv, error in results:
+                _count_file(path, ok=cv is not None)
+                if cv is None:
+                    report(ParseFailure(path=path, error=error))
+                else:
+                    yield cv
+
+        if max_workers == 1 or len(chunks) <= 1:
+            for chunk in chunks:
+                yield from emit(_parse_chunk_with(self, chunk))
+            return
+
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(self,)) as pool:
+            futures = [pool.submit(_parse_chunk, chunk) for chunk in chunks]
+            for future in (futures if ordered else as_completed(futures)):
+                yield from emit(future.result())
+
+    def parse_directory(
+        self, directory: str, recursive: bool = False, **kwargs
+    ) -> Iterator[CV]:
+        """
+        Parse tous les CVs pris en charge (.pdf, .docx, .txt) d'un répertoire.
+
+        Args:
+            directory (str): Répertoire à parcourir.
+            recursive (bool, optional): Parcourir aussi les sous-répertoires.
+            **kwargs: Options transmises à parse_many (max_workers, chunksize, ordered, on_error).
+
+        Yields:
+            CV: Les CVs parsés avec succès.
+        """
+        pattern = "**/*" if recursive else "*"
+        paths = sorted(
+            p for p in Path(directory).glob(pattern)
+            if p.is_file() and p.suffix.lower() in SUPPORTED_EXTENSIONS
+        )
+        return self.parse_many(paths, **kwargs)
     
     def _read_pdf(self, file_path: str) -> str:
         """
@@ -149,37 +572,83 @@ class CVAnalyzer:
             file_path (str): Chemin vers le fichier PDF.
 
         Returns:
-            str: Texte concaténé de toutes les pages du PDF.
+            str: Texte concaténé des pages du PDF (au plus `max_pages` pages).
         """
-        text = ""
-        try:
-            with pdfplumber.open(file_path) as pdf:
-                for page in pdf.pages:
+        return "".join(self._iter_pdf_pages(file_path))
+
+    def _iter_pdf_pages(self, file_path: str) -> Iterator[str]:
+        """
+        Produit le texte d'un PDF page par page.
+
+        Chaque page est libérée (cache pdfplumber vidé) dès que son texte est
+        extrait : la mémoire reste bornée par la taille d'une page.
+
+        Args:
+            file_path (str): Chemin vers le fichier PDF.
+
+        Yields:
+            str: Texte d'une page, terminé par un saut de ligne.
+        """
+        with _import_backend("pdfplumber", "pdfplumber").open(file_path) as pdf:
+            for number, page in enumerate(pdf.pages):
+                if self.max_pages is not None and number >= self.max_pages:
+                    break
+                try:
                     extracted = page.extract_text()
-                    if extracted:
-                        text += extracted + "\n"
-        except Exception as e:
-            print(f"Erreur lecture PDF {file_path}: {e}")
-            return ""
-        return text
+                finally:
+                    page.close()
+                if extracted:
+                    yield extracted + "\n"
     
     def parse_from_text(self, text: str, candidate_id: str) -> CV:
         """Logique NLP d'extraction de champs (comme avant)."""
-        skills = self._extract_skills(text)
-        exp = self._extract_years(text)
-        loc = self._guess_location(text)
+        return self.parse_from_stream([text], candidate_id)
+
+    def parse_from_stream(self, segments: Iterable[str], candidate_id: str) -> CV:
+        """
+        Extrait les champs d'un CV à partir d'un flux de segments de texte.
+
+        Les extracteurs (compétences, expérience, localisation, disponibilité, nom)
+        consomment chaque segment au fil de l'eau, mis en minuscule et découpé en
+        mots une seule fois. Les segments doivent être découpés sur des
+        frontières de mots (pages, paragraphes, lignes) : le texte du CV est
+        leur concaténation.
+
+        Args:
+            segments (Iterable[str]): Segments de texte successifs.
+            candidate_id (str): Identifiant du candidat.
+
+        Returns:
+            CV: Le CV structuré.
+        """
+        fields = _FieldExtractor(self._skill_index, fuzzy=self.normalizer is not None)
+        parts = []
+        # Le temps de lecture (pages) et celui de détection des champs sont mesurés séparément
+        start = time.perf_counter()
+        field_time = 0.0
+        for segment in segments:
+            field_start = time.perf_counter()
+            if self.keep_raw_text:
+                parts.append(segment)
+            fields.feed(segment)
+            field_time += time.perf_counter() - field_start
+        if fields.tokens:
+            field_start = time.perf_counter()
+            fields.skills.update(dict.fromkeys(self._fuzzy_skills(fields.tokens)))
+            field_time += time.perf_counter() - field_start
+
+        stages = get_registry().histogram("pipeline_stage_seconds", "Durée des étapes du pipeline")
+        stages.observe(time.perf_counter() - start - field_time, stage="text_extraction")
+        stages.observe(field_time, stage="field_extraction")
 
-        # Appel correct pour récupérer un Enum
-        loc = self._guess_location(text) 
-        
         return CV(
             id=candidate_id,
-            name="Candidat Extrait", 
-            skills=skills,
-            years_experience=exp,
-            location=loc,
-            availability_immediate=True,
-            raw_text=text
+            name=fields.name or DEFAULT_NAME,
+            skills=list(fields.skills),
+            years_experience=fields.years or 0.0,
+            location=_location_from_keywords(fields.locations),
+            availability_immediate=fields.availability_immediate,
+            raw_text="".join(parts) if self.keep_raw_text else None
         )
     
     def _guess_location(self, text: str):
@@ -192,13 +661,4 @@ class CVAnalyzer:
         Returns:
             LocationEnum: L'enum correspondant, ou PARIS par défaut.
         """
-        text_lower = text.lower()
-        if "paris" in text_lower:
-            return LocationEnum.PARIS
-        if "lyon" in text_lower:
-            return LocationEnum.LYON
-        if "remote" in text_lower or "télétravail" in text_lower:
-            return LocationEnum.REMOTE
-            
-        # Valeur par défaut si rien n'est trouvé
-        return LocationEnum.PARIS 
\ No newline at end of file
+        return _location_from_keywords(_LOCATION_KEYWORDS.intersection(tokenize(text.lower())))
@@ -0,0 +1,148 @@
+# ==========================================
+# Module B: Content-addressed Parse Cache
+# ==========================================
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Dict, Optional
+
+# Taille des blocs lus pour le calcul de l'empreinte (évite de charger le fichier en mémoire)
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+class ParseCache:
+    """
+    Cache disque des CVs parsés, adressé par le contenu des fichiers.
+
+    La clé est une empreinte SHA-256 des octets du fichier combinée à la version
+    de l'analyseur/taxonomie : un même CV ré-importé n'est jamais re-parsé, et
+    une nouvelle taxonomie invalide automatiquement les entrées précédentes.
+    Les entrées sont rangées par version : plusieurs analyseurs (taxonomies
+    différentes) peuvent partager le même répertoire. Au-delà de `max_bytes`,
+    les entrées les moins récemment utilisées sont évincées, toutes versions
+    confondues.
+
+    Attributs:
+        directory (Path): Répertoire racine du cache.
+        max_bytes (int): Taille disque maximale avant éviction (LRU).
+        purge_stale_versions (bool): Si vrai, les répertoires des autres versions sont
+                                     supprimés à la première écriture (cache réservé
+                                     à une seule taxonomie).
+    """
+    def __init__(self, directory: str, max_bytes: int = 512 * 1024 * 1024, purge_stale_versions: bool = False):
+        if max_bytes <= 0:
+            raise ValueError("max_bytes must be > 0")
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.purge_stale_versions = purge_stale_versions
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._size = sum(p.stat().st_size for p in self._entries())
+        self._purged_versions = set()
+
+    def __getstate__(self) -> dict:
+        # Partagé avec les workers de parse_many : chaque processus recalcule sa vue
+        return {"directory": str(self.directory), "max_bytes": self.max_bytes,
+                "purge_stale_versions": self.purge_stale_versions}
+
+    def __setstate__(self, state: dict) -> None:
+        self.__init__(state["directory"], state["max_bytes"], state["purge_stale_versions"])
+
+    @staticmethod
+    def file_key(file_path: str) -> str:
+        """
+        Calcule l'empreinte SHA-256 du contenu d'un fichier, lu par blocs.
+
+        Args:
+            file_path (str): Chemin du fichier.
+
+        Returns:
+            str: Empreinte hexadécimale.
+        """
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def _path(self, key: str, version: str) -> Path:
+        return self.directory / version / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        return self.directory.glob("*/*/*.json")
+
+    def get(self, key: str, version: str) -> Optional[Dict]:
+        """
+        Renvoie l'entrée en cache, ou None en cas d'absence (ou d'entrée illisible).
+
+        Args:
+            key (str): Empreinte du contenu du fichier.
+            version (str): Version de l'analyseur/taxonomie.
+
+        Returns:
+            Optional[Dict]: Champs extraits (texte, compétences, expérience...).
+        """
+        path = self._path(key, version)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            # Mise à jour de la date d'accès utilisée pour l'éviction LRU
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+        return entry
+
+    def put(self, key: str, version: str, entry: Dict) -> None:
+        """
+        Enregistre une entrée (écriture atomique), puis évince si la taille maximale est dépassée.
+
+        Args:
+            key (str): Empreinte du contenu du fichier.
+            version (str): Version de l'analyseur/taxonomie.
+            entry (Dict): Champs sérialisables en JSON.
+        """
+        if self.purge_stale_versions and version not in self._purged_versions:
+            self._purge_other_versions(version)
+            self._purged_versions.add(version)
+
+        path = self._path(key, version)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(entry, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+
+        self._size += path.stat().st_size
+        if self._size > self.max_bytes:
+            self._evict()
+
+    def _purge_other_versions(self, version: str) -> None:
+        for child in self.directory.iterdir():
+            if child.is_dir() and child.name != version:
+                shutil.rmtree(child, ignore_errors=True)
+        self._size = sum(p.stat().st_size for p in self._entries())
+
+    def _evict(self) -> None:
+        # Recalcule la taille réelle (d'autres processus peuvent écrire dans le même cache),
+        # puis supprime les entrées les plus anciennes jusqu'à 90% de la limite.
+        entries = []
+        for path in self._entries():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in sorted(entries, key=lambda e: e[0]):
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            total -= size
+        self._size = total
@@ -0,0 +1,227 @@
+# ==========================================
+# Module C: Candidate Pool Index (Inverted Index)
+# ==========================================
+
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set
+from src.models import LocationEnum, CV, JobOffer
+
+if TYPE_CHECKING:
+    from src.services.similarity import SkillSimilarityModel
+
+
+class CandidateIndex:
+    """
+    Vivier de candidats persistant indexé pour une recherche sous-linéaire.
+
+    L'index maintient une liste de postings compétence → candidats ainsi que
+    des index secondaires sur la localisation et la disponibilité. Pour une
+    offre donnée, seuls les candidats partageant au moins une compétence requise
+    ou compatibles géographiquement sont renvoyés au MatchingEngine.
+
+    Les index sont mis à jour incrémentalement par add / update / remove :
+    la latence d'une recommandation dépend du nombre de candidats pertinents,
+    et non de la taille du vivier.
+    """
+    def __init__(self, cvs: Iterable[CV] = ()):
+        self._cvs: Dict[str, CV] = {}
+        # Postings indexés par identifiant de compétence (vocabulaire partagé)
+        self._by_skill: Dict[int, Set[str]] = defaultdict(set)
+        self._by_location: Dict[LocationEnum, Set[str]] = defaultdict(set)
+        self._available: Set[str] = set()
+        for cv in cvs:
+            self.add(cv)
+
+    def __len__(self) -> int:
+        return len(self._cvs)
+
+    def __contains__(self, cv_id: str) -> bool:
+        return cv_id in self._cvs
+
+    def __iter__(self):
+        return iter(self._cvs.values())
+
+    def get(self, cv_id: str) -> Optional[CV]:
+        """Renvoie le CV indexé sous cet identifiant, ou None."""
+        return self._cvs.get(cv_id)
+
+    def add(self, cv: CV) -> None:
+        """
+        Ajoute un candidat à l'index.
+
+        Args:
+            cv (CV): Candidat à indexer.
+
+        Raises:
+            ValueError: Si un candidat avec le même identifiant est déjà indexé.
+        """
+        if cv.id in self._cvs:
+            raise ValueError(f"Candidate {cv.id} is already indexed")
+        self._cvs[cv.id] = cv
+        for skill_id in cv.skill_ids:
+            self._by_skill[skill_id].add(cv.id)
+        self._by_location[cv.location].add(cv.id)
+        if cv.availability_immediate:
+            self._available.add(cv.id)
+
+    def remove(self, cv_id: str) -> CV:
+        """
+        Retire un candidat de tous les index.
+
+        Args:
+            cv_id (str): Identifiant du candidat.
+
+        Returns:
+            CV: Le candidat retiré.
+
+        Raises:
+            KeyError: Si le candidat n'est pas indexé.
+        """
+        cv = self._cvs.pop(cv_id)
+        for skill_id in cv.skill_ids:
+            postings = self._by_skill[skill_id]
+            postings.discard(cv_id)
+            if not postings:
+                del self._by_skill[skill_id]
+        self._by_location[cv.location].discard(cv_id)
+        self._available.discard(cv_id)
+        return cv
+
+    def update(self, cv: CV) -> None:
+        """Remplace (ou ajoute) un candidat en mettant à jour ses postings."""
+        if cv.id in self._cvs:
+            self.remove(cv.id)
+        self.add(cv)
+
+    def candidates_for(
+        self, offer: JobOffer, only_available: bool = False, similarity: Optional["SkillSimilarityModel"] = None
+    ) -> List[CV]:
+        """
+        Sélectionne les candidats plausibles pour une offre.
+
+        Un candidat est retenu s'il possède au moins une compétence requise, ou
+        s'il est compatible géographiquement (même ville, ou remote si l'offre
+        l'autorise). Une offre sans compétence requise renvoie tout le vivier.
+
+        Args:
+            offer (JobOffer): Offre ciblée.
+            only_available (bool, optional): Ne garder que les candidats disponibles immédiatement.
+            similarity (SkillSimilarityModel, optional): Retenir aussi les candidats possédant une
+                                                         compétence proche d'une compétence requise.
+
+        Returns:
+            List[CV]: Candidats à transmettre au MatchingEngine.
+        """
+        if not offer.required_skills:
+            ids = set(self._cvs)
+        else:
+            ids = set()
+            skill_ids = offer.required_skill_ids if similarity is None else similarity.expand(offer.required_skill_ids)
+            for skill_id in skill_ids:
+                ids |= self._by_skill.get(skill_id, set())
+            ids |= self._by_location.get(offer.location, set())
+            if offer.remote_allowed:
+                ids |= self._by_location.get(LocationEnum.REMOTE, set())
+
+        if only_available:
+            ids &= self._available
+        return [self._cvs[cv_id] for cv_id in ids]
+
+
+class OfferIndex:
+    """
+    Catalogue d'offres indexé pour la recommandation côté candidat.
+
+    Symétrique de CandidateIndex : postings compétence requise → offres, index
+    des offres par localisation, ensemble des offres ouvertes au télétravail et
+    des offres sans compétence requise. Un candidat n'est évalué que sur les
+    offres qu'il peut plausiblement décrocher.
+    """
+    def __init__(self, offers: Iterable[JobOffer] = ()):
+        self._offers: Dict[str, JobOffer] = {}
+        self._by_skill: Dict[int, Set[str]] = defaultdict(set)
+        self._by_location: Dict[LocationEnum, Set[str]] = defaultdict(set)
+        self._remote: Set[str] = set()
+        self._open: Set[str] = set()
+        for offer in offers:
+            self.add(offer)
+
+    def __len__(self) -> int:
+        return len(self._offers)
+
+    def __contains__(self, offer_id: str) -> bool:
+        return offer_id in self._offers
+
+    def __iter__(self):
+        return iter(self._offers.values())
+
+    def get(self, offer_id: str) -> Optional[JobOffer]:
+        """Renvoie l'offre indexée sous cet identifiant, ou None."""
+        return self._offers.get(offer_id)
+
+    def add(self, offer: JobOffer) -> None:
+        """
+        Ajoute une offre à l'index.
+
+        Raises:
+            ValueError: Si une offre avec le même identifiant est déjà indexée.
+        """
+        if offer.id in self._offers:
+            raise ValueError(f"Offer {offer.id} is already indexed")
+        self._offers[offer.id] = offer
+        for skill_id in offer.required_skill_ids:
+            self._by_skill[skill_id].add(offer.id)
+        if not offer.required_skill_ids:
+            self._open.add(offer.id)
+        self._by_location[offer.location].add(offer.id)
+        if offer.remote_allowed:
+            self._remote.add(offer.id)
+
+    def remove(self, offer_id: str) -> JobOffer:
+        """
+        Retire une offre de tous les index.
+
+        Raises:
+            KeyError: Si l'offre n'est pas indexée.
+        """
+        offer = self._offers.pop(offer_id)
+        for skill_id in offer.required_skill_ids:
+            postings = self._by_skill[skill_id]
+            postings.discard(offer_id)
+            if not postings:
+                del self._by_skill[skill_id]
+        self._open.discard(offer_id)
+        self._by_location[offer.location].discard(offer_id)
+        self._remote.discard(offer_id)
+        return offer
+
+    def update(self, offer: JobOffer) -> None:
+        """Remplace (ou ajoute) une offre en mettant à jour ses postings."""
+        if offer.id in self._offers:
+            self.remove(offer.id)
+        self.add(offer)
+
+    def offers_for(self, cv: CV, similarity: Optional["SkillSimilarityModel"] = None) -> List[JobOffer]:
+        """
+        Sélectionne les offres plausibles pour un candidat.
+
+        Une offre est retenue si le candidat possède au moins une de ses compétences
+        requises, si elle n'en exige aucune, ou si elle est compatible
+        géographiquement (même ville, ou télétravail autorisé pour un candidat remote).
+
+        Args:
+            cv (CV): Candidat ciblé.
+            similarity (SkillSimilarityModel, optional): Retenir aussi les offres exigeant une
+                                                         compétence proche de celles du candidat.
+
+        Returns:
+            List[JobOffer]: Offres à transmettre au MatchingEngine.
+        """
+        ids = set(self._open)
+        skill_ids = cv.skill_ids if similarity is None else similarity.expand(cv.skill_ids)
+        for skill_id in skill_ids:
+            ids |= self._by_skill.get(skill_id, set())
+        ids |= self._by_location.get(cv.location, set())
+        if cv.location == LocationEnum.REMOTE:
+            ids |= self._remote
+        return [self._offers[offer_id] for offer_id in ids]
@@ -0,0 +1,214 @@
+# ==========================================
+# Module B: Async Ingestion Pipeline (Bounded, Batched)
+# ==========================================
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from src.services.analyzer import (
+    CVAnalyzer, ParseFailure, _count_file, _init_worker, _parse_chunk, _parse_chunk_with,
+)
+from src.utils.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+# Marque de fin de flux déposée dans la file par close()
+_STOP = object()
+
+
+@dataclass
+class IngestionStats:
+    """Compteurs d'une ingestion (fichiers reçus, parsés, en échec, lots traités)."""
+    submitted: int = 0
+    parsed: int = 0
+    failed: int = 0
+    batches: int = 0
+
+
+class IngestionPipeline:
+    """
+    Ingestion asynchrone de CVs : file bornée → micro-lots → parsing → index.
+
+    Les fichiers soumis sont placés dans une file de taille `max_queue` : quand
+    elle est pleine, submit() attend (contre-pression), si bien que la mémoire
+    reste bornée quel que soit le volume à ingérer. Un lot part vers les
+    processus de parsing dès qu'il atteint `batch_size` fichiers ou que
+    `flush_interval` secondes se sont écoulées depuis son premier fichier. Au
+    plus `max_in_flight` lots sont parsés simultanément ; les CVs obtenus sont
+    insérés dans l'index depuis la boucle d'événements (un seul écrivain).
+
+    Usage:
+        async with IngestionPipeline(analyzer, index) as pipeline:
+            for path in paths:
+                await pipeline.submit(path)
+        print(pipeline.stats)
+
+    Attributs:
+        analyzer (CVAnalyzer): Analyseur utilisé par les processus de parsing.
+        index: Destination des CVs (toute structure exposant update(cv), ex: CandidateIndex).
+        batch_size (int): Taille maximale d'un lot.
+        flush_interval (float): Délai maximal (secondes) avant l'envoi d'un lot incomplet.
+        max_queue (int): Capacité de la file d'attente.
+        workers (int): Processus de parsing (0 : parsing dans un thread du processus courant).
+        max_in_flight (int): Nombre maximal de lots en cours de parsing.
+        stats (IngestionStats): Compteurs de l'ingestion.
+    """
+    def __init__(
+        self,
+        analyzer: CVAnalyzer,
+        index,
+        batch_size: int = 32,
+        flush_interval: float = 0.5,
+        max_queue: int = 1000,
+        workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        on_error: Optional[Callable[[ParseFailure], None]] = None,
+    ):
+        if batch_size < 1 or max_queue < 1:
+            raise ValueError("batch_size and max_queue must be >= 1")
+        self.analyzer = analyzer
+        self.index = index
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue = max_queue
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.max_in_flight = max_in_flight or max(1, self.workers)
+        self.stats = IngestionStats()
+        self._report = on_error or (lambda failure: logger.warning("%s: %s", failure.path, failure.error))
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[Executor] = None
+        self._batcher: Optional[asyncio.Task] = None
+        self._in_flight: Set[asyncio.Task] = set()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._closed = False
+
+    async def __aenter__(self) -> "IngestionPipeline":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            await self.close()
+        else:
+            await self.cancel()
+
+    async def start(self) -> None:
+        """Démarre les processus de parsing et la tâche de constitution des lots."""
+        if self._batcher is not None:
+            raise RuntimeError("Pipeline already started")
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._slots = asyncio.Semaphore(self.max_in_flight)
+        if self.workers > 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker,
+                                                 initargs=(self.analyzer,))
+        self._batcher = asyncio.create_task(self._batch_loop())
+
+    async def submit(self, path: str, candidate_id: Optional[str] = None) -> None:
+        """
+        Met un fichier en file ; attend tant que la file est pleine.
+
+        Args:
+            path (str): Chemin du CV.
+            candidate_id (str, optional): Identifiant du candidat (défaut : nom du fichier sans extension).
+
+        Raises:
+            RuntimeError: Si le pipeline n'est pas démarré, ou est fermé ou annulé.
+        """
+        if self._batcher is None or self._closed:
+            raise RuntimeError("Pipeline is not accepting files")
+        await self._queue.put((str(path), candidate_id or Path(path).stem))
+        self.stats.submitted += 1
+
+    async def submit_many(self, paths: Iterable[str]) -> None:
+        """Met une série de fichiers en file, au rythme permis par la contre-pression."""
+        for path in paths:
+            await self.submit(path)
+
+    async def close(self) -> None:
+        """Termine l'ingestion : traite tout ce qui est en file puis arrête les processus."""
+        if self._batcher is None or self._closed:
+            return
+        self._closed = True
+        await self._queue.put(_STOP)
+        await self._batcher
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+        self._shutdown(cancel=False)
+
+    async def cancel(self) -> None:
+        """Interrompt l'ingestion : les fichiers en file et les lots non démarrés sont abandonnés."""
+        self._closed = True
+        tasks = list(self._in_flight) + ([self._batcher] if self._batcher is not None else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._shutdown(cancel=True)
+
+    def _shutdown(self, cancel: bool) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=not cancel, cancel_futures=cancel)
+            self._executor = None
+
+    async def _batch_loop(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            # Contre-pression : pas plus de max_in_flight lots en cours de parsing
+            await self._slots.acquire()
+            task = asyncio.create_task(self._process(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _process(self, batch: List[Tuple[str, str]]) -> None:
+        loop = asyncio.get_running_loop()
+        chunk = [(position, path, candidate_id) for position, (path, candidate_id) in enumerate(batch)]
+        registry = get_registry()
+        start = time.perf_counter()
+        try:
+            if self._executor is not None:
+                results = await loop.run_in_executor(self._executor, _parse_chunk, chunk)
+            else:
+                results = await loop.run_in_executor(None, partial(_parse_chunk_with, self.analyzer, chunk))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Processus de parsing perdu : tout le lot est compté en échec
+            results = [(position, path, None, str(e)) for position, path, _ in chunk]
+        finally:
+            self._slots.release()
+
+        for _, path, cv, error in results:
+            _count_file(path, ok=cv is not None)
+            if cv is None:
+                self.stats.failed += 1
+                self._report(ParseFailure(path=path, error=error))
+            else:
+                self.index.update(cv)
+                self.stats.parsed += 1
+        self.stats.batches += 1
+        registry.counter("ingestion_batches_total", "Lots traités par le pipeline d'ingestion").inc()
+        registry.histogram("pipeline_stage_seconds").observe(time.perf_counter() - start, stage="ingestion_batch")
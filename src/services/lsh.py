@@ -0,0 +1,185 @@
+# ==========================================
+# Module C: Approximate Candidate Retrieval (MinHash / LSH)
+# ==========================================
+
+import zlib
+from collections import defaultdict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Sequence, Set
+
+import numpy as np
+
+from src.models import SKILL_VOCABULARY, CV, JobOffer
+
+if TYPE_CHECKING:
+    from src.services.similarity import SkillSimilarityModel
+
+# Nombre premier de Mersenne 2^31 - 1 : a * h + b tient dans un entier 64 bits
+_PRIME = (1 << 31) - 1
+
+
+class MinHashLSHIndex:
+    """
+    Index approximatif des candidats par signatures MinHash de leurs compétences.
+
+    Chaque CV est résumé par `num_perm` minima de hachages de ses compétences ;
+    la signature est découpée en `bands` bandes de `num_perm / bands` valeurs,
+    et chaque bande est rangée dans un seau. Une offre ne récupère que les
+    candidats partageant au moins un seau avec la signature de ses compétences
+    requises : le coût dépend du nombre de candidats similaires, pas de la
+    taille du vivier, même pour des compétences très répandues.
+
+    Deux ensembles de similarité de Jaccard s sont retenus avec une probabilité
+    1 - (1 - s^r)^b (r lignes par bande, b bandes) : plus de bandes augmentent
+    le rappel et la taille de la liste restreinte. La liste restreinte est ensuite
+    évaluée exactement par le MatchingEngine (même interface que CandidateIndex).
+
+    Attributs:
+        num_perm (int): Nombre de fonctions de hachage (longueur de la signature).
+        bands (int): Nombre de bandes (doit diviser num_perm).
+        rows (int): Valeurs par bande.
+    """
+    def __init__(self, cvs: Iterable[CV] = (), num_perm: int = 64, bands: int = 32, seed: int = 1):
+        if bands <= 0 or num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+        # Hachage stable (indépendant du processus) de chaque compétence, par identifiant
+        self._skill_hashes: Dict[int, int] = {}
+
+        self._cvs: Dict[str, CV] = {}
+        self._keys: Dict[str, List[bytes]] = {}
+        self._buckets: List[Dict[bytes, Set[str]]] = [defaultdict(set) for _ in range(bands)]
+        self._available: Set[str] = set()
+        for cv in cvs:
+            self.add(cv)
+
+    def __len__(self) -> int:
+        return len(self._cvs)
+
+    def __contains__(self, cv_id: str) -> bool:
+        return cv_id in self._cvs
+
+    def __iter__(self):
+        return iter(self._cvs.values())
+
+    def get(self, cv_id: str) -> Optional[CV]:
+        """Renvoie le CV indexé sous cet identifiant, ou None."""
+        return self._cvs.get(cv_id)
+
+    def collision_probability(self, jaccard: float) -> float:
+        """Probabilité qu'un ensemble de similarité de Jaccard `jaccard` partage au moins un seau."""
+        return 1.0 - (1.0 - jaccard ** self.rows) ** self.bands
+
+    def signature(self, skill_ids: Sequence[int]) -> np.ndarray:
+        """Signature MinHash (num_perm valeurs) d'un ensemble non vide de compétences."""
+        hashes = np.fromiter((self._skill_hash(i) for i in skill_ids), dtype=np.uint64, count=len(skill_ids))
+        return ((np.outer(self._a, hashes) + self._b[:, np.newaxis]) % _PRIME).min(axis=1)
+
+    def _skill_hash(self, skill_id: int) -> int:
+        value = self._skill_hashes.get(skill_id)
+        if value is None:
+            value = self._skill_hashes[skill_id] = zlib.crc32(SKILL_VOCABULARY.name(skill_id).encode("utf-8")) % _PRIME
+        return value
+
+    def _band_keys(self, skill_ids: Sequence[int]) -> List[bytes]:
+        signature = self.signature(skill_ids)
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes() for band in range(self.bands)]
+
+    def add(self, cv: CV) -> None:
+        """
+        Ajoute un candidat à l'index.
+
+        Raises:
+            ValueError: Si un candidat avec le même identifiant est déjà indexé.
+        """
+        if cv.id in self._cvs:
+            raise ValueError(f"CV {cv.id} is already indexed")
+        self._cvs[cv.id] = cv
+        if cv.availability_immediate:
+            self._available.add(cv.id)
+        if not cv.skill_ids:
+            # Sans compétence, un candidat n'est retenu que pour les offres sans prérequis
+            return
+        keys = self._keys[cv.id] = self._band_keys(cv.skill_ids)
+        for buckets, key in zip(self._buckets, keys):
+            buckets[key].add(cv.id)
+
+    def remove(self, cv_id: str) -> CV:
+        """
+        Retire un candidat de l'index.
+
+        Raises:
+            KeyError: Si le candidat n'est pas indexé.
+        """
+        cv = self._cvs.pop(cv_id)
+        self._available.discard(cv_id)
+        for buckets, key in zip(self._buckets, self._keys.pop(cv_id, ())):
+            bucket = buckets[key]
+            bucket.discard(cv_id)
+            if not bucket:
+                del buckets[key]
+        return cv
+
+    def update(self, cv: CV) -> None:
+        """Remplace (ou ajoute) un candidat en recalculant sa signature."""
+        if cv.id in self._cvs:
+            self.remove(cv.id)
+        self.add(cv)
+
+    def candidates_for(
+        self, offer: JobOffer, only_available: bool = False, similarity: Optional["SkillSimilarityModel"] = None
+    ) -> List[CV]:
+        """
+        Liste restreinte des candidats dont les compétences ressemblent à celles de l'offre.
+
+        Une offre sans compétence requise renvoie tout le vivier (comme CandidateIndex).
+
+        Args:
+            offer (JobOffer): Offre ciblée.
+            only_available (bool, optional): Ne garder que les candidats disponibles immédiatement.
+            similarity (SkillSimilarityModel, optional): Signature calculée sur les compétences
+                                                         requises et leurs compétences proches.
+
+        Returns:
+            List[CV]: Candidats à transmettre au MatchingEngine.
+        """
+        if not offer.required_skill_ids:
+            ids = set(self._cvs)
+        else:
+            skill_ids = offer.required_skill_ids if similarity is None else similarity.expand(offer.required_skill_ids)
+            ids = set()
+            for buckets, key in zip(self._buckets, self._band_keys(tuple(skill_ids))):
+                ids |= buckets.get(key, set())
+        if only_available:
+            ids &= self._available
+        return [self._cvs[cv_id] for cv_id in ids]
+
+
+def measure_recall(
+    recommender, offers: Sequence[JobOffer], exact_candidates, approximate_candidates, top_k: int = 10
+) -> float:
+    """
+    Rappel@k moyen d'une recherche approximative par rapport au classement exact.
+
+    Args:
+        recommender (RecommendationSystem): Système utilisé pour les deux classements.
+        offers (Sequence[JobOffer]): Offres de test.
+        exact_candidates: Source exacte (liste, CandidateIndex ou CandidatePool).
+        approximate_candidates (MinHashLSHIndex): Source approximative.
+        top_k (int, optional): Taille des classements comparés.
+
+    Returns:
+        float: Part moyenne des top_k exacts retrouvés dans le top_k approximatif (0.0 à 1.0).
+    """
+    recalls = []
+    for offer in offers:
+        exact = {r["cv_id"] for r in recommender.recommend_candidates(offer, exact_candidates, top_k)}
+        if not exact:
+            continue
+        approx = {r["cv_id"] for r in recommender.recommend_candidates(offer, approximate_candidates, top_k)}
+        recalls.append(len(exact & approx) / len(exact))
+    return float(np.mean(recalls)) if recalls else 1.0
@@ -2,8 +2,122 @@
 # 3. Module A: Intelligent Matching Engine
 # ==========================================
 
-from typing import List, Dict
-from src.models import LocationEnum, CV, JobOffer
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import TYPE_CHECKING, List, Dict, Optional, Sequence, Tuple, Union
+import numpy as np
+from src.models import LocationEnum, LOCATION_CODES, SKILL_VOCABULARY, CV, JobOffer
+from src.services.pool import CandidatePool
+from src.utils.metrics import get_registry
+
+if TYPE_CHECKING:
+    # scipy n'est chargé que si un modèle de similarité est effectivement utilisé
+    from src.services.similarity import SkillSimilarityModel
+
+_REMOTE_CODE = LOCATION_CODES[LocationEnum.REMOTE]
+
+
+def _round_scores(values: np.ndarray) -> np.ndarray:
+    """
+    Arrondit un tableau à 2 décimales exactement comme la fonction native `round`.
+
+    `np.round` multiplie par 100 avant d'arrondir, ce qui peut basculer les valeurs
+    situées à une demi-unité près. Ces cas (rares) sont recalculés avec `round`.
+    """
+    # Opérations en place : sur de grandes matrices, chaque temporaire coûte plus que le calcul
+    scaled = values * 100
+    rounded = np.rint(scaled)
+    rounded /= 100
+    distance = np.floor(scaled)
+    np.subtract(scaled, distance, out=distance)
+    distance -= 0.5
+    np.abs(distance, out=distance)
+    ambiguous = distance < 1e-6
+    if ambiguous.any():
+        rounded[ambiguous] = [round(float(v), 2) for v in values[ambiguous]]
+    return rounded
+
+
+def _spread_columns(matrix: np.ndarray, columns: np.ndarray) -> np.ndarray:
+    """Recopie les colonnes calculées par valeur distincte vers les colonnes des offres."""
+    columns = columns.ravel()
+    if len(columns) == matrix.shape[1] and (columns == np.arange(len(columns))).all():
+        return matrix
+    return matrix.take(columns, axis=1)
+
+
+def _missing_skills(cv: CV, offer: JobOffer) -> Tuple[str, ...]:
+    """Compétences requises par l'offre que le candidat ne possède pas, dans l'ordre de l'offre."""
+    owned = set(cv.skills)
+    return tuple(skill for skill in offer.required_skills if skill not in owned)
+
+
+def _render_explanation(score: float, missing: Sequence[str], cv_exp: float, required_exp: float) -> str:
+    explanation = f"Score : {score}/100. "
+
+    if score > 80:
+        explanation += "Excellent match. "
+    elif score > 50:
+        explanation += "Match correct. "
+    else:
+        explanation += "Match faible. "
+
+    if missing:
+        explanation += f"Compétences manquantes : {', '.join(missing)}."
+    if cv_exp < required_exp:
+        explanation += f" Expérience insuffisante ({cv_exp} ans vs {required_exp} requis)."
+    return explanation
+
+
+@dataclass
+class MatchResult:
+    """
+    Détail d'une évaluation (CV, offre), produit par MatchingEngine.evaluate.
+
+    Les sous-scores sont ceux du calcul du score. Les compétences manquantes et
+    l'explication textuelle ne sont calculées qu'à leur première lecture (au plus
+    une fois) : un classement ne les paie que pour les résultats affichés.
+
+    Attributs:
+        score (float): Score global (0-100), identique à compute_match.
+        skill_score (float): Sous-score compétences (0.0 à 1.0).
+        experience_score (float): Sous-score expérience (0.0 à 1.0).
+        location_score (float): Sous-score localisation (0.0 ou 1.0).
+        cv (CV): Candidat évalué.
+        offer (JobOffer): Offre évaluée.
+    """
+    score: float
+    skill_score: float
+    experience_score: float
+    location_score: float
+    cv: CV = field(repr=False, compare=False)
+    offer: JobOffer = field(repr=False, compare=False)
+
+    @property
+    def subscores(self) -> Dict[str, float]:
+        """Sous-scores indexés comme MatchingEngine.weights."""
+        return {"skills": self.skill_score, "experience": self.experience_score, "location": self.location_score}
+
+    @cached_property
+    def missing_skills(self) -> Tuple[str, ...]:
+        """Compétences requises non possédées, dans l'ordre de l'offre."""
+        return _missing_skills(self.cv, self.offer)
+
+    @property
+    def experience_gap(self) -> float:
+        """Années d'expérience manquantes (0.0 si l'exigence est atteinte)."""
+        return max(0.0, self.offer.min_years_experience - self.cv.years_experience)
+
+    @property
+    def location_compatible(self) -> bool:
+        return self.location_score == 1.0
+
+    @cached_property
+    def explanation(self) -> str:
+        """Phrase explicative du score, destinée à un recruteur humain."""
+        return _render_explanation(self.score, self.missing_skills, self.cv.years_experience,
+                                   self.offer.min_years_experience)
+
 
 class MatchingEngine:
     """
@@ -16,14 +130,19 @@ class MatchingEngine:
     Attributs:
         weights (Dict[str, float]): Dictionnaire définissant le poids de chaque critère
                                     dans le calcul final (doit sommer à 1.0).
+        similarity (SkillSimilarityModel, optional): Si fourni, une compétence requise
+                                    non possédée reçoit un crédit partiel égal à sa
+                                    meilleure similarité avec une compétence du candidat.
+                                    Sans modèle, la correspondance est exacte.
     """
-    def __init__(self, weights: Dict[str, float] = None):
+    def __init__(self, weights: Dict[str, float] = None, similarity: Optional["SkillSimilarityModel"] = None):
         # Poids par défaut
         self.weights = weights or {
             "skills": 0.5,
             "experience": 0.3,
             "location": 0.2
         }
+        self.similarity = similarity
     
     def _calculate_skill_score(self, cv_skills: List[str], required_skills: List[str]) -> float:
         """
@@ -43,7 +162,7 @@ class MatchingEngine:
             return 1.0 # Pas de prérequis = 100%
         
         # Méthode simple : Rappel (Recall) -> Combien de requis sont possédés ?
-        # On pourrait utiliser la similarité cosinus ici sur des embeddings
+        # Le crédit partiel par similarité est géré par compute_match (voir self.similarity)
         required_set = set(s.lower() for s in required_skills)
         candidate_set = set(s.lower() for s in cv_skills)
         
@@ -100,10 +219,41 @@ class MatchingEngine:
         Returns:
             float: Score global arrondi, sur une échelle de 0 à 100.
         """
-        s_skill = self._calculate_skill_score(cv.skills, offer.required_skills)
+        return self._weighted_score(*self._subscores(cv, offer))
+
+    def evaluate(self, cv: CV, offer: JobOffer) -> MatchResult:
+        """
+        Évalue une paire (CV, offre) et conserve le détail du calcul.
+
+        Même calcul que compute_match (sous-scores partagés) ; les compétences
+        manquantes et l'explication sont dérivées à la demande du résultat.
+
+        Args:
+            cv (CV): Objet CV du candidat.
+            offer (JobOffer): Objet Offre de mission.
+
+        Returns:
+            MatchResult: Score (identique à compute_match) et sa décomposition.
+        """
+        s_skill, s_exp, s_loc = self._subscores(cv, offer)
+        return MatchResult(self._weighted_score(s_skill, s_exp, s_loc), s_skill, s_exp, s_loc, cv, offer)
+
+    def _subscores(self, cv: CV, offer: JobOffer) -> Tuple[float, float, float]:
+        """Sous-scores (skills, exp, location) d'une paire, entre 0.0 et 1.0."""
+        # Intersection sur les identifiants internés : équivalent à _calculate_skill_score
+        required = offer.required_skill_ids
+        if not required:
+            s_skill = 1.0
+        elif self.similarity is not None:
+            s_skill = self.similarity.credit(required, cv.skill_ids) / len(required)
+        else:
+            s_skill = len(required.intersection(cv.skill_ids)) / len(required)
         s_exp = self._calculate_experience_score(cv.years_experience, offer.min_years_experience)
         s_loc = self._calculate_location_score(cv.location, offer.location, offer.remote_allowed)
-        
+        return s_skill, s_exp, s_loc
+
+    def _weighted_score(self, s_skill: float, s_exp: float, s_loc: float) -> float:
+        """Agrège les sous-scores selon les poids (même ordre d'opérations que combine_subscores)."""
         score = (
             (s_skill * self.weights["skills"]) +
             (s_exp * self.weights["experience"]) +
@@ -112,6 +262,151 @@ class MatchingEngine:
         
         return round(score * 100, 2) # Pourcentage
 
+    def compute_subscore_matrices(
+        self, cvs: Union[Sequence[CV], CandidatePool], offers: Sequence[JobOffer]
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Calcule les sous-scores (skills, expérience, localisation) de toutes les paires.
+
+        Les compétences sont encodées en matrices booléennes (candidats × vocabulaire
+        et offres × vocabulaire) : le nombre de compétences requises possédées est
+        obtenu par un seul produit matriciel. Avec un modèle de similarité, chaque
+        colonne requise porte d'abord le meilleur crédit parmi ses voisins creux.
+
+        Args:
+            cvs (Sequence[CV] | CandidatePool): Candidats (lignes). Un CandidatePool est lu
+                directement dans ses colonnes, sans reconstruire de CV.
+            offers (Sequence[JobOffer]): Offres (colonnes).
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, np.ndarray]: Trois matrices (n_cvs × n_offers)
+                de sous-scores entre 0.0 et 1.0.
+        """
+        # Vocabulaire restreint aux compétences requises : les autres n'influent pas sur le score
+        vocabulary: Dict[int, int] = {}
+        required_sets = [offer.required_skill_ids for offer in offers]
+        for required in required_sets:
+            for skill_id in required:
+                vocabulary.setdefault(skill_id, len(vocabulary))
+
+        # Compétences du candidat à lire : les requises et, avec similarité, leurs voisines
+        owned = dict(vocabulary)
+        if self.similarity is not None:
+            for skill_id in vocabulary:
+                for other, _ in self.similarity.neighbors(skill_id):
+                    owned.setdefault(other, len(owned))
+
+        # float32 pour profiter de BLAS ; les comptages restent exacts.
+        # Les crédits partiels sont sommés en float64, comme dans compute_match.
+        dtype = np.float32 if self.similarity is None else np.float64
+        offer_matrix = np.zeros((len(offers), len(vocabulary)), dtype=dtype)
+        for row, required in enumerate(required_sets):
+            offer_matrix[row, [vocabulary[s] for s in required]] = 1.0
+
+        if isinstance(cvs, CandidatePool):
+            cv_matrix = cvs.skill_matrix([SKILL_VOCABULARY.name(i) for i in owned], dtype=dtype)
+            years = np.asarray(cvs.years_experience, dtype=np.float64)
+            cv_locations = np.asarray(cvs.location_codes, dtype=np.int8)
+        else:
+            cv_matrix = np.zeros((len(cvs), len(owned)), dtype=dtype)
+            for row, cv in enumerate(cvs):
+                columns = [owned[i] for i in cv.skill_ids if i in owned]
+                cv_matrix[row, columns] = 1.0
+            years = np.fromiter((cv.years_experience for cv in cvs), dtype=np.float64, count=len(cvs))
+            cv_locations = np.fromiter((cv.location_code for cv in cvs), dtype=np.int8, count=len(cvs))
+        if self.similarity is not None:
+            cv_matrix = self._skill_credit_matrix(cv_matrix, vocabulary, owned)
+
+        n_required = np.array([len(r) for r in required_sets], dtype=np.float64)
+        # Expérience et localisation ne dépendent que de quelques valeurs distinctes parmi les
+        # offres : une colonne est calculée par valeur, puis recopiée pour chaque offre
+        min_years, experience_columns = np.unique(
+            np.array([o.min_years_experience for o in offers], dtype=np.float64), return_inverse=True)
+        places, location_columns = np.unique(
+            np.array([(o.location_code, o.remote_allowed) for o in offers], dtype=np.int8).reshape(-1, 2),
+            axis=0, return_inverse=True)
+        offer_locations, remote_allowed = places[:, 0], places[:, 1].astype(bool)
+
+        match_counts = (cv_matrix @ offer_matrix.T).astype(np.float64)
+        return (
+            self._skill_score_matrix(match_counts, n_required),
+            _spread_columns(self._experience_score_matrix(years, min_years), experience_columns),
+            _spread_columns(self._location_score_matrix(cv_locations, offer_locations, remote_allowed),
+                            location_columns),
+        )
+
+    def _skill_credit_matrix(
+        self, cv_matrix: np.ndarray, vocabulary: Dict[int, int], owned: Dict[int, int]
+    ) -> np.ndarray:
+        # credit[i, k] = meilleure similarité entre la compétence requise k et celles du candidat i
+        credit = np.zeros((cv_matrix.shape[0], len(vocabulary)), dtype=np.float64)
+        for skill_id, k in vocabulary.items():
+            for other, value in self.similarity.neighbors(skill_id):
+                np.maximum(credit[:, k], cv_matrix[:, owned[other]] * value, out=credit[:, k])
+        return credit
+
+    @staticmethod
+    def _skill_score_matrix(match_counts: np.ndarray, n_required: np.ndarray) -> np.ndarray:
+        # Même règle que _calculate_skill_score : pas de prérequis = 100%
+        with np.errstate(divide="ignore", invalid="ignore"):
+            recall = match_counts / n_required[np.newaxis, :]
+        np.copyto(recall, 1.0, where=n_required[np.newaxis, :] == 0)
+        return recall
+
+    @staticmethod
+    def _experience_score_matrix(years: np.ndarray, min_years: np.ndarray) -> np.ndarray:
+        cv_exp = years[:, np.newaxis]
+        required_exp = min_years[np.newaxis, :]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ratio = cv_exp / required_exp
+            np.maximum(0.0, ratio, out=ratio)
+        np.copyto(ratio, 1.0, where=cv_exp >= required_exp)
+        return ratio
+
+    @staticmethod
+    def _location_score_matrix(
+        cv_locations: np.ndarray, offer_locations: np.ndarray, remote_allowed: np.ndarray
+    ) -> np.ndarray:
+        same_place = cv_locations[:, np.newaxis] == offer_locations[np.newaxis, :]
+        remote_ok = (cv_locations[:, np.newaxis] == _REMOTE_CODE) & remote_allowed[np.newaxis, :]
+        return (same_place | remote_ok).astype(np.float64)
+
+    def combine_subscores(self, s_skill: np.ndarray, s_exp: np.ndarray, s_loc: np.ndarray) -> np.ndarray:
+        """
+        Agrège des matrices de sous-scores en scores globaux (0-100), arrondis comme compute_match.
+
+        Les opérations sont effectuées dans le même ordre que compute_match afin
+        d'obtenir des résultats identiques au bit près.
+        """
+        score = s_skill * self.weights["skills"]
+        weighted = s_exp * self.weights["experience"]
+        score += weighted
+        np.multiply(s_loc, self.weights["location"], out=weighted)
+        score += weighted
+        score *= 100
+        return _round_scores(score)
+
+    def compute_match_matrix(
+        self, cvs: Union[Sequence[CV], CandidatePool], offers: Sequence[JobOffer]
+    ) -> np.ndarray:
+        """
+        Calcule en lot la matrice des scores de compatibilité candidats × offres.
+
+        Équivalent vectorisé de compute_match : matrix[i, j] == compute_match(cvs[i], offers[j]).
+
+        Args:
+            cvs (Sequence[CV] | CandidatePool): Liste ou vivier colonne des candidats.
+            offers (Sequence[JobOffer]): Liste des offres.
+
+        Returns:
+            np.ndarray: Matrice (n_cvs × n_offers) de scores sur une échelle de 0 à 100.
+        """
+        registry = get_registry()
+        with registry.timer("pipeline_stage_seconds", stage="matrix_scoring"):
+            scores = self.combine_subscores(*self.compute_subscore_matrices(cvs, offers))
+        registry.counter("pairs_scored_total", "Paires (CV, offre) évaluées").inc(scores.size)
+        return scores
+
     def explain_score(self, cv: CV, offer: JobOffer, score: float) -> str:
         """
         Génère une explication textuelle lisible pour un recruteur humain.
@@ -127,20 +422,8 @@ class MatchingEngine:
         Returns:
             str: Phrase explicative du score.
         """
-        missing = set(offer.required_skills) - set(cv.skills)
-        explanation = f"Score : {score}/100. "
-        
-        if score > 80:
-            explanation += "Excellent match. "
-        elif score > 50:
-            explanation += "Match correct. "
-        else:
-            explanation += "Match faible. "
-            
-        if missing:
-            explanation += f"Compétences manquantes : {', '.join(missing)}."
-        if cv.years_experience < offer.min_years_experience:
-            explanation += f" Expérience insuffisante ({cv.years_experience} ans vs {offer.min_years_experience} requis)."
-            
-        return explanation
+        # Aucun sous-score n'est recalculé : l'explication ne dépend que du score et des écarts.
+        # Un résultat d'evaluate() porte déjà la même explication (MatchResult.explanation).
+        return _render_explanation(score, _missing_skills(cv, offer), cv.years_experience,
+                                   offer.min_years_experience)
 
@@ -0,0 +1,208 @@
+# ==========================================
+# Module B bis: Fuzzy Skill Normalization (RapidFuzz)
+# ==========================================
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from rapidfuzz import fuzz, process
+from rapidfuzz.distance import OSA
+
+# Variantes connues qu'une distance d'édition ne peut pas rapprocher (abréviations, suffixes)
+DEFAULT_ALIASES: Dict[str, str] = {
+    "reactjs": "react",
+    "react.js": "react",
+    "sklearn": "scikit-learn",
+    "postgres": "postgresql",
+    "js": "javascript",
+    "ml": "machine learning",
+    "k8s": "kubernetes",
+    "golang": "go",
+}
+
+_SEPARATORS = re.compile(r"[\s_\-./]+")
+
+# Requêtes comparées à la taxonomie par appel à cdist : borne la matrice de scores
+# (256 × 50 000 compétences ≈ 50 Mo), quel que soit le nombre de mots d'un document
+_CDIST_CHUNK = 256
+
+
+def _compact(skill: str) -> str:
+    # "scikit learn", "scikit-learn" et "Scikit_Learn" partagent la même clé
+    return _SEPARATORS.sub("", skill.lower())
+
+
+def _max_typos(length: int) -> int:
+    """Fautes de frappe tolérées dans un mot de texte libre, selon sa longueur."""
+    if length < 6:
+        return 0
+    return 1 if length < 12 else 2
+
+
+def _is_typo(key: str, skill_key: str) -> bool:
+    """
+    Vrai si `key` (mot de texte libre, compacté) est une faute de frappe plausible de `skill_key`.
+
+    Plus strict que le score RapidFuzz : nombre de modifications (transposition
+    comprise) borné selon la longueur, même première lettre, et ni mot dérivé
+    ("pythonic") ni mot contenu dans la compétence ("trust" pour "rust").
+    """
+    if key == skill_key:
+        return True
+    if key[0] != skill_key[0] or skill_key in key or key in skill_key:
+        return False
+    return OSA.distance(key, skill_key) <= _max_typos(min(len(key), len(skill_key)))
+
+
+class SkillNormalizer:
+    """
+    Ramène les compétences brutes (fautes de frappe, variantes d'écriture) aux
+    entrées canoniques de la taxonomie.
+
+    Un libellé est d'abord cherché dans la table d'alias (entrées canoniques,
+    alias déclarés, puis variantes déjà résolues). Les libellés inconnus sont
+    résolus ensemble par un seul appel à `rapidfuzz.process.cdist`, puis mémorisés
+    dans une table LRU bornée : une variante déjà vue ne coûte qu'une lecture de
+    dictionnaire. Un libellé sans correspondance suffisante est conservé tel quel.
+
+    Attributs:
+        taxonomy (List[str]): Compétences canoniques (normalisées).
+        aliases (Dict[str, str]): Alias déclarés (variante → compétence canonique).
+        score_cutoff (float): Score RapidFuzz minimal (0-100) pour accepter une correspondance.
+        min_length (int): Longueur minimale d'un libellé pour une recherche approchée
+                          (les libellés courts, ex: "go", ne sont résolus qu'exactement).
+        max_aliases (int): Nombre maximal de variantes mémorisées.
+    """
+    def __init__(
+        self,
+        taxonomy: Iterable[str],
+        aliases: Optional[Mapping[str, str]] = None,
+        score_cutoff: float = 80.0,
+        min_length: int = 4,
+        max_aliases: int = 100_000,
+    ):
+        self.taxonomy = list(dict.fromkeys(skill.lower().strip() for skill in taxonomy))
+        self.aliases = dict(DEFAULT_ALIASES if aliases is None else aliases)
+        self.score_cutoff = score_cutoff
+        self.min_length = min_length
+        self.max_aliases = max_aliases
+        self._keys = [_compact(skill) for skill in self.taxonomy]
+        # Table fixe (canonique et alias déclarés) et table LRU des variantes résolues
+        self._fixed: Dict[str, str] = {skill: skill for skill in self.taxonomy}
+        self._fixed.update((alias.lower().strip(), target) for alias, target in self.aliases.items())
+        self._resolved: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> str:
+        """Empreinte de la configuration (taxonomie, alias, seuils), pour invalider les caches."""
+        config = [repr(self.score_cutoff), repr(self.min_length)] + self.taxonomy
+        config += [f"{alias}={target}" for alias, target in sorted(self.aliases.items())]
+        return hashlib.sha256("\n".join(config).encode("utf-8")).hexdigest()[:16]
+
+    def __len__(self) -> int:
+        """Nombre de variantes actuellement mémorisées."""
+        return len(self._resolved)
+
+    def __getstate__(self) -> dict:
+        # La table LRU et le verrou ne voyagent pas vers les processus de parsing
+        state = self.__dict__.copy()
+        state["_resolved"] = OrderedDict()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def match_all(self, skills: Iterable[str]) -> List[Optional[str]]:
+        """
+        Résout chaque libellé vers sa compétence canonique.
+
+        Args:
+            skills (Iterable[str]): Libellés bruts.
+
+        Returns:
+            List[Optional[str]]: Compétence canonique de chaque libellé, ou None si
+                                 aucune entrée de la taxonomie n'est assez proche.
+        """
+        names = [skill.lower().strip() for skill in skills]
+        results: List[Optional[str]] = [None] * len(names)
+        pending: Dict[str, List[int]] = {}
+        with self._lock:
+            for i, name in enumerate(names):
+                canonical = self._fixed.get(name)
+                if canonical is not None:
+                    results[i] = canonical
+                elif name in self._resolved:
+                    self._resolved.move_to_end(name)
+                    results[i] = self._resolved[name]
+                else:
+                    pending.setdefault(name, []).append(i)
+        if not pending:
+            return results
+
+        resolved = self._resolve(list(pending))
+        with self._lock:
+            for name, canonical in resolved.items():
+                self._resolved[name] = canonical
+                for i in pending[name]:
+                    results[i] = canonical
+            while len(self._resolved) > self.max_aliases:
+                self._resolved.popitem(last=False)
+        return results
+
+    def match_tokens(self, tokens: Iterable[str]) -> List[Optional[str]]:
+        """
+        Résout les mots (et paires de mots) d'un texte libre, avec une règle plus stricte.
+
+        Dans un texte, la plupart des mots ne sont pas des compétences : un mot
+        proche au sens du score RapidFuzz ("reach", "trust") n'est retenu que s'il
+        s'agit d'une faute de frappe plausible de la compétence (voir _is_typo).
+        Les entrées canoniques et les alias déclarés restent reconnus exactement.
+
+        Args:
+            tokens (Iterable[str]): Mots ou paires de mots du texte.
+
+        Returns:
+            List[Optional[str]]: Compétence canonique de chaque mot, ou None.
+        """
+        tokens = [token.lower().strip() for token in tokens]
+        results = self.match_all(tokens)
+        for i, (token, canonical) in enumerate(zip(tokens, results)):
+            if canonical is not None and token not in self._fixed and not _is_typo(
+                    _compact(token), _compact(canonical)):
+                results[i] = None
+        return results
+
+    def _resolve(self, names: List[str]) -> Dict[str, Optional[str]]:
+        resolved: Dict[str, Optional[str]] = dict.fromkeys(names)
+        queries = [name for name in names if len(_compact(name)) >= self.min_length]
+        if not queries or not self._keys:
+            return resolved
+        # Matrices de scores (requêtes × taxonomie) par blocs de requêtes, calculées en parallèle
+        for start in range(0, len(queries), _CDIST_CHUNK):
+            chunk = queries[start:start + _CDIST_CHUNK]
+            scores = process.cdist([_compact(q) for q in chunk], self._keys, scorer=fuzz.ratio,
+                                   score_cutoff=self.score_cutoff, workers=-1)
+            best = scores.argmax(axis=1)
+            for row, name in enumerate(chunk):
+                column = best[row]
+                if scores[row, column] >= self.score_cutoff:
+                    resolved[name] = self.taxonomy[column]
+        return resolved
+
+    def normalize_all(self, skills: Iterable[str]) -> List[str]:
+        """
+        Normalise une liste de compétences : les variantes reconnues sont remplacées
+        par la compétence canonique, les autres sont gardées en minuscule.
+        """
+        names = [skill.lower().strip() for skill in skills]
+        return [canonical or name for name, canonical in zip(names, self.match_all(names))]
+
+    def normalize(self, skill: str) -> str:
+        """Normalise une seule compétence (voir normalize_all)."""
+        return self.normalize_all([skill])[0]
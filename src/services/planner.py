@@ -0,0 +1,179 @@
+# ==========================================
+# Module C: Hard-filter Query Planner
+# ==========================================
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from src.models import LOCATION_CODES, CV, JobOffer, LocationEnum
+from src.services.pool import CandidatePool
+from src.utils.metrics import get_registry
+
+_REMOTE_CODE = LOCATION_CODES[LocationEnum.REMOTE]
+
+# En deçà d'un survivant sur _COMPACT_RATIO, les colonnes sont compactées avant le filtre suivant
+_COMPACT_RATIO = 8
+
+
+class CandidateColumns(NamedTuple):
+    """Colonnes des attributs filtrables d'une liste de candidats (alignées sur la liste)."""
+    location_codes: np.ndarray
+    years_experience: np.ndarray
+    availability: np.ndarray
+
+    @classmethod
+    def of(cls, candidates: Union[Sequence[CV], CandidatePool, "CandidateColumns"]) -> "CandidateColumns":
+        if isinstance(candidates, CandidateColumns):
+            return candidates
+        if isinstance(candidates, CandidatePool):
+            return cls(candidates.location_codes, candidates.years_experience, candidates.availability)
+        n = len(candidates)
+        return cls(
+            np.fromiter((cv.location_code for cv in candidates), dtype=np.int8, count=n),
+            np.fromiter((cv.years_experience for cv in candidates), dtype=np.float64, count=n),
+            np.fromiter((cv.availability_immediate for cv in candidates), dtype=bool, count=n),
+        )
+
+    def take(self, positions: np.ndarray) -> "CandidateColumns":
+        return CandidateColumns(*(column[positions] for column in self))
+
+
+# Un filtre renvoie le masque des candidats admis
+HardFilter = Callable[[CandidateColumns], np.ndarray]
+
+
+def _filters_for(offer: JobOffer) -> List[Tuple[str, HardFilter]]:
+    """Filtres vectorisés correspondant aux contraintes déclarées par l'offre."""
+    constraints = offer.hard_constraints
+    filters: List[Tuple[str, HardFilter]] = []
+    if not constraints:
+        return filters
+    if constraints.location_compatible:
+        code, remote_allowed = offer.location_code, offer.remote_allowed
+
+        def location(columns: CandidateColumns) -> np.ndarray:
+            # Même règle que MatchingEngine._calculate_location_score
+            admitted = columns.location_codes == code
+            if remote_allowed:
+                admitted |= columns.location_codes == _REMOTE_CODE
+            return admitted
+        filters.append(("location", location))
+    if constraints.min_years_experience is not None:
+        floor = constraints.min_years_experience
+        filters.append(("experience", lambda columns: columns.years_experience >= floor))
+    if constraints.availability_immediate:
+        # Copie : seul filtre, le masque serait renvoyé tel quel et la colonne appartient au vivier
+        filters.append(("availability", lambda columns: columns.availability.copy()))
+    return filters
+
+
+@dataclass
+class QueryStats:
+    """
+    Bilan du filtrage éliminatoire d'une requête.
+
+    Attributs:
+        offer_id (str): Offre concernée.
+        candidates (int): Candidats présentés au planificateur.
+        removed (Dict[str, int]): Candidats écartés par chaque filtre, dans l'ordre d'évaluation.
+        scored (int): Candidats restants, transmis au MatchingEngine.
+    """
+    offer_id: str
+    candidates: int
+    removed: Dict[str, int] = field(default_factory=dict)
+    scored: int = 0
+
+    def merge(self, other: "QueryStats") -> None:
+        """Cumule le bilan d'une autre partie des candidats (partition, bloc) pour la même offre."""
+        self.candidates += other.candidates
+        self.scored += other.scored
+        for name, removed in other.removed.items():
+            self.removed[name] = self.removed.get(name, 0) + removed
+
+
+class HardFilterPlanner:
+    """
+    Applique les contraintes éliminatoires d'une offre avant le scoring.
+
+    Chaque contrainte est un masque booléen vectorisé sur les colonnes du vivier.
+    La sélectivité de chaque filtre est estimée sur un échantillon régulier
+    (au plus `sample_size` candidats) ; les filtres sont ensuite appliqués du
+    plus sélectif au moins sélectif. Les masques sont combinés sur les colonnes
+    complètes tant que la sélection reste large ; dès qu'elle devient étroite,
+    les filtres suivants ne lisent plus que les survivants. Seuls les candidats
+    restants sont notés par le MatchingEngine.
+
+    Attributs:
+        sample_size (int): Taille de l'échantillon d'estimation de la sélectivité.
+        last_query_stats (QueryStats, optional): Bilan de la dernière requête filtrée.
+    """
+    def __init__(self, sample_size: int = 1024):
+        if sample_size < 1:
+            raise ValueError("sample_size must be >= 1")
+        self.sample_size = sample_size
+        self.last_query_stats: Optional[QueryStats] = None
+
+    def plan(self, offer: JobOffer, columns: CandidateColumns) -> List[Tuple[str, HardFilter]]:
+        """
+        Ordonne les filtres de l'offre par taux d'admission estimé croissant.
+
+        Returns:
+            List[Tuple[str, HardFilter]]: Filtres (nom, masque) dans l'ordre d'évaluation.
+        """
+        filters = _filters_for(offer)
+        n = len(columns.years_experience)
+        if len(filters) < 2 or n == 0:
+            return filters
+        sample = columns.take(slice(None, None, max(1, n // self.sample_size)))
+        # Tri stable : à sélectivité égale, l'ordre de déclaration est conservé
+        return sorted(filters, key=lambda f: np.count_nonzero(f[1](sample)))
+
+    def apply(
+        self, offer: JobOffer, candidates: Union[Sequence[CV], CandidatePool, CandidateColumns]
+    ) -> Optional[np.ndarray]:
+        """
+        Masque des candidats qui satisfont toutes les contraintes de l'offre.
+
+        Args:
+            offer (JobOffer): Offre (ses hard_constraints).
+            candidates (Sequence[CV] | CandidatePool | CandidateColumns): Candidats à filtrer, ou
+                leurs colonnes déjà extraites (réutilisables pour plusieurs offres).
+
+        Returns:
+            Optional[np.ndarray]: Masque booléen aligné sur les candidats, ou None si l'offre
+                                  ne déclare aucune contrainte (aucun candidat écarté).
+        """
+        n = len(candidates.years_experience) if isinstance(candidates, CandidateColumns) else len(candidates)
+        stats = self.last_query_stats = QueryStats(offer_id=offer.id, candidates=n, scored=n)
+        if not offer.hard_constraints:
+            return None
+
+        columns = CandidateColumns.of(candidates)
+        registry = get_registry()
+        with registry.timer("pipeline_stage_seconds", stage="hard_filters"):
+            remaining, admitted, survivors = n, None, None
+            for name, admits in self.plan(offer, columns):
+                mask = admits(columns)
+                if survivors is None:
+                    admitted = mask if admitted is None else admitted & mask
+                    kept = int(np.count_nonzero(admitted))
+                    if kept * _COMPACT_RATIO < n:
+                        # Sélection devenue étroite : les filtres suivants ne lisent que les survivants
+                        survivors = np.flatnonzero(admitted)
+                        columns = columns.take(survivors)
+                else:
+                    survivors, columns = survivors[mask], columns.take(mask)
+                    kept = len(survivors)
+                stats.removed[name] = remaining - kept
+                remaining = kept
+            if survivors is not None:
+                admitted = np.zeros(n, dtype=bool)
+                admitted[survivors] = True
+        stats.scored = remaining
+
+        filtered = registry.counter("candidates_filtered_total", "Candidats écartés par les contraintes éliminatoires")
+        for name, removed in stats.removed.items():
+            filtered.inc(removed, filter=name)
+        return admitted
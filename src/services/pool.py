@@ -0,0 +1,196 @@
+# ==========================================
+# Module C: Columnar Candidate Pool (Memory-mapped)
+# ==========================================
+
+import json
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from src.models import LOCATIONS, LOCATION_CODES, CV
+
+# Version du format disque (à incrémenter en cas de changement de colonnes)
+POOL_FORMAT_VERSION = 1
+
+_COLUMNS = ("ids", "names", "years_experience", "location_codes", "availability", "skill_bitmap")
+
+
+class CandidatePool:
+    """
+    Vivier de candidats stocké par colonnes dans des tableaux NumPy.
+
+    Chaque attribut du CV est une colonne (identifiants, années d'expérience,
+    codes de localisation, disponibilité) et les compétences forment une matrice
+    de bits compactée (une ligne par candidat, un bit par compétence du
+    vocabulaire du vivier). Sauvegardé sur disque, le vivier est rechargé en
+    mémoire partagée (memory-map) : plusieurs processus d'un même hôte lisent la
+    même copie physique et le démarrage est quasi instantané.
+
+    Attributs:
+        ids (np.ndarray): Identifiants des candidats.
+        names (np.ndarray): Noms des candidats.
+        years_experience (np.ndarray): Années d'expérience (float64).
+        location_codes (np.ndarray): Codes de localisation (voir models.LOCATION_CODES).
+        availability (np.ndarray): Disponibilité immédiate (bool).
+        skill_bitmap (np.ndarray): Matrice de bits (n × ceil(len(vocabulary) / 8)).
+        vocabulary (List[str]): Compétences correspondant aux colonnes de bits.
+    """
+    def __init__(
+        self,
+        ids: np.ndarray,
+        names: np.ndarray,
+        years_experience: np.ndarray,
+        location_codes: np.ndarray,
+        availability: np.ndarray,
+        skill_bitmap: np.ndarray,
+        vocabulary: Sequence[str],
+    ):
+        size = len(ids)
+        if any(len(column) != size for column in (names, years_experience, location_codes, availability, skill_bitmap)):
+            raise ValueError("All pool columns must have the same length")
+        self.ids = ids
+        self.names = names
+        self.years_experience = years_experience
+        self.location_codes = location_codes
+        self.availability = availability
+        self.skill_bitmap = skill_bitmap
+        self.vocabulary = list(vocabulary)
+        self._skill_columns: Dict[str, int] = {skill: j for j, skill in enumerate(self.vocabulary)}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, position: int) -> CV:
+        """Reconstruit le CV situé à une position donnée du vivier."""
+        row = np.unpackbits(self.skill_bitmap[position], count=len(self.vocabulary))
+        return CV(
+            id=str(self.ids[position]),
+            name=str(self.names[position]),
+            skills=[self.vocabulary[j] for j in np.flatnonzero(row)],
+            years_experience=float(self.years_experience[position]),
+            location=LOCATIONS[self.location_codes[position]],
+            availability_immediate=bool(self.availability[position])
+        )
+
+    def __iter__(self) -> Iterator[CV]:
+        for position in range(len(self)):
+            yield self[position]
+
+    def to_cvs(self) -> List[CV]:
+        """Convertit le vivier en liste de CVs."""
+        return list(self)
+
+    @classmethod
+    def from_cvs(cls, cvs: Iterable[CV]) -> "CandidatePool":
+        """
+        Construit un vivier colonne à partir de CVs.
+
+        Args:
+            cvs (Iterable[CV]): Candidats à stocker.
+
+        Returns:
+            CandidatePool: Vivier en mémoire.
+        """
+        cvs = list(cvs)
+        vocabulary: Dict[str, int] = {}
+        rows = []
+        for cv in cvs:
+            rows.append([vocabulary.setdefault(skill, len(vocabulary)) for skill in cv.skills])
+
+        # Bits écrits directement dans le tableau compacté (ordre de np.packbits : bit de poids
+        # fort en premier) : aucune matrice booléenne n_candidats × vocabulaire n'est construite
+        skill_bitmap = np.zeros((len(cvs), (len(vocabulary) + 7) // 8), dtype=np.uint8)
+        positions = np.repeat(np.arange(len(rows), dtype=np.int64), [len(columns) for columns in rows])
+        columns = np.fromiter((j for row in rows for j in row), dtype=np.int64, count=len(positions))
+        np.bitwise_or.at(skill_bitmap, (positions, columns >> 3),
+                         np.left_shift(1, 7 - (columns & 7)).astype(np.uint8))
+
+        return cls(
+            ids=np.array([cv.id for cv in cvs], dtype=str),
+            names=np.array([cv.name for cv in cvs], dtype=str),
+            years_experience=np.array([cv.years_experience for cv in cvs], dtype=np.float64),
+            location_codes=np.array([LOCATION_CODES[cv.location] for cv in cvs], dtype=np.int8),
+            availability=np.array([cv.availability_immediate for cv in cvs], dtype=bool),
+            skill_bitmap=skill_bitmap,
+            vocabulary=list(vocabulary),
+        )
+
+    def skill_matrix(self, skills: Sequence[str], dtype=np.float32) -> np.ndarray:
+        """
+        Décompacte les colonnes de bits des compétences demandées.
+
+        Args:
+            skills (Sequence[str]): Compétences (normalisées) à extraire.
+            dtype: Type du tableau produit (float32 par défaut, pour les produits matriciels).
+
+        Returns:
+            np.ndarray: Matrice (n_candidats × len(skills)) de 0/1. Une compétence
+                        absente du vocabulaire du vivier donne une colonne nulle.
+        """
+        matrix = np.zeros((len(self), len(skills)), dtype=dtype)
+        for k, skill in enumerate(skills):
+            j = self._skill_columns.get(skill)
+            if j is not None:
+                matrix[:, k] = (self.skill_bitmap[:, j >> 3] >> (7 - (j & 7))) & 1
+        return matrix
+
+    def slice(self, start: int, stop: int) -> "CandidatePool":
+        """Renvoie une vue (sans copie) sur les candidats [start, stop)."""
+        return CandidatePool(
+            ids=self.ids[start:stop],
+            names=self.names[start:stop],
+            years_experience=self.years_experience[start:stop],
+            location_codes=self.location_codes[start:stop],
+            availability=self.availability[start:stop],
+            skill_bitmap=self.skill_bitmap[start:stop],
+            vocabulary=self.vocabulary,
+        )
+
+    def take(self, positions: np.ndarray) -> "CandidatePool":
+        """Renvoie un vivier (copie) restreint aux positions données, dans leur ordre."""
+        # np.take est sensiblement plus rapide que l'indexation avancée sur les lignes de la matrice de bits
+        return CandidatePool(
+            *(np.take(getattr(self, column), positions, axis=0) for column in _COLUMNS),
+            vocabulary=self.vocabulary,
+        )
+
+    def save(self, directory: str) -> None:
+        """
+        Enregistre le vivier (un fichier .npy par colonne et un fichier meta.json).
+
+        Args:
+            directory (str): Répertoire de destination (créé si besoin).
+        """
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for column in _COLUMNS:
+            np.save(path / f"{column}.npy", np.ascontiguousarray(getattr(self, column)))
+        meta = {"format_version": POOL_FORMAT_VERSION, "size": len(self), "vocabulary": self.vocabulary}
+        with open(path / "meta.json", "w", encoding="utf-8") as f:
+            json.dump(meta, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> "CandidatePool":
+        """
+        Recharge un vivier sauvegardé.
+
+        Args:
+            directory (str): Répertoire produit par save().
+            mmap (bool, optional): Projeter les colonnes en mémoire (lecture seule, partagée
+                                   entre processus) au lieu de les copier.
+
+        Returns:
+            CandidatePool: Le vivier.
+
+        Raises:
+            ValueError: Si la version du format ne correspond pas.
+        """
+        path = Path(directory)
+        with open(path / "meta.json", "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta["format_version"] != POOL_FORMAT_VERSION:
+            raise ValueError(f"Unsupported pool format version: {meta['format_version']}")
+        mmap_mode: Optional[str] = "r" if mmap else None
+        columns = {column: np.load(path / f"{column}.npy", mmap_mode=mmap_mode) for column in _COLUMNS}
+        return cls(vocabulary=meta["vocabulary"], **columns)
@@ -2,9 +2,119 @@
 # 4. Module C: Recommendation System
 # ==========================================
 
-from src.services.matcher import MatchingEngine
-from src.models import JobOffer
-from typing import List, Dict
+from src.services.matcher import MatchingEngine, MatchResult
+from src.services.index import CandidateIndex, OfferIndex
+from src.services.lsh import MinHashLSHIndex
+from src.services.planner import CandidateColumns, HardFilterPlanner, QueryStats
+from src.services.pool import CandidatePool
+from src.services.score_table import ScoreTable
+from src.models import CV, JobOffer
+from src.utils.metrics import get_registry
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple, Union
+import heapq
+import numpy as np
+
+
+def _ranking_key(match: MatchResult) -> Tuple[float, str]:
+    """Clé de classement : score décroissant, puis cv_id croissant (déterministe)."""
+    return (-match.score, match.cv.id)
+
+
+def _offer_ranking_key(match: MatchResult) -> Tuple[float, str]:
+    """Clé de classement des offres : score décroissant, puis identifiant d'offre croissant."""
+    return (-match.score, match.offer.id)
+
+
+def _top_k_positions(scores: np.ndarray, ids: np.ndarray, top_k: int) -> List[int]:
+    """
+    Sélectionne les positions des top_k meilleurs scores via argpartition (O(n)).
+
+    Tous les ex-aequo du k-ième score sont conservés avant le tri final, pour
+    que le départage par identifiant soit identique à celui de recommend_candidates.
+    """
+    k = min(top_k, len(scores))
+    if k <= 0:
+        return []
+    kth_score = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    survivors = np.flatnonzero(scores >= kth_score)
+    # Tri lexicographique vectorisé (score décroissant, puis identifiant) : les ex-aequo
+    # peuvent être nombreux, et l'accès élément par élément à un memmap est coûteux
+    ranked = survivors[np.lexsort((np.asarray(ids[survivors]), -scores[survivors]))]
+    return [int(position) for position in ranked[:k]]
+
+
+def _candidate_chunks(
+    candidates: Union[CandidatePool, Iterable[CV]], chunk_size: int
+) -> Iterator[Tuple[Union[CandidatePool, List[CV]], int]]:
+    """Découpe une source de candidats en blocs (bloc, position du premier candidat du bloc)."""
+    if isinstance(candidates, CandidatePool):
+        # Vues sans copie : sur un vivier projeté en mémoire, chaque bloc n'est lu qu'une fois
+        for start in range(0, len(candidates), chunk_size):
+            yield candidates.slice(start, start + chunk_size), start
+        return
+    chunk: List[CV] = []
+    offset = 0
+    for cv in candidates:
+        chunk.append(cv)
+        if len(chunk) == chunk_size:
+            yield chunk, offset
+            offset += len(chunk)
+            chunk = []
+    if chunk:
+        yield chunk, offset
+
+
+# (score, cv_id, CV ou position dans le vivier) : un candidat du top-k courant d'une offre
+_Hit = Tuple[float, str, Union[CV, int]]
+
+
+def _hit_key(hit: _Hit) -> Tuple[float, str]:
+    score, cv_id, _ = hit
+    return (-score, cv_id)
+
+
+# Plus petit seuil fini : un candidat écarté (score -inf) n'est jamais retenu
+_LOWEST_SCORE = np.finfo(np.float64).min
+
+
+def _chunk_contenders(
+    scores: np.ndarray, ids: np.ndarray, floors: np.ndarray, floor_ids: np.ndarray, top_k: int
+) -> Iterator[Tuple[int, np.ndarray]]:
+    """
+    Positions d'un bloc susceptibles d'entrer dans le top-k courant de chaque offre.
+
+    Sélection vectorisée sur toute la matrice (candidats × offres) : un candidat
+    n'est examiné que s'il précède le k-ième résultat courant de l'offre
+    (`floors`, `floor_ids`). Tant que ce top-k est incomplet (-inf), le seuil est
+    le k-ième score du bloc. Au plus top_k positions par offre, classées comme
+    _top_k_positions.
+    """
+    thresholds = floors.copy()
+    incomplete = np.flatnonzero(floors == -np.inf)
+    if len(incomplete):
+        k = min(top_k, len(scores))
+        thresholds[incomplete] = -np.partition(-scores[:, incomplete], k - 1, axis=0)[k - 1]
+    np.maximum(thresholds, _LOWEST_SCORE, out=thresholds)
+
+    rows, columns = np.nonzero(scores >= thresholds)
+    # Ex-aequo du k-ième résultat courant : seul un identifiant plus petit peut le déloger
+    tied = np.flatnonzero(scores[rows, columns] == floors[columns])
+    if len(tied):
+        beaten = np.asarray(ids[rows[tied]], dtype=object) >= floor_ids[columns[tied]]
+        keep = np.ones(len(rows), dtype=bool)
+        keep[tied[beaten]] = False
+        rows, columns = rows[keep], columns[keep]
+
+    order = np.argsort(columns, kind="stable")
+    rows, columns = rows[order], columns[order]
+    bounds = np.searchsorted(columns, np.arange(scores.shape[1] + 1))
+    for j in np.flatnonzero(np.diff(bounds)):
+        positions = rows[bounds[j]:bounds[j + 1]]
+        if len(positions) > top_k:
+            # Ex-aequo nombreux : départage vectorisé avant de repasser en Python
+            ranked = np.lexsort((np.asarray(ids[positions]), -scores[positions, j]))
+            positions = positions[ranked[:top_k]]
+        yield int(j), positions
 
 
 class RecommendationSystem:
@@ -15,49 +125,242 @@ class RecommendationSystem:
     calcule leur score de compatibilité via le MatchingEngine, puis
     les classe par ordre de pertinence décroissante.
 
+    Les contraintes éliminatoires d'une offre (JobOffer.hard_constraints) sont
+    appliquées par le planificateur avant tout calcul de score.
+
     Attributs:
         matcher (MatchingEngine): Instance du moteur de matching utilisée pour le scoring.
+        planner (HardFilterPlanner): Planificateur des filtres éliminatoires.
+        last_batch_stats (Dict[str, QueryStats]): Bilan du filtrage par offre du dernier
+                                                  appel à recommend_for_offers.
     """
-    def __init__(self, matcher: MatchingEngine):
+    def __init__(self, matcher: MatchingEngine, planner: Optional[HardFilterPlanner] = None):
         self.matcher = matcher
+        self.planner = planner or HardFilterPlanner()
+        self.last_batch_stats: Dict[str, QueryStats] = {}
 
-    def recommend_candidates(self, offer: JobOffer, candidates: List[CV], top_k: int = 5) -> List[Dict]:
+    @property
+    def last_query_stats(self) -> Optional[QueryStats]:
+        """Bilan du filtrage de la dernière recommandation de candidats (voir HardFilterPlanner)."""
+        return self.planner.last_query_stats
+
+    def recommend_candidates(
+        self, offer: JobOffer,
+        candidates: Union[List[CV], CandidateIndex, MinHashLSHIndex, CandidatePool, ScoreTable],
+        top_k: int = 5
+    ) -> List[Dict]:
         """
         Génère une liste recommandée des meilleurs candidats pour une offre donnée.
 
         Le processus inclut :
-        1. Calcul du score de matching pour chaque candidat.
-        2. Génération d'une explication textuelle.
-        3. Tri décroissant par score.
-        4. Limitation aux top_k résultats.
+        1. Exclusion des candidats qui ne satisfont pas les contraintes éliminatoires de l'offre.
+        2. Calcul du score de matching pour chaque candidat restant.
+        3. Sélection des top_k via un tas borné (les égalités sont départagées par cv_id).
+        4. Génération d'une explication textuelle pour les seuls candidats retenus.
 
         Args:
             offer (JobOffer): L'offre pour laquelle on cherche des candidats.
-            candidates (List[CV]): La liste de tous les candidats potentiels.
+            candidates (List[CV] | CandidateIndex | MinHashLSHIndex | CandidatePool | ScoreTable):
+                La liste de tous les candidats potentiels, un index dont seuls les candidats
+                plausibles pour l'offre sont évalués (exact, ou approximatif par LSH), un vivier
+                colonne évalué de façon vectorisée, ou une table de scores matérialisée (l'offre
+                doit y figurer ; aucun score n'est recalculé).
             top_k (int, optional): Nombre maximum de résultats à retourner. Defaults à 5.
 
         Returns:
             List[Dict]: Liste des dictionnaires contenant les détails du candidat recommandé,
-                        le score et l'explication. Triée par pertinence.
+                        le score, ses sous-scores (`subscores`, et `match` : le MatchResult
+                        complet) et l'explication. Triée par pertinence.
         """
-        results = []
-        
-        for cv in candidates:
-            score = self.matcher.compute_match(cv, offer)
-            
-            # Ici, on pourrait ajouter un facteur de "Popularité" ou "Click-through rate" historique
-            # final_score = score * 0.9 + popularity_factor * 0.1
-            
-            explanation = self.matcher.explain_score(cv, offer, score)
-            
-            results.append({
-                "cv_id": cv.id,
-                "score": score,
-                "explanation": explanation,
-                "cv_obj": cv
-            })
-            
-        # Tri décroissant
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:top_k]
+        if isinstance(candidates, CandidatePool):
+            return self._recommend_from_pool(offer, candidates, top_k)
+        if isinstance(candidates, ScoreTable):
+            return self._recommend_from_table(offer, candidates, top_k)
+
+        registry = get_registry()
+        if isinstance(candidates, (CandidateIndex, MinHashLSHIndex)):
+            with registry.timer("pipeline_stage_seconds", stage="retrieval"):
+                pool_size = len(candidates)
+                candidates = candidates.candidates_for(offer, similarity=self.matcher.similarity)
+            registry.counter("candidates_pruned_total", "Candidats écartés avant scoring").inc(
+                pool_size - len(candidates))
+
+        admitted = self.planner.apply(offer, candidates)
+        if admitted is not None:
+            candidates = [cv for cv, keep in zip(candidates, admitted) if keep]
+
+        # Ici, on pourrait ajouter un facteur de "Popularité" ou "Click-through rate" historique
+        # final_score = score * 0.9 + popularity_factor * 0.1
+        scored_count = 0
+
+        def scored():
+            nonlocal scored_count
+            for cv in candidates:
+                scored_count += 1
+                yield self.matcher.evaluate(cv, offer)
+
+        # Tas de taille top_k : O(n log k) au lieu d'un tri complet de la liste
+        with registry.timer("pipeline_stage_seconds", stage="scoring"):
+            best = heapq.nsmallest(top_k, scored(), key=_ranking_key)
+        registry.counter("candidates_scored_total", "Candidats évalués par le MatchingEngine").inc(scored_count)
+
+        # Les MatchResult du scoring sont conservés : rien n'est recalculé pour les retenus
+        return [self._build_result(match) for match in best]
+
+    def recommend_for_offers(
+        self, offers: List[JobOffer], candidates: Union[CandidatePool, Iterable[CV]], top_k: int = 5,
+        chunk_size: int = 4_096
+    ) -> Dict[str, List[Dict]]:
+        """
+        Classe les candidats pour plusieurs offres en une seule lecture du vivier.
+
+        Le vivier est parcouru par blocs de `chunk_size` candidats ; chaque bloc
+        est noté contre toutes les offres en un seul calcul matriciel, puis le
+        top-k courant de chaque offre est mis à jour. La mémoire de travail est
+        bornée par chunk_size × len(offers) scores, quelle que soit la taille du
+        vivier. Les contraintes éliminatoires de chaque offre sont appliquées
+        bloc par bloc.
+
+        Args:
+            offers (List[JobOffer]): Offres à traiter (ex: digest hebdomadaire).
+            candidates (CandidatePool | Iterable[CV]): Vivier colonne (idéalement chargé avec
+                mmap=True depuis le disque), ou flux de CVs (liste, SnapshotReader...).
+            top_k (int, optional): Nombre maximum de résultats par offre. Defaults à 5.
+            chunk_size (int, optional): Nombre de candidats notés par bloc. La valeur par défaut
+                garde la matrice de scores d'un bloc dans le cache du processeur pour quelques
+                centaines d'offres.
+
+        Returns:
+            Dict[str, List[Dict]]: Pour chaque offer_id, mêmes résultats (format et ordre)
+                                   que recommend_candidates(offer, candidates, top_k).
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        if not offers:
+            return {}
+        if top_k <= 0:
+            return {offer.id: [] for offer in offers}
+        registry = get_registry()
+        best: List[List[_Hit]] = [[] for _ in offers]
+        floors = np.full(len(offers), -np.inf)
+        floor_ids = np.full(len(offers), "", dtype=object)
+        stats = [QueryStats(offer_id=offer.id, candidates=0) for offer in offers]
+        is_pool = isinstance(candidates, CandidatePool)
+        constrained = [j for j, offer in enumerate(offers) if offer.hard_constraints]
+
+        for chunk, offset in _candidate_chunks(candidates, chunk_size):
+            n = len(chunk)
+            ids = chunk.ids if is_pool else np.array([cv.id for cv in chunk])
+            scores = self.matcher.compute_match_matrix(chunk, offers)
+            with registry.timer("pipeline_stage_seconds", stage="selection"):
+                # Colonnes filtrables extraites une fois par bloc, pour toutes les offres
+                columns = CandidateColumns.of(chunk) if constrained else None
+                for j in constrained:
+                    admitted = self.planner.apply(offers[j], columns)
+                    stats[j].merge(self.planner.last_query_stats)
+                    scores[~admitted, j] = -np.inf
+                for j, offer in enumerate(offers):
+                    if not offer.hard_constraints:
+                        stats[j].candidates += n
+                        stats[j].scored += n
+                for j, positions in _chunk_contenders(scores, ids, floors, floor_ids, top_k):
+                    hits = [(float(scores[p, j]), str(ids[p]), offset + int(p) if is_pool else chunk[p])
+                            for p in positions]
+                    best[j] = heapq.nsmallest(top_k, best[j] + hits, key=_hit_key)
+                    if len(best[j]) == top_k:
+                        floors[j], floor_ids[j], _ = best[j][-1]
+        registry.counter("candidates_scored_total", "Candidats évalués par le MatchingEngine").inc(
+            sum(s.scored for s in stats))
+        self.planner.last_query_stats = None
+        self.last_batch_stats = {s.offer_id: s for s in stats}
+
+        with registry.timer("pipeline_stage_seconds", stage="explanation"):
+            return {
+                offer.id: [self._result_for(candidates[ref] if is_pool else ref, offer) for _, _, ref in hits]
+                for offer, hits in zip(offers, best)
+            }
+
+    def recommend_offers(
+        self, cv: CV, offers: Union[List[JobOffer], OfferIndex], top_k: int = 5
+    ) -> List[Dict]:
+        """
+        Génère la liste des offres les plus pertinentes pour un candidat.
+
+        Même sémantique que recommend_candidates, dans l'autre sens : tas borné
+        de taille top_k, égalités départagées par offer_id, explication générée
+        uniquement pour les offres retenues.
+
+        Args:
+            cv (CV): Le candidat pour lequel on cherche des offres.
+            offers (List[JobOffer] | OfferIndex): Le catalogue d'offres, ou un index dont
+                seules les offres plausibles pour le candidat sont évaluées.
+            top_k (int, optional): Nombre maximum de résultats à retourner. Defaults à 5.
+
+        Returns:
+            List[Dict]: Offres recommandées (offer_id, titre, score, sous-scores, explication),
+                        triées par pertinence.
+        """
+        if isinstance(offers, OfferIndex):
+            offers = offers.offers_for(cv, similarity=self.matcher.similarity)
+
+        scored = (self.matcher.evaluate(cv, offer) for offer in offers)
+        best = heapq.nsmallest(top_k, scored, key=_offer_ranking_key)
+        return [
+            {
+                "offer_id": match.offer.id,
+                "offer_title": match.offer.title,
+                "score": match.score,
+                "subscores": match.subscores,
+                "explanation": match.explanation,
+                "match": match,
+                "offer_obj": match.offer
+            }
+            for match in best
+        ]
+
+    def _recommend_from_pool(self, offer: JobOffer, pool: CandidatePool, top_k: int) -> List[Dict]:
+        """Classement vectorisé sur un vivier colonne : seuls les top_k sont reconvertis en CV."""
+        registry = get_registry()
+        admitted = self.planner.apply(offer, pool)
+        scored_count = len(pool) if admitted is None else self.planner.last_query_stats.scored
+        if admitted is not None and scored_count * 2 < len(pool):
+            # Sélection étroite : seuls les survivants sont copiés puis notés
+            pool, admitted = pool.take(np.flatnonzero(admitted)), None
+        scores = self.matcher.compute_match_matrix(pool, [offer])[:, 0]
+        if admitted is not None:
+            # Sélection large : noter tout le vivier coûte moins que d'en copier les colonnes ;
+            # les candidats écartés sont relégués sous tout score possible
+            scores[~admitted] = -np.inf
+        registry.counter("candidates_scored_total", "Candidats évalués par le MatchingEngine").inc(scored_count)
+        with registry.timer("pipeline_stage_seconds", stage="selection"):
+            positions = _top_k_positions(scores, pool.ids, min(top_k, scored_count))
+        with registry.timer("pipeline_stage_seconds", stage="explanation"):
+            return [self._result_for(pool[p], offer) for p in positions]
+
+    def _recommend_from_table(self, offer: JobOffer, table: ScoreTable, top_k: int) -> List[Dict]:
+        """Classement lu dans une table de scores matérialisée (sélection et explications seulement)."""
+        scores, ids, cvs = table.column(offer.id)
+        offer = table.offer(offer.id)
+        admitted = self.planner.apply(offer, cvs)
+        if admitted is not None:
+            survivors = np.flatnonzero(admitted)
+            scores, ids, cvs = scores[survivors], ids[survivors], [cvs[p] for p in survivors]
+        positions = _top_k_positions(scores, ids, top_k)
+        return [self._result_for(cvs[p], offer) for p in positions]
+
+    def _result_for(self, cv: CV, offer: JobOffer) -> Dict:
+        """Résultat d'un candidat retenu par un classement vectorisé (qui ne produit que des scores)."""
+        # Une seule évaluation par survivant : son score est identique à celui de la matrice
+        return self._build_result(self.matcher.evaluate(cv, offer))
 
+    def _build_result(self, match: MatchResult) -> Dict:
+        """Construit l'entrée de résultat d'un candidat retenu (seuls les top_k sont expliqués)."""
+        return {
+            "cv_id": match.cv.id,
+            "cv_name": match.cv.name,
+            "score": match.score,
+            "subscores": match.subscores,
+            "explanation": match.explanation,
+            "match": match,
+            "cv_obj": match.cv
+        }
@@ -0,0 +1,192 @@
+# ==========================================
+# Module C: Materialized Score Table (Incremental)
+# ==========================================
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.models import CV, JobOffer
+from src.services.matcher import MatchingEngine
+
+_SUBSCORES = ("skills", "experience", "location")
+
+
+class ScoreTable:
+    """
+    Table matérialisée des scores (candidat, offre) mise à jour incrémentalement.
+
+    Les trois sous-scores de chaque paire sont stockés (une matrice par critère,
+    ligne = candidat, colonne = offre ouverte) avec le score global qui en découle :
+    - l'ajout ou la modification d'un CV ne recalcule que sa ligne ;
+    - l'ajout ou la modification d'une offre ne recalcule que sa colonne ;
+    - un changement de pondération recombine les sous-scores stockés, sans les recalculer.
+
+    Les emplacements libérés par remove_cv / remove_offer sont réutilisés ; la
+    capacité double lorsqu'elle est atteinte.
+
+    Attributs:
+        matcher (MatchingEngine): Moteur utilisé pour les sous-scores et leur combinaison.
+    """
+    def __init__(
+        self,
+        matcher: MatchingEngine,
+        cvs: Iterable[CV] = (),
+        offers: Iterable[JobOffer] = (),
+        capacity: Tuple[int, int] = (64, 16),
+    ):
+        self.matcher = matcher
+        n_rows, n_cols = capacity
+        self._subscores = {name: np.zeros((n_rows, n_cols)) for name in _SUBSCORES}
+        self._scores = np.zeros((n_rows, n_cols))
+        self._cvs: List[Optional[CV]] = [None] * n_rows
+        self._offers: List[Optional[JobOffer]] = [None] * n_cols
+        self._cv_ids = np.empty(n_rows, dtype=object)
+        self._cv_slots: Dict[str, int] = {}
+        self._offer_slots: Dict[str, int] = {}
+        self._free_rows: List[int] = list(range(n_rows - 1, -1, -1))
+        self._free_cols: List[int] = list(range(n_cols - 1, -1, -1))
+        for offer in offers:
+            self.upsert_offer(offer)
+        self.upsert_cvs(cvs)
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        """(nombre de candidats, nombre d'offres) actuellement matérialisés."""
+        return len(self._cv_slots), len(self._offer_slots)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._cv_slots or key in self._offer_slots
+
+    def offers(self) -> List[JobOffer]:
+        return [self._offers[col] for col in self._offer_slots.values()]
+
+    def cvs(self) -> List[CV]:
+        return [self._cvs[row] for row in self._cv_slots.values()]
+
+    # --- Emplacements ---------------------------------------------------------
+
+    def _grow(self, axis: int) -> None:
+        size = self._scores.shape[axis]
+        pad = [(0, 0), (0, 0)]
+        pad[axis] = (0, size)
+        for name in _SUBSCORES:
+            self._subscores[name] = np.pad(self._subscores[name], pad)
+        self._scores = np.pad(self._scores, pad)
+        if axis == 0:
+            self._cvs.extend([None] * size)
+            self._cv_ids = np.concatenate([self._cv_ids, np.empty(size, dtype=object)])
+            self._free_rows.extend(range(2 * size - 1, size - 1, -1))
+        else:
+            self._offers.extend([None] * size)
+            self._free_cols.extend(range(2 * size - 1, size - 1, -1))
+
+    def _row_for(self, cv_id: str) -> int:
+        row = self._cv_slots.get(cv_id)
+        if row is None:
+            if not self._free_rows:
+                self._grow(0)
+            row = self._cv_slots[cv_id] = self._free_rows.pop()
+        return row
+
+    def _col_for(self, offer_id: str) -> int:
+        col = self._offer_slots.get(offer_id)
+        if col is None:
+            if not self._free_cols:
+                self._grow(1)
+            col = self._offer_slots[offer_id] = self._free_cols.pop()
+        return col
+
+    def _store(self, rows, cols, subscores: Tuple[np.ndarray, np.ndarray, np.ndarray]) -> None:
+        index = np.ix_(rows, cols)
+        for name, values in zip(_SUBSCORES, subscores):
+            self._subscores[name][index] = values
+        self._scores[index] = self.matcher.combine_subscores(*subscores)
+
+    # --- Mises à jour ---------------------------------------------------------
+
+    def upsert_cv(self, cv: CV) -> None:
+        """Ajoute ou remplace un CV : seule sa ligne est recalculée."""
+        self.upsert_cvs([cv])
+
+    def upsert_cvs(self, cvs: Iterable[CV]) -> None:
+        """Ajoute ou remplace plusieurs CVs en un seul calcul vectorisé."""
+        cvs = list({cv.id: cv for cv in cvs}.values())
+        if not cvs:
+            return
+        rows = [self._row_for(cv.id) for cv in cvs]
+        for row, cv in zip(rows, cvs):
+            self._cvs[row] = cv
+            self._cv_ids[row] = cv.id
+        cols = list(self._offer_slots.values())
+        if cols:
+            offers = [self._offers[col] for col in cols]
+            self._store(rows, cols, self.matcher.compute_subscore_matrices(cvs, offers))
+
+    def upsert_offer(self, offer: JobOffer) -> None:
+        """Ajoute ou remplace une offre ouverte : seule sa colonne est recalculée."""
+        col = self._col_for(offer.id)
+        self._offers[col] = offer
+        rows = list(self._cv_slots.values())
+        if rows:
+            cvs = [self._cvs[row] for row in rows]
+            self._store(rows, [col], self.matcher.compute_subscore_matrices(cvs, [offer]))
+
+    def remove_cv(self, cv_id: str) -> CV:
+        """
+        Retire un candidat de la table.
+
+        Raises:
+            KeyError: Si le candidat n'est pas dans la table.
+        """
+        row = self._cv_slots.pop(cv_id)
+        cv, self._cvs[row], self._cv_ids[row] = self._cvs[row], None, None
+        self._free_rows.append(row)
+        return cv
+
+    def remove_offer(self, offer_id: str) -> JobOffer:
+        """
+        Retire une offre (pourvue ou fermée) de la table.
+
+        Raises:
+            KeyError: Si l'offre n'est pas dans la table.
+        """
+        col = self._offer_slots.pop(offer_id)
+        offer, self._offers[col] = self._offers[col], None
+        self._free_cols.append(col)
+        return offer
+
+    def set_weights(self, weights: Dict[str, float]) -> None:
+        """
+        Change la pondération du moteur et recombine les sous-scores stockés.
+
+        Aucun sous-score n'est recalculé : le coût est celui d'une combinaison linéaire.
+        """
+        self.matcher.weights = dict(weights)
+        self._scores = self.matcher.combine_subscores(*(self._subscores[name] for name in _SUBSCORES))
+
+    # --- Lecture ----------------------------------------------------------------
+
+    def score(self, cv_id: str, offer_id: str) -> float:
+        """
+        Score matérialisé d'une paire, identique à compute_match(cv, offer).
+
+        Raises:
+            KeyError: Si le candidat ou l'offre n'est pas dans la table.
+        """
+        return float(self._scores[self._cv_slots[cv_id], self._offer_slots[offer_id]])
+
+    def offer(self, offer_id: str) -> JobOffer:
+        """Renvoie l'offre matérialisée (KeyError si absente)."""
+        return self._offers[self._offer_slots[offer_id]]
+
+    def column(self, offer_id: str) -> Tuple[np.ndarray, np.ndarray, List[CV]]:
+        """
+        Scores de tous les candidats pour une offre.
+
+        Returns:
+            Tuple[np.ndarray, np.ndarray, List[CV]]: Scores, identifiants et CVs, alignés.
+        """
+        rows = np.fromiter(self._cv_slots.values(), dtype=np.intp, count=len(self._cv_slots))
+        scores = self._scores[rows, self._offer_slots[offer_id]]
+        return scores, self._cv_ids[rows], [self._cvs[row] for row in rows]
@@ -0,0 +1,147 @@
+# ==========================================
+# Module C: Sharded Multi-process Recommendation
+# ==========================================
+
+import heapq
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.models import JobOffer
+from src.services.matcher import MatchingEngine
+from src.services.planner import HardFilterPlanner, QueryStats
+from src.services.pool import CandidatePool
+from src.services.recommender import RecommendationSystem, _top_k_positions
+
+# (score, cv_id, position dans le vivier) : un candidat retenu par un shard
+ShardHit = Tuple[float, str, int]
+
+# État propre à chaque processus de calcul
+_SHARD_POOL: Optional[CandidatePool] = None
+_SHARD_MATCHER: Optional[MatchingEngine] = None
+
+
+def _init_shard_worker(directory: str, matcher: MatchingEngine) -> None:
+    global _SHARD_POOL, _SHARD_MATCHER
+    # Projection en mémoire : tous les processus partagent les mêmes pages physiques
+    _SHARD_POOL = CandidatePool.load(directory, mmap=True)
+    _SHARD_MATCHER = matcher
+
+
+def _shard_top_k(offer: JobOffer, start: int, stop: int, top_k: int) -> Tuple[List[ShardHit], QueryStats]:
+    """Top-k local d'une partition [start, stop) du vivier (exécuté dans un processus de calcul)."""
+    shard = _SHARD_POOL.slice(start, stop)
+    planner = HardFilterPlanner()
+    admitted = planner.apply(offer, shard)
+    if admitted is None:
+        positions = np.arange(len(shard))
+    else:
+        positions = np.flatnonzero(admitted)
+        shard = shard.take(positions)
+    scores = _SHARD_MATCHER.compute_match_matrix(shard, [offer])[:, 0]
+    hits = [(float(scores[p]), str(shard.ids[p]), start + int(positions[p]))
+            for p in _top_k_positions(scores, shard.ids, top_k)]
+    return hits, planner.last_query_stats
+
+
+def _shard_key(hit: ShardHit) -> Tuple[float, str]:
+    score, cv_id, _ = hit
+    return (-score, cv_id)
+
+
+class ShardedRecommender:
+    """
+    Classement des candidats réparti sur plusieurs processus.
+
+    Le vivier colonne est enregistré sur disque puis projeté en mémoire par
+    chaque processus : les partitions (shards) sont lues dans les mêmes pages
+    physiques, sans copie ni sérialisation des candidats. Chaque processus calcule
+    le top-k local de sa partition avec le MatchingEngine ; le coordinateur fusionne
+    les listes partielles. Le départage des égalités (score décroissant, puis cv_id)
+    étant le même partout, le résultat est identique à celui de
+    RecommendationSystem.recommend_candidates sur le vivier complet.
+
+    Usage:
+        with ShardedRecommender.from_pool(matcher, pool, workers=8) as sharded:
+            results = sharded.recommend_candidates(offer, top_k=10)
+
+    Attributs:
+        matcher (MatchingEngine): Moteur de matching (copié dans chaque processus).
+        directory (str): Répertoire du vivier enregistré (voir CandidatePool.save).
+        workers (int): Nombre de processus de calcul.
+        shards (int): Nombre de partitions par requête.
+        last_query_stats (QueryStats, optional): Bilan du filtrage éliminatoire de la dernière
+                                                 requête, cumulé sur les partitions.
+    """
+    def __init__(self, matcher: MatchingEngine, directory: str, workers: Optional[int] = None,
+                 shards: Optional[int] = None):
+        self.matcher = matcher
+        self.directory = directory
+        self.workers = workers or os.cpu_count() or 1
+        self.shards = shards or self.workers
+        self._pool = CandidatePool.load(directory, mmap=True)
+        self._recommender = RecommendationSystem(matcher)
+        self._tmp: Optional[tempfile.TemporaryDirectory] = None
+        self.last_query_stats: Optional[QueryStats] = None
+        self._executor = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_shard_worker,
+                                             initargs=(directory, matcher))
+
+    @classmethod
+    def from_pool(cls, matcher: MatchingEngine, pool: CandidatePool, workers: Optional[int] = None,
+                  shards: Optional[int] = None) -> "ShardedRecommender":
+        """Enregistre un vivier en mémoire dans un répertoire temporaire (supprimé par close())."""
+        tmp = tempfile.TemporaryDirectory(prefix="candidate_pool_")
+        pool.save(tmp.name)
+        sharded = cls(matcher, tmp.name, workers=workers, shards=shards)
+        sharded._tmp = tmp
+        return sharded
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __enter__(self) -> "ShardedRecommender":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Arrête les processus de calcul et supprime le répertoire temporaire éventuel."""
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pool = None
+        if self._tmp is not None:
+            self._tmp.cleanup()
+            self._tmp = None
+
+    def _bounds(self) -> List[Tuple[int, int]]:
+        size = len(self._pool)
+        count = max(1, min(self.shards, size))
+        edges = [size * i // count for i in range(count + 1)]
+        return [(start, stop) for start, stop in zip(edges, edges[1:]) if stop > start]
+
+    def recommend_candidates(self, offer: JobOffer, top_k: int = 5) -> List[Dict]:
+        """
+        Recommande les top_k candidats du vivier pour une offre.
+
+        Args:
+            offer (JobOffer): L'offre pour laquelle on cherche des candidats.
+            top_k (int, optional): Nombre maximum de résultats à retourner. Defaults à 5.
+
+        Returns:
+            List[Dict]: Même format et même ordre que RecommendationSystem.recommend_candidates.
+        """
+        futures = [self._executor.submit(_shard_top_k, offer, start, stop, top_k)
+                   for start, stop in self._bounds()]
+        hits: List[ShardHit] = []
+        stats = QueryStats(offer_id=offer.id, candidates=0)
+        for future in futures:
+            shard_hits, shard_stats = future.result()
+            hits.extend(shard_hits)
+            stats.merge(shard_stats)
+        self.last_query_stats = stats
+        best = heapq.nsmallest(top_k, hits, key=_shard_key)
+        # Seuls les candidats retenus sont reconstruits (depuis la projection du coordinateur)
+        return [self._recommender._result_for(self._pool[position], offer) for _, _, position in best]
@@ -0,0 +1,218 @@
+# ==========================================
+# Module A bis: Skill Similarity Model (Sparse, Precomputed)
+# ==========================================
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from src.models import SKILL_VOCABULARY
+
+# Relations sémantiques que des n-grammes de caractères ne peuvent pas deviner
+# (similarité entre compétences normalisées, symétrique). Un poids de 0 supprime
+# une paire jugée proche à tort (ex: "java" / "javascript").
+DEFAULT_RELATED_SKILLS: Dict[Tuple[str, str], float] = {
+    ("postgresql", "sql"): 0.8,
+    ("mysql", "sql"): 0.8,
+    ("pytorch", "machine learning"): 0.6,
+    ("tensorflow", "machine learning"): 0.6,
+    ("scikit-learn", "machine learning"): 0.7,
+    ("deep learning", "machine learning"): 0.7,
+    ("typescript", "javascript"): 0.7,
+    ("java", "javascript"): 0.0,
+}
+
+Neighbors = Tuple[Tuple[int, float], ...]
+
+
+def _prune_block(
+    block: sparse.spmatrix, start: int, min_similarity: float, top_n: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Élague un bloc de lignes du produit des vecteurs (diagonale, seuil, top_n voisins par ligne).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Lignes (globales), colonnes et valeurs conservées.
+    """
+    block = block.tocoo()
+    rows = block.row.astype(np.int64) + start
+    keep = (block.col != rows) & (block.data >= min_similarity)
+    rows, columns, values = rows[keep], block.col[keep], block.data[keep]
+    # Rang de chaque similarité dans sa ligne (décroissante) : seuls les top_n premiers restent
+    order = np.lexsort((-values, rows))
+    rows, columns, values = rows[order], columns[order], values[order]
+    first = np.searchsorted(rows, rows)
+    keep = np.arange(len(rows)) - first < top_n
+    return rows[keep], columns[keep], values[keep]
+
+
+class SkillSimilarityModel:
+    """
+    Matrice creuse de similarité compétence × compétence, calculée hors ligne.
+
+    La similarité de base est le cosinus entre vecteurs TF-IDF de n-grammes de
+    caractères (scikit-learn, entièrement local), complétée par des relations
+    déclarées explicitement. La matrice est élaguée (seuil minimal et nombre
+    maximal de voisins par compétence) : au scoring, le crédit partiel d'une
+    compétence requise ne coûte qu'une lecture de quelques voisins.
+
+    La diagonale vaut toujours 1.0 : une correspondance exacte garde tout son poids.
+    La matrice construite est symétrique, ce qui permet d'élargir une recherche
+    indexée dans les deux sens (offre → candidats, candidat → offres).
+
+    Attributs:
+        skills (List[str]): Compétences (normalisées) des lignes/colonnes.
+        matrix (sparse.csr_matrix): Similarités (ligne = compétence requise,
+                                    colonne = compétence du candidat).
+    """
+    def __init__(self, skills: Sequence[str], matrix: sparse.spmatrix):
+        if matrix.shape != (len(skills), len(skills)):
+            raise ValueError("Similarity matrix shape does not match the number of skills")
+        self.skills = list(skills)
+        self.matrix = sparse.csr_matrix(matrix, dtype=np.float32)
+        self._rows: Dict[str, int] = {skill: i for i, skill in enumerate(self.skills)}
+        self._neighbors: Dict[int, Neighbors] = {}
+
+    @classmethod
+    def build(
+        cls,
+        skills: Iterable[str],
+        min_similarity: float = 0.25,
+        top_n: int = 5,
+        related: Optional[Mapping[Tuple[str, str], float]] = None,
+        ngram_range: Tuple[int, int] = (2, 4),
+        block_size: int = 1024,
+    ) -> "SkillSimilarityModel":
+        """
+        Construit le modèle à partir d'une taxonomie de compétences.
+
+        Args:
+            skills (Iterable[str]): Compétences de la taxonomie.
+            min_similarity (float, optional): Similarité minimale conservée.
+            top_n (int, optional): Nombre maximal de voisins (hors diagonale) par compétence.
+            related (Mapping, optional): Similarités imposées par paire, prioritaires sur le
+                                         calcul (défaut : DEFAULT_RELATED_SKILLS).
+            ngram_range (Tuple[int, int], optional): Tailles des n-grammes de caractères.
+            block_size (int, optional): Compétences traitées par bloc de lignes. Le produit
+                                        creux d'un bloc est élagué avant le suivant : la
+                                        matrice dense n × n n'est jamais construite.
+
+        Returns:
+            SkillSimilarityModel: Le modèle élagué.
+        """
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        related = DEFAULT_RELATED_SKILLS if related is None else related
+        names: Dict[str, None] = {}
+        for skill in skills:
+            names.setdefault(skill.lower().strip())
+        for a, b in related:
+            names.setdefault(a)
+            names.setdefault(b)
+        names = list(names)
+        if not names:
+            return cls([], sparse.csr_matrix((0, 0), dtype=np.float32))
+
+        # Vecteurs normalisés L2 : le produit scalaire est le cosinus
+        vectors = TfidfVectorizer(analyzer="char_wb", ngram_range=ngram_range).fit_transform(names)
+        vectors_t = vectors.T.tocsc()
+        kept = [_prune_block(vectors[start:start + block_size] @ vectors_t, start, min_similarity, top_n)
+                for start in range(0, len(names), block_size)]
+        rows, columns, values = (np.concatenate(parts) for parts in zip(*kept))
+        similarity = sparse.csr_matrix((values, (rows, columns)), shape=(len(names), len(names)))
+        # Symétrique : une paire gardée par l'une des deux lignes est gardée dans les deux sens
+        similarity = similarity.maximum(similarity.T).tolil()
+
+        position = {skill: i for i, skill in enumerate(names)}
+        for (a, b), value in related.items():
+            similarity[position[a], position[b]] = value
+            similarity[position[b], position[a]] = value
+        similarity.setdiag(1.0)
+        similarity = similarity.tocsr()
+        similarity.eliminate_zeros()
+        return cls(names, similarity)
+
+    def __getstate__(self) -> dict:
+        # Le cache des voisins contient des identifiants SKILL_VOCABULARY propres au processus :
+        # il est reconstruit dans chaque processus qui reçoit le modèle
+        state = self.__dict__.copy()
+        state["_neighbors"] = {}
+        return state
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    @property
+    def nnz(self) -> int:
+        """Nombre de similarités stockées (diagonale comprise)."""
+        return self.matrix.nnz
+
+    def similarity(self, required: str, owned: str) -> float:
+        """Similarité entre une compétence requise et une compétence possédée."""
+        if required == owned:
+            return 1.0
+        i, j = self._rows.get(required), self._rows.get(owned)
+        if i is None or j is None:
+            return 0.0
+        return float(self.matrix[i, j])
+
+    def neighbors(self, skill_id: int) -> Neighbors:
+        """
+        Compétences qui donnent du crédit pour une compétence requise.
+
+        Args:
+            skill_id (int): Identifiant interné (SKILL_VOCABULARY) de la compétence requise.
+
+        Returns:
+            Tuple[Tuple[int, float], ...]: Paires (identifiant, similarité), la compétence
+                elle-même comprise (1.0). Une compétence inconnue du modèle n'a qu'elle-même.
+        """
+        cached = self._neighbors.get(skill_id)
+        if cached is None:
+            row = self._rows.get(SKILL_VOCABULARY.name(skill_id))
+            if row is None:
+                cached = ((skill_id, 1.0),)
+            else:
+                start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+                cached = tuple(
+                    (SKILL_VOCABULARY.intern(self.skills[j]), float(value))
+                    for j, value in zip(self.matrix.indices[start:end], self.matrix.data[start:end])
+                )
+            self._neighbors[skill_id] = cached
+        return cached
+
+    def expand(self, skill_ids: Iterable[int]) -> Set[int]:
+        """Compétences donnant un crédit non nul pour au moins une compétence de `skill_ids`."""
+        expanded: Set[int] = set()
+        for skill_id in skill_ids:
+            expanded.update(other for other, value in self.neighbors(skill_id) if value > 0)
+        return expanded
+
+    def credit(self, required_ids: Iterable[int], owned_ids: Iterable[int]) -> float:
+        """
+        Somme des crédits des compétences requises : chacune vaut la meilleure
+        similarité avec une compétence possédée (1.0 si elle est possédée).
+        """
+        owned = owned_ids if isinstance(owned_ids, (set, frozenset)) else set(owned_ids)
+        total = 0.0
+        for skill_id in required_ids:
+            total += max((value for other, value in self.neighbors(skill_id) if other in owned), default=0.0)
+        return total
+
+    def save(self, path: str) -> None:
+        """Enregistre le modèle dans une archive .npz (matrice CSR et compétences)."""
+        np.savez_compressed(
+            path, skills=np.array(self.skills, dtype=str), data=self.matrix.data,
+            indices=self.matrix.indices, indptr=self.matrix.indptr,
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "SkillSimilarityModel":
+        """Recharge un modèle enregistré par save()."""
+        with np.load(path) as archive:
+            skills: List[str] = [str(s) for s in archive["skills"]]
+            matrix = sparse.csr_matrix(
+                (archive["data"], archive["indices"], archive["indptr"]), shape=(len(skills), len(skills))
+            )
+        return cls(skills, matrix)
@@ -0,0 +1,348 @@
+# ==========================================
+# Module C: Binary Snapshots of Parsed Collections (msgpack + zstd)
+# ==========================================
+
+import os
+import struct
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import msgpack
+import zstandard
+
+from src.models import CV, HardConstraints, JobOffer, LocationEnum
+
+# Version du format disque (à incrémenter en cas de changement de structure des enregistrements)
+# 2 : les offres portent leurs contraintes éliminatoires (septième champ)
+SNAPSHOT_FORMAT_VERSION = 2
+# Formats encore lisibles : les offres du format 1 sont relues sans contraintes
+_READABLE_FORMATS = (1, 2)
+
+_MAGIC = b"RCSNAP\r\n"
+# Préambule : signature, version du format, nombre d'enregistrements, taille de l'en-tête
+_PREAMBLE = struct.Struct("<8sHQI")
+# En-tête de trame : taille compressée, nombre d'enregistrements (0, 0 : fin des trames)
+_FRAME = struct.Struct("<II")
+# Fin de fichier : position de la table des trames
+_TRAILER = struct.Struct("<Q")
+
+Record = Union[CV, JobOffer]
+
+
+class SnapshotError(ValueError):
+    """Instantané illisible, d'un autre format ou d'une autre version de taxonomie."""
+
+
+@dataclass(frozen=True)
+class SnapshotHeader:
+    """
+    Métadonnées d'un instantané.
+
+    Attributs:
+        kind (str): Type des enregistrements ("cv" ou "offer").
+        count (int): Nombre d'enregistrements.
+        taxonomy_version (str, optional): Version de l'analyseur/taxonomie ayant produit les données.
+        chunk_size (int): Nombre maximal d'enregistrements par trame.
+        format_version (int): Version du format disque.
+    """
+    kind: str
+    count: int
+    taxonomy_version: Optional[str]
+    chunk_size: int
+    format_version: int = SNAPSHOT_FORMAT_VERSION
+
+
+def _encode_cv(cv: CV) -> list:
+    # Les compétences sont écrites en toutes lettres : les identifiants sont propres au processus
+    return [cv.id, cv.name, cv.skills, cv.years_experience, cv.location.value, cv.availability_immediate,
+            cv.raw_text]
+
+
+def _decode_cv(fields: list) -> CV:
+    id, name, skills, years, location, available, raw_text = fields
+    return CV(id=id, name=name, skills=skills, years_experience=years, location=LocationEnum(location),
+              availability_immediate=available, raw_text=raw_text)
+
+
+def _encode_offer(offer: JobOffer) -> list:
+    constraints = offer.hard_constraints
+    return [offer.id, offer.title, offer.required_skills, offer.min_years_experience, offer.location.value,
+            offer.remote_allowed,
+            None if constraints is None else [constraints.location_compatible, constraints.min_years_experience,
+                                              constraints.availability_immediate]]
+
+
+def _decode_offer(fields: list) -> JobOffer:
+    # Les offres du format 1 (antérieur aux contraintes éliminatoires) n'ont que six champs
+    id, title, skills, years, location, remote, *rest = fields
+    constraints = rest[0] if rest else None
+    return JobOffer(id=id, title=title, required_skills=skills, min_years_experience=years,
+                    location=LocationEnum(location), remote_allowed=remote,
+                    hard_constraints=None if constraints is None else HardConstraints(*constraints))
+
+
+_CODECS = {
+    "cv": (CV, _encode_cv, _decode_cv),
+    "offer": (JobOffer, _encode_offer, _decode_offer),
+}
+
+
+class SnapshotWriter:
+    """
+    Écriture en flux d'un instantané de CVs ou d'offres.
+
+    Les enregistrements sont regroupés en trames de `chunk_size` éléments,
+    sérialisées en msgpack puis compressées indépendamment (zstd) : une trame
+    se relit sans décompresser les autres, ce qui permet la lecture partielle
+    par plage d'enregistrements. La table des trames est écrite en fin de fichier et le nombre
+    d'enregistrements est reporté dans le préambule à la fermeture. Le fichier
+    est écrit à côté de la destination puis renommé (écriture atomique).
+
+    Usage:
+        with SnapshotWriter("pool.snap", kind="cv", taxonomy_version=analyzer.taxonomy_version) as writer:
+            writer.write_all(cvs)
+
+    Attributs:
+        path (Path): Fichier produit.
+        header (SnapshotHeader): Métadonnées (count à jour après chaque trame).
+    """
+    def __init__(
+        self,
+        path: str,
+        kind: str = "cv",
+        taxonomy_version: Optional[str] = None,
+        chunk_size: int = 4096,
+        level: int = 3,
+    ):
+        if kind not in _CODECS:
+            raise ValueError(f"Unknown snapshot kind: {kind!r}")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be >= 1")
+        self.path = Path(path)
+        self._type, self._encode, _ = _CODECS[kind]
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._pending: List[list] = []
+        self._frames: List[Tuple[int, int]] = []
+        self._count = 0
+        self._meta = {"kind": kind, "taxonomy_version": taxonomy_version, "chunk_size": chunk_size}
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        meta = msgpack.packb(self._meta)
+        self._file.write(_PREAMBLE.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, 0, len(meta)))
+        self._file.write(meta)
+
+    @property
+    def header(self) -> SnapshotHeader:
+        return SnapshotHeader(count=self._count, **self._meta)
+
+    def __enter__(self) -> "SnapshotWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, record: Record) -> None:
+        """
+        Ajoute un enregistrement.
+
+        Raises:
+            TypeError: Si l'enregistrement n'est pas du type déclaré par `kind`.
+        """
+        if not isinstance(record, self._type):
+            raise TypeError(f"Expected {self._type.__name__}, got {type(record).__name__}")
+        self._pending.append(self._encode(record))
+        if len(self._pending) >= self._meta["chunk_size"]:
+            self._flush()
+
+    def write_all(self, records: Iterable[Record]) -> None:
+        """Ajoute une série d'enregistrements (consommée en flux)."""
+        for record in records:
+            self.write(record)
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        payload = self._compressor.compress(msgpack.packb(self._pending, use_bin_type=True))
+        self._frames.append((self._file.tell(), len(self._pending)))
+        self._file.write(_FRAME.pack(len(payload), len(self._pending)))
+        self._file.write(payload)
+        self._count += len(self._pending)
+        self._pending = []
+
+    def close(self) -> SnapshotHeader:
+        """Écrit la dernière trame et la table des trames, puis publie le fichier."""
+        if self._file.closed:
+            return self.header
+        self._flush()
+        self._file.write(_FRAME.pack(0, 0))
+        index_offset = self._file.tell()
+        self._file.write(msgpack.packb(self._frames))
+        self._file.write(_TRAILER.pack(index_offset))
+        self._file.seek(0)
+        self._file.write(_PREAMBLE.pack(_MAGIC, SNAPSHOT_FORMAT_VERSION, self._count,
+                                        len(msgpack.packb(self._meta))))
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        return self.header
+
+    def abort(self) -> None:
+        """Abandonne l'écriture : la destination n'est pas modifiée."""
+        if not self._file.closed:
+            self._file.close()
+            os.unlink(self._tmp_path)
+
+
+class SnapshotReader:
+    """
+    Lecture d'un instantané : en flux ou par plage d'enregistrements.
+
+    Usage:
+        reader = SnapshotReader("pool.snap", expected_version=analyzer.taxonomy_version)
+        for cv in reader:              # trame par trame, mémoire bornée
+            ...
+        first = reader.read(0, 1000)   # seules les trames concernées sont décompressées
+
+    Attributs:
+        path (Path): Fichier lu.
+        header (SnapshotHeader): Métadonnées de l'instantané.
+
+    Raises:
+        SnapshotError: Si le fichier n'est pas un instantané, est d'un autre format,
+                       ou si `expected_version` diffère de la version enregistrée.
+    """
+    def __init__(self, path: str, expected_version: Optional[str] = None):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            preamble = f.read(_PREAMBLE.size)
+            if len(preamble) < _PREAMBLE.size:
+                raise SnapshotError(f"{path}: truncated snapshot")
+            magic, format_version, count, meta_size = _PREAMBLE.unpack(preamble)
+            if magic != _MAGIC:
+                raise SnapshotError(f"{path}: not a snapshot file")
+            if format_version not in _READABLE_FORMATS:
+                raise SnapshotError(f"{path}: unsupported snapshot format {format_version}")
+            meta = msgpack.unpackb(f.read(meta_size))
+            self._data_offset = f.tell()
+
+            f.seek(-_TRAILER.size, os.SEEK_END)
+            (index_offset,) = _TRAILER.unpack(f.read(_TRAILER.size))
+            f.seek(index_offset)
+            self._frames: List[Tuple[int, int]] = [tuple(frame) for frame in msgpack.unpackb(f.read()[:-_TRAILER.size])]
+
+        self.header = SnapshotHeader(count=count, format_version=format_version, **meta)
+        if expected_version is not None and self.header.taxonomy_version != expected_version:
+            raise SnapshotError(f"{path}: taxonomy version {self.header.taxonomy_version!r} "
+                                f"does not match {expected_version!r}")
+        self._decode = _CODECS[self.header.kind][2]
+        # Position du premier enregistrement de chaque trame (recherche par plage)
+        self._starts = [0]
+        for _, records in self._frames:
+            self._starts.append(self._starts[-1] + records)
+
+    def __len__(self) -> int:
+        return self.header.count
+
+    @property
+    def frame_count(self) -> int:
+        return len(self._frames)
+
+    def __iter__(self) -> Iterator[Record]:
+        # Lecture séquentielle des trames (sans la table) : une seule trame en mémoire à la fois
+        decompressor = zstandard.ZstdDecompressor()
+        with open(self.path, "rb") as f:
+            f.seek(self._data_offset)
+            while True:
+                size, records = _FRAME.unpack(f.read(_FRAME.size))
+                if not records:
+                    return
+                for fields in msgpack.unpackb(decompressor.decompress(f.read(size)), use_list=True):
+                    yield self._decode(fields)
+
+    def read_frames(self, frames: Sequence[int]) -> List[list]:
+        """Enregistrements bruts (listes de champs) des trames demandées, dans l'ordre donné."""
+        return _read_frames(str(self.path), [self._frames[i][0] for i in frames])
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> List[Record]:
+        """
+        Enregistrements [start, stop) : seules les trames qui les contiennent sont lues.
+
+        Args:
+            start (int, optional): Position du premier enregistrement.
+            stop (int, optional): Position de fin (exclue). Defaults à la fin de l'instantané.
+
+        Returns:
+            List[Record]: CVs ou offres, dans l'ordre d'écriture.
+        """
+        stop = len(self) if stop is None else min(stop, len(self))
+        if start >= stop:
+            return []
+        first = self._frame_of(start)
+        last = self._frame_of(stop - 1)
+        fields = self.read_frames(range(first, last + 1))
+        offset = self._starts[first]
+        return [self._decode(f) for f in fields[start - offset:stop - offset]]
+
+    def _frame_of(self, position: int) -> int:
+        low, high = 0, len(self._frames) - 1
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self._starts[middle] <= position:
+                low = middle
+            else:
+                high = middle - 1
+        return low
+
+    def read_all(self) -> List[Record]:
+        """
+        Charge tout l'instantané, trame par trame, dans le processus courant.
+
+        Reconstruire les objets domine la lecture : les recevoir d'un autre processus
+        (désérialisation pickle) coûte plus cher que de les décoder ici.
+
+        Returns:
+            List[Record]: CVs ou offres, dans l'ordre d'écriture.
+        """
+        return list(self)
+
+
+def _read_frames(path: str, offsets: Sequence[int]) -> List[list]:
+    decompressor = zstandard.ZstdDecompressor()
+    records: List[list] = []
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            size, _ = _FRAME.unpack(f.read(_FRAME.size))
+            records.extend(msgpack.unpackb(decompressor.decompress(f.read(size)), use_list=True))
+    return records
+
+
+def save_snapshot(
+    path: str, records: Iterable[Record], kind: str = "cv", taxonomy_version: Optional[str] = None,
+    chunk_size: int = 4096,
+) -> SnapshotHeader:
+    """
+    Enregistre une collection de CVs ou d'offres dans un instantané.
+
+    Returns:
+        SnapshotHeader: Métadonnées de l'instantané écrit.
+    """
+    with SnapshotWriter(path, kind=kind, taxonomy_version=taxonomy_version, chunk_size=chunk_size) as writer:
+        writer.write_all(records)
+    return writer.header
+
+
+def load_snapshot(path: str, expected_version: Optional[str] = None) -> List[Record]:
+    """
+    Recharge un instantané complet (démarrage à chaud, sans re-parsing des fichiers).
+
+    Raises:
+        SnapshotError: Si l'instantané est illisible ou d'une autre version de taxonomie.
+    """
+    return SnapshotReader(path, expected_version=expected_version).read_all()
@@ -0,0 +1,223 @@
+# ==========================================
+# Utils: Instrumentation & Metrics Registry
+# ==========================================
+
+import cProfile
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# Bornes par défaut des histogrammes de durée (secondes)
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, object]) -> LabelKey:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+class Counter:
+    """Compteur monotone, éventuellement décliné par étiquettes (ex: format="pdf")."""
+    kind = "counter"
+
+    def __init__(self, name: str, help: str):
+        self.name = name
+        self.help = help
+        self._values: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(_label_key(labels), 0)
+
+    def _export(self) -> List[str]:
+        return [f"{self.name}{_format_labels(key)} {value}" for key, value in sorted(self._values.items())]
+
+
+class Histogram:
+    """Histogramme cumulatif (compatible Prometheus) de valeurs observées, par étiquettes."""
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelKey, List[float]] = {}  # [compteurs par borne..., somme, total]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += value
+            series[-1] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(_label_key(labels))
+        return int(series[-1]) if series else 0
+
+    def sum(self, **labels) -> float:
+        series = self._series.get(_label_key(labels))
+        return series[-2] if series else 0.0
+
+    def _export(self) -> List[str]:
+        lines = []
+        for key, series in sorted(self._series.items()):
+            for bound, count in zip(self.buckets, series):
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', repr(bound)))} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {series[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {series[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {series[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registre en mémoire des métriques du processus.
+
+    Les services y enregistrent des compteurs (fichiers parsés/en échec, candidats
+    évalués/écartés) et des durées par étape (extraction, détection des champs,
+    scoring, tri). Le contenu est exportable au format texte Prometheus.
+    """
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str = "") -> Counter:
+        """Renvoie le compteur `name`, créé au premier appel."""
+        return self._get_or_create(name, lambda: Counter(name, help), Counter)
+
+    def histogram(self, name: str, help: str = "", buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Renvoie l'histogramme `name`, créé au premier appel."""
+        return self._get_or_create(name, lambda: Histogram(name, help, buckets), Histogram)
+
+    def _get_or_create(self, name, factory, kind):
+        metric = self._metrics.get(name)
+        if metric is None:
+            with self._lock:
+                metric = self._metrics.setdefault(name, factory())
+        if not isinstance(metric, kind):
+            raise ValueError(f"Metric {name} is already registered as a {metric.kind}")
+        return metric
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """Mesure la durée du bloc et l'ajoute à l'histogramme `name` (en secondes)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.histogram(name).observe(time.perf_counter() - start, **labels)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
+
+    def export_prometheus(self) -> str:
+        """Exporte toutes les métriques au format d'exposition texte de Prometheus."""
+        lines = []
+        for name in sorted(self._metrics):
+            metric = self._metrics[name]
+            if metric.help:
+                lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric._export())
+        return "\n".join(lines) + "\n"
+
+
+# Registre par défaut, utilisé par les services
+_REGISTRY = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Renvoie le registre courant des services."""
+    return _REGISTRY
+
+
+def set_registry(registry: MetricsRegistry) -> MetricsRegistry:
+    """Remplace le registre utilisé par les services (ex: registre isolé en test). Renvoie l'ancien."""
+    global _REGISTRY
+    previous, _REGISTRY = _REGISTRY, registry
+    return previous
+
+
+class ProfileReport:
+    """
+    Résultat d'une capture de profil (cProfile et, optionnellement, tracemalloc).
+
+    Attributs:
+        stats (pstats.Stats): Statistiques cProfile brutes.
+        cpu_text (str): Les `limit` fonctions les plus coûteuses, formatées.
+        peak_memory (int): Pic d'allocation (octets) si la mémoire est tracée.
+        memory_top (List[str]): Principales lignes d'allocation si la mémoire est tracée.
+    """
+    def __init__(self):
+        self.stats: Optional[pstats.Stats] = None
+        self.cpu_text = ""
+        self.peak_memory = 0
+        self.memory_top: List[str] = []
+
+
+@contextmanager
+def profile_request(memory: bool = False, sort: str = "cumulative", limit: int = 25) -> Iterator[ProfileReport]:
+    """
+    Capture un profil CPU (et mémoire) d'un seul traitement, pour localiser les points chauds.
+
+    Usage:
+        with profile_request(memory=True) as report:
+            recommender.recommend_candidates(offer, candidates)
+        print(report.cpu_text)
+
+    Args:
+        memory (bool, optional): Activer aussi tracemalloc (plus coûteux).
+        sort (str, optional): Clé de tri pstats.
+        limit (int, optional): Nombre de lignes conservées.
+
+    Yields:
+        ProfileReport: Rempli à la sortie du bloc.
+    """
+    report = ProfileReport()
+    profiler = cProfile.Profile()
+    started_tracing = memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    profiler.enable()
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        buffer = io.StringIO()
+        report.stats = pstats.Stats(profiler, stream=buffer)
+        report.stats.sort_stats(sort).print_stats(limit)
+        report.cpu_text = buffer.getvalue()
+        if memory:
+            snapshot = tracemalloc.take_snapshot()
+            report.peak_memory = tracemalloc.get_traced_memory()[1]
+            report.memory_top = [str(stat) for stat in snapshot.statistics("lineno")[:limit]]
+            if started_tracing:
+                tracemalloc.stop()
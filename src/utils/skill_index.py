@@ -0,0 +1,83 @@
+# ==========================================
+# Utils: Skill Phrase Index
+# ==========================================
+
+import re
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+# Un mot (suite de caractères de mot) ou un signe isolé ; les espaces séparent
+_TOKEN_PATTERN = re.compile(r"\w+|[^\w\s]")
+
+
+def is_word_char(char: str) -> bool:
+    """Indique si un caractère fait partie d'un mot (lettre, chiffre ou '_')."""
+    return char.isalnum() or char == "_"
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Découpe un texte en mots et signes isolés (ex: "C++ et Power BI" -> c, +, +, et, power, bi).
+
+    Les mots étant maximaux, les frontières de mots sont garanties par construction.
+    """
+    return _TOKEN_PATTERN.findall(text)
+
+
+class SkillPhraseIndex:
+    """
+    Index de compétences compilé une seule fois pour une taxonomie.
+
+    Les compétences sont indexées par leur premier mot : match_tokens les
+    retrouve toutes dans un texte déjà découpé par tokenize(), en une seule
+    lecture des mots et quel que soit le nombre d'entrées de la taxonomie. Le
+    même découpage est partagé entre plusieurs extracteurs. Les correspondances
+    portent sur des mots entiers : "java" ne correspond pas à "javascript".
+
+    Attributs:
+        patterns (List[str]): Compétences indexées (normalisées en minuscule).
+    """
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(dict.fromkeys(
+            key for key in (pattern.lower().strip() for pattern in patterns) if key
+        ))
+
+        # Index par premier mot : {mot: [(mots de la compétence, compétence), ...]}
+        self._phrases: Dict[str, List[Tuple[Tuple[str, ...], str]]] = {}
+        for pattern in self.patterns:
+            words = tuple(tokenize(pattern))
+            if words:
+                self._phrases.setdefault(words[0], []).append((words, pattern))
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def match_tokens(self, tokens: Sequence[str]) -> Iterator[str]:
+        """
+        Renvoie chaque occurrence de compétence dans un texte découpé par tokenize().
+
+        Args:
+            tokens (Sequence[str]): Mots et signes du texte en minuscule.
+
+        Yields:
+            str: Compétence, une fois par occurrence.
+        """
+        phrases = self._phrases
+        for i, token in enumerate(tokens):
+            candidates = phrases.get(token)
+            if candidates is None:
+                continue
+            for words, pattern in candidates:
+                if len(words) == 1 or tuple(tokens[i:i + len(words)]) == words:
+                    yield pattern
+
+    def find_all(self, text: str) -> List[str]:
+        """
+        Renvoie les compétences distinctes trouvées, dans l'ordre de première apparition.
+
+        Args:
+            text (str): Texte brut (la mise en minuscule est faite ici).
+
+        Returns:
+            List[str]: Compétences trouvées, sans doublons.
+        """
+        return list(dict.fromkeys(self.match_tokens(tokenize(text.lower()))))
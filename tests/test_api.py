@@ -0,0 +1,115 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src import api
+from src.api import create_app
+
+OFFER = {
+    "id": "JOB_101", "title": "Data Scientist", "required_skills": ["python", "machine learning", "sql"],
+    "min_years_experience": 5.0, "location": "Paris", "remote_allowed": True,
+}
+
+
+@pytest.fixture
+def client():
+    with TestClient(create_app(parse_workers=0)) as test_client:
+        yield test_client
+
+
+class TestAPI:
+
+    def test_parse_text_then_recommend(self, client):
+        """Test le parcours complet : parsing de CVs texte puis classement pour une offre."""
+        client.post("/cvs/text", json={"candidate_id": "C1", "text": "Python, SQL, Machine Learning. 6 ans. Paris."})
+        client.post("/cvs/text", json={"candidate_id": "C2", "text": "Python. 2 ans. Lyon."})
+
+        response = client.post("/recommendations", json={"offer": OFFER, "top_k": 2})
+
+        assert response.status_code == 200
+        assert [r["cv_id"] for r in response.json()] == ["C1", "C2"]
+        assert response.json()[0]["score"] == 100.0
+        assert response.json()[1]["breakdown"]["missing_skills"] == ["machine learning", "sql"]
+
+    def test_match_pair(self, client):
+        cv = {"id": "C1", "name": "Alice", "skills": ["Python", "SQL"], "years_experience": 5.0, "location": "Remote"}
+        response = client.post("/match", json={"cv": cv, "offer": OFFER})
+
+        assert response.status_code == 200
+        assert response.json()["score"] == pytest.approx(83.33)
+        assert "machine learning" in response.json()["explanation"]
+        breakdown = response.json()["breakdown"]
+        assert breakdown["skills"] == pytest.approx(2 / 3)
+        assert breakdown["missing_skills"] == ["machine learning"]
+        assert breakdown["experience_gap"] == 0.0
+        assert breakdown["location_compatible"]
+
+    @pytest.mark.parametrize("parse_workers", [0, 1])
+    def test_upload_file(self, parse_workers):
+        """Test l'upload d'un fichier, parsé dans le pool de processus."""
+        with TestClient(create_app(parse_workers=parse_workers)) as client:
+            response = client.post("/cvs/upload", params={"candidate_id": "C9", "filename": "cv.txt"},
+                                   content="React et AWS, 3 ans d'expérience. Télétravail.".encode("utf-8"))
+            assert response.status_code == 200
+            assert set(response.json()["skills"]) == {"react", "aws"}
+            assert response.json()["location"] == "Remote"
+            assert client.get("/health").json()["candidates"] == 1
+
+    def test_text_cv_is_parsed_in_parse_pool(self, client):
+        """Test que le parsing d'un CV texte passe par le pool de parsing, comme les fichiers."""
+        submitted = []
+
+        class RecordingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(fn.__name__)
+                return super().submit(fn, *args, **kwargs)
+
+        with RecordingExecutor(1) as executor:
+            client.app.state.parse_executor = executor
+            response = client.post("/cvs/text", json={"candidate_id": "C1", "text": "Python et SQL. 3 ans. Lyon."})
+        assert response.status_code == 200
+        assert response.json()["skills"] == ["python", "sql"]
+        assert submitted == ["_parse_text"]
+
+    def test_upload_rejects_oversized_body(self):
+        """Test qu'un fichier trop volumineux est refusé (taille annoncée ou lue en flux)."""
+        with TestClient(create_app(parse_workers=0, max_upload_bytes=64)) as client:
+            params = {"candidate_id": "C9", "filename": "cv.txt"}
+            assert client.post("/cvs/upload", params=params, content=b"x" * 65).status_code == 413
+            # Corps envoyé par morceaux, sans Content-Length
+            chunks = iter([b"x" * 40, b"x" * 40])
+            assert client.post("/cvs/upload", params=params, content=chunks).status_code == 413
+            assert client.post("/cvs/upload", params=params, content=b"Python. 2 ans.").status_code == 200
+            assert client.get("/health").json()["candidates"] == 1
+
+    def test_pending_parses_are_capped(self, monkeypatch):
+        """Test que le nombre de parsings simultanés ne dépasse pas max_pending_parses."""
+        running, peak, lock = [0], [0], threading.Lock()
+        parse_text = api._parse_text
+
+        def slow_parse(text, candidate_id):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return parse_text(text, candidate_id)
+
+        monkeypatch.setattr(api, "_parse_text", slow_parse)
+        with TestClient(create_app(parse_workers=0, max_pending_parses=2)) as client, \
+                ThreadPoolExecutor(6) as requests:
+            executor = client.app.state.parse_executor = ThreadPoolExecutor(6)
+            responses = list(requests.map(
+                lambda i: client.post("/cvs/text", json={"candidate_id": f"C{i}", "text": "Python. 2 ans."}),
+                range(6)))
+            executor.shutdown()
+        assert [r.status_code for r in responses] == [200] * 6
+        assert peak[0] == 2
+
+    def test_upload_rejects_unsupported_format(self, client):
+        response = client.post("/cvs/upload", params={"candidate_id": "C9", "filename": "cv.odt"}, content=b"...")
+        assert response.status_code == 415
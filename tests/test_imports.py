@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+from src.services.analyzer import CVAnalyzer
+
+HEAVY_MODULES = ("pdfplumber", "docx", "scipy", "sklearn", "rapidfuzz")
+
+
+def loaded_after(statement):
+    code = f"import sys\n{statement}\nprint(' '.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout.split()
+
+
+class TestLightweightImports:
+
+    def test_scoring_path_skips_heavy_modules(self):
+        """Test que le chemin de calcul des scores ne charge ni lecteurs de fichiers, ni SciPy, ni RapidFuzz."""
+        assert loaded_after("import src.services.recommender") == []
+
+    def test_file_backends_loaded_on_first_use(self, tmp_path):
+        assert "pdfplumber" not in loaded_after("import src.services.analyzer")
+        assert "docx" not in loaded_after("import src.services.analyzer")
+
+        path = tmp_path / "CAND_1.txt"
+        path.write_text("Python", encoding="utf-8")
+        statement = f"from src.services.analyzer import CVAnalyzer\nCVAnalyzer().parse_from_file({str(path)!r}, 'C1')"
+        assert "pdfplumber" not in loaded_after(statement)
+
+    def test_missing_backend_only_fails_its_format(self, tmp_path, monkeypatch):
+        # Une entrée None dans sys.modules fait échouer l'import, comme une librairie absente
+        monkeypatch.setitem(sys.modules, "pdfplumber", None)
+        pdf = tmp_path / "CAND_1.pdf"
+        pdf.write_bytes(b"%PDF-1.4")
+        txt = tmp_path / "CAND_2.txt"
+        txt.write_text("Python", encoding="utf-8")
+
+        analyzer = CVAnalyzer()
+        assert analyzer.parse_from_file(str(pdf), "CAND_1") is None
+        assert analyzer.parse_from_file(str(txt), "CAND_2").skills == ["python"]
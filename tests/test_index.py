@@ -0,0 +1,96 @@
+import pytest
+from src.models import CV, JobOffer, LocationEnum
+from src.services.index import CandidateIndex, OfferIndex
+from src.services.matcher import MatchingEngine
+from src.services.recommender import RecommendationSystem
+
+
+def make_cv(cv_id, skills, location=LocationEnum.PARIS, available=True, years=3.0):
+    return CV(id=cv_id, name=cv_id, skills=skills, years_experience=years,
+              location=location, availability_immediate=available)
+
+
+@pytest.fixture
+def lyon_offer():
+    return JobOffer(id="JOB_LYON", title="Data Engineer", required_skills=["python", "sql"],
+                    min_years_experience=2.0, location=LocationEnum.LYON, remote_allowed=True)
+
+
+@pytest.fixture
+def index():
+    return CandidateIndex([
+        make_cv("C_SKILL", ["Python"], LocationEnum.PARIS),
+        make_cv("C_LYON", ["excel"], LocationEnum.LYON),
+        make_cv("C_REMOTE", ["react"], LocationEnum.REMOTE, available=False),
+        make_cv("C_NONE", ["java"], LocationEnum.PARIS),
+    ])
+
+
+class TestCandidateIndex:
+
+    def test_candidates_for_skips_unrelated_profiles(self, index, lyon_offer):
+        """Test que seuls les candidats partageant une compétence ou compatibles géographiquement sont retenus."""
+        ids = {cv.id for cv in index.candidates_for(lyon_offer)}
+        assert ids == {"C_SKILL", "C_LYON", "C_REMOTE"}
+
+    def test_only_available_filter(self, index, lyon_offer):
+        ids = {cv.id for cv in index.candidates_for(lyon_offer, only_available=True)}
+        assert ids == {"C_SKILL", "C_LYON"}
+
+    def test_incremental_update_and_remove(self, index, lyon_offer):
+        """Test que les postings suivent les mises à jour et suppressions."""
+        index.update(make_cv("C_NONE", ["sql"], LocationEnum.PARIS))
+        index.remove("C_SKILL")
+
+        ids = {cv.id for cv in index.candidates_for(lyon_offer)}
+        assert ids == {"C_NONE", "C_LYON", "C_REMOTE"}
+        assert len(index) == 3
+        with pytest.raises(ValueError):
+            index.add(make_cv("C_LYON", []))
+
+    def test_recommender_accepts_index(self, index, lyon_offer):
+        """Test que le classement via l'index équivaut au scan linéaire sur les candidats plausibles."""
+        reco = RecommendationSystem(MatchingEngine())
+        via_index = reco.recommend_candidates(lyon_offer, index, top_k=3)
+        via_list = reco.recommend_candidates(lyon_offer, list(index), top_k=3)
+
+        assert [r["cv_id"] for r in via_index] == [r["cv_id"] for r in via_list]
+
+
+class TestOfferIndex:
+
+    @pytest.fixture
+    def catalog(self):
+        return [
+            JobOffer(id="O_PY", title="Dev Python", required_skills=["python"], min_years_experience=2.0,
+                     location=LocationEnum.LYON, remote_allowed=False),
+            JobOffer(id="O_PARIS", title="Analyste", required_skills=["excel"], min_years_experience=0.0,
+                     location=LocationEnum.PARIS, remote_allowed=False),
+            JobOffer(id="O_REMOTE", title="Front", required_skills=["react"], min_years_experience=1.0,
+                     location=LocationEnum.LYON, remote_allowed=True),
+            JobOffer(id="O_OPEN", title="Stage", required_skills=[], min_years_experience=0.0,
+                     location=LocationEnum.LYON, remote_allowed=False),
+            JobOffer(id="O_JAVA", title="Dev Java", required_skills=["java"], min_years_experience=5.0,
+                     location=LocationEnum.LYON, remote_allowed=False),
+        ]
+
+    def test_offers_for_candidate(self, catalog):
+        """Test que seules les offres plausibles (compétence, localisation, remote, sans prérequis) sont retenues."""
+        index = OfferIndex(catalog)
+        cv = make_cv("C1", ["python"], LocationEnum.REMOTE)
+
+        assert {o.id for o in index.offers_for(cv)} == {"O_PY", "O_REMOTE", "O_OPEN"}
+
+        index.remove("O_OPEN")
+        assert {o.id for o in index.offers_for(cv)} == {"O_PY", "O_REMOTE"}
+
+    def test_recommend_offers_matches_linear_scan(self, catalog):
+        """Test que recommend_offers via l'index classe comme le scan complet, sur les offres retenues."""
+        reco = RecommendationSystem(MatchingEngine())
+        cv = make_cv("C1", ["python", "react"], LocationEnum.PARIS, years=3.0)
+
+        via_index = reco.recommend_offers(cv, OfferIndex(catalog), top_k=3)
+        via_list = reco.recommend_offers(cv, catalog, top_k=3)
+
+        assert [r["offer_id"] for r in via_index] == [r["offer_id"] for r in via_list]
+        assert via_index[0]["explanation"].startswith(f"Score : {via_index[0]['score']}/100.")
@@ -0,0 +1,75 @@
+import asyncio
+
+import pytest
+from src.services.analyzer import CVAnalyzer
+from src.services.index import CandidateIndex
+from src.services.ingestion import IngestionPipeline
+
+
+def write_cvs(tmp_path, count):
+    paths = []
+    for i in range(count):
+        path = tmp_path / f"CAND_{i:03d}.txt"
+        path.write_text(f"Candidat {i}\nPython et SQL, {i % 10} ans. Lyon.", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+class TestIngestionPipeline:
+
+    @pytest.mark.parametrize("workers", [0, 2])
+    def test_ingests_in_bounded_batches(self, tmp_path, workers):
+        """Test l'ingestion complète (lots de taille bornée, échecs remontés sans interrompre le flux)."""
+        paths = write_cvs(tmp_path, 23) + [str(tmp_path / "absent.pdf")]
+        index, failures = CandidateIndex(), []
+
+        async def run():
+            pipeline = IngestionPipeline(CVAnalyzer(), index, batch_size=5, flush_interval=1.0, max_queue=4,
+                                         workers=workers, on_error=failures.append)
+            async with pipeline:
+                await pipeline.submit_many(paths)
+            return pipeline
+
+        pipeline = asyncio.run(run())
+        assert len(index) == 23 and "CAND_007" in index
+        assert [f.path for f in failures] == [paths[-1]]
+        assert (pipeline.stats.submitted, pipeline.stats.parsed, pipeline.stats.failed) == (24, 23, 1)
+        assert pipeline.stats.batches == 5
+
+    def test_partial_batch_flushed_on_time(self, tmp_path):
+        paths = write_cvs(tmp_path, 2)
+        index = CandidateIndex()
+
+        async def run():
+            async with IngestionPipeline(CVAnalyzer(), index, batch_size=100, flush_interval=0.05,
+                                         workers=0) as pipeline:
+                await pipeline.submit_many(paths)
+                await asyncio.sleep(0.5)
+                # Le lot incomplet est parti sans attendre la fermeture du pipeline
+                assert len(index) == 2
+                assert pipeline.stats.batches == 1
+
+        asyncio.run(run())
+
+    def test_backpressure_and_cancellation(self, tmp_path):
+        """Test qu'une file pleine bloque submit() et que cancel() abandonne le reste."""
+        paths = write_cvs(tmp_path, 10)
+        index = CandidateIndex()
+
+        async def run():
+            pipeline = IngestionPipeline(CVAnalyzer(), index, batch_size=1, flush_interval=0.0, max_queue=2,
+                                         workers=0, max_in_flight=1)
+            await pipeline.start()
+            producer = asyncio.create_task(pipeline.submit_many(paths))
+            await asyncio.sleep(0)
+            assert not producer.done()
+            assert pipeline._queue.qsize() <= 2
+            await pipeline.cancel()
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            with pytest.raises(RuntimeError):
+                await pipeline.submit(paths[0])
+            return pipeline
+
+        pipeline = asyncio.run(run())
+        assert pipeline.stats.parsed < len(paths)
@@ -0,0 +1,51 @@
+import pytest
+from benchmarks.synthetic import SyntheticGenerator
+from src.models import CV, JobOffer, LocationEnum
+from src.services.lsh import MinHashLSHIndex, measure_recall
+from src.services.matcher import MatchingEngine
+from src.services.recommender import RecommendationSystem
+
+
+def make_cv(cv_id, skills, available=True):
+    return CV(id=cv_id, name=cv_id, skills=skills, years_experience=3.0, location=LocationEnum.PARIS,
+              availability_immediate=available)
+
+
+@pytest.fixture
+def offer():
+    return JobOffer(id="J1", title="Data", required_skills=["python", "sql", "pandas"], min_years_experience=2.0,
+                    location=LocationEnum.PARIS, remote_allowed=False)
+
+
+class TestMinHashLSHIndex:
+
+    def test_identical_skill_sets_always_collide(self, offer):
+        index = MinHashLSHIndex([make_cv("SAME", ["pandas", "sql", "python"]), make_cv("OTHER", ["react", "css"]),
+                                 make_cv("EMPTY", [])])
+        ids = {cv.id for cv in index.candidates_for(offer)}
+        assert "SAME" in ids
+        assert "OTHER" not in ids and "EMPTY" not in ids
+
+    def test_incremental_updates(self, offer):
+        index = MinHashLSHIndex([make_cv("C1", ["react"])])
+        assert index.candidates_for(offer) == []
+        index.update(make_cv("C1", ["python", "sql", "pandas"], available=False))
+        assert [cv.id for cv in index.candidates_for(offer)] == ["C1"]
+        assert index.candidates_for(offer, only_available=True) == []
+        index.remove("C1")
+        assert len(index) == 0 and index.candidates_for(offer) == []
+        with pytest.raises(ValueError):
+            MinHashLSHIndex(num_perm=64, bands=10)
+
+    def test_more_bands_raise_recall(self):
+        """Test que le rappel@k mesuré contre le classement exact croît avec le nombre de bandes."""
+        gen = SyntheticGenerator(seed=3)
+        cvs, offers = gen.cvs(2000), gen.offers(20)
+        recommender = RecommendationSystem(MatchingEngine())
+        recalls = [measure_recall(recommender, offers, cvs, MinHashLSHIndex(cvs, num_perm=64, bands=bands), 10)
+                   for bands in (8, 32, 64)]
+        assert recalls == sorted(recalls)
+        assert recalls[-1] >= 0.9
+        index = MinHashLSHIndex(num_perm=64, bands=32)
+        assert index.collision_probability(1.0) == 1.0
+        assert index.collision_probability(0.5) > MinHashLSHIndex(num_perm=64, bands=8).collision_probability(0.5)
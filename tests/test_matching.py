@@ -1,6 +1,9 @@
+import pickle
 import pytest
 from src.models import CV, JobOffer, LocationEnum
 from src.services.analyzer import CVAnalyzer
+from src.services.cache import ParseCache
+from src.services import matcher as matcher_module
 from src.services.matcher import MatchingEngine
 from src.services.recommender import RecommendationSystem
 
@@ -8,6 +11,31 @@ from src.services.recommender import RecommendationSystem
 # FIXTURES (Données de test réutilisables)
 # ==========================================
 
+def write_pdf(path, pages):
+    """Écrit un PDF minimal (une ligne de texte Helvetica par page), sans dépendance externe."""
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{o:010d} 00000 n \n" for o in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(out)
+
+
 @pytest.fixture
 def sample_job_offer():
     """Une offre de référence pour les tests."""
@@ -56,6 +84,33 @@ def remote_candidate():
         availability_immediate=True
     )
 
+# ==========================================
+# TESTS MODÈLES DE DONNÉES
+# ==========================================
+
+class TestDataModels:
+
+    def test_compact_cv_keeps_public_attributes(self):
+        """Test que le CV compact (slots + identifiants internés) expose les mêmes attributs."""
+        cv = CV(id="C1", name="Alice", skills=["Python", " SQL ", "python"], years_experience=3.0,
+                location=LocationEnum.LYON, availability_immediate=False)
+
+        assert not hasattr(cv, "__dict__")
+        assert cv.skills == ["python", "sql"]
+        assert cv.location == LocationEnum.LYON
+        assert len(cv.skill_ids) == 2
+
+    def test_pickle_roundtrip_uses_skill_names(self):
+        """Test que la sérialisation transporte les libellés (identifiants propres au processus)."""
+        import pickle
+        offer = JobOffer(id="J1", title="Dev", required_skills=["React", "AWS"],
+                         min_years_experience=1.0, location=LocationEnum.REMOTE, remote_allowed=True)
+        cv = CV(id="C1", name="Alice", skills=["React"], years_experience=3.0,
+                location=LocationEnum.PARIS, availability_immediate=True, raw_text="React")
+
+        assert pickle.loads(pickle.dumps(offer)) == offer
+        assert pickle.loads(pickle.dumps(cv)) == cv
+
 # ==========================================
 # TESTS MODULE A & B : ANALYZER & MATCHING
 # ==========================================
@@ -85,6 +140,143 @@ class TestCVAnalyzer:
         assert set(skills) == {"python", "java"}
         assert len(skills) == 2
 
+    def test_extract_skills_word_boundaries(self):
+        """Test que 'java' n'est pas détecté à l'intérieur de 'javascript'."""
+        analyzer = CVAnalyzer()
+        skills = analyzer._extract_skills("Expert JavaScript, SQL et Machine Learning.")
+
+        assert "java" not in skills
+        assert set(skills) == {"sql", "machine learning"}
+
+    def test_extract_skills_overlapping_patterns(self):
+        """Test que l'index trouve les motifs imbriqués en un seul passage."""
+        analyzer = CVAnalyzer(taxonomy=["learning", "machine learning", "c++", "c"])
+        skills = analyzer._extract_skills("Machine learning en C++ (et un peu de C).")
+
+        assert set(skills) == {"learning", "machine learning", "c++", "c"}
+
+    def test_parse_extracts_all_fields_in_one_pass(self):
+        """Test l'extraction du nom, de la disponibilité et de la localisation depuis un flux de segments."""
+        analyzer = CVAnalyzer()
+        cv = analyzer.parse_from_stream(["\n  Jean DUPONT \n", "Python, SQL. 6 ans. ",
+                                         "Basé à Lyon, préavis de 3 mois."], "C1")
+
+        assert (cv.name, cv.skills, cv.years_experience) == ("Jean DUPONT", ["python", "sql"], 6.0)
+        assert cv.location == LocationEnum.LYON
+        assert cv.availability_immediate is False
+
+        cv = analyzer.parse_from_text("Data Scientist\nPréavis négociable, disponible immédiatement. Lyonnais.", "C2")
+        assert cv.name == "Candidat Extrait"
+        assert cv.availability_immediate is True
+        # Mot entier uniquement : "Lyonnais" n'est pas "Lyon" (localisation par défaut)
+        assert cv.location == LocationEnum.PARIS
+
+    @pytest.mark.parametrize("max_workers", [1, 2])
+    def test_parse_many_reports_failures(self, tmp_path, max_workers):
+        """Test le parsing en lot : CVs dans l'ordre d'entrée et échecs remontés sans interrompre le lot."""
+        paths = []
+        for i in range(5):
+            path = tmp_path / f"CAND_{i}.txt"
+            path.write_text(f"Candidat {i}\nPython et SQL, {i + 1} ans d'expérience. Lyon.", encoding="utf-8")
+            paths.append(str(path))
+        (tmp_path / "notes.odt").write_text("format non supporté")
+        paths.insert(2, str(tmp_path / "notes.odt"))
+        paths.append(str(tmp_path / "absent.pdf"))
+
+        failures = []
+        analyzer = CVAnalyzer()
+        cvs = list(analyzer.parse_many(paths, max_workers=max_workers, chunksize=2,
+                                       ordered=True, on_error=failures.append))
+
+        assert [cv.id for cv in cvs] == [f"CAND_{i}" for i in range(5)]
+        assert cvs[3].years_experience == 4.0
+        assert sorted(f.path for f in failures) == sorted([paths[2], paths[-1]])
+
+    def test_parse_cache_hit_and_taxonomy_invalidation(self, tmp_path, monkeypatch):
+        """Test qu'un fichier déjà vu est servi par le cache, et qu'une nouvelle taxonomie l'invalide."""
+        cv_file = tmp_path / "cv.txt"
+        cv_file.write_text("Python, SQL et React. 4 ans d'expérience.", encoding="utf-8")
+        cache = ParseCache(str(tmp_path / "cache"))
+
+        analyzer = CVAnalyzer(cache=cache)
+        first = analyzer.parse_from_file(str(cv_file), "CAND_A")
+
+        # Un hit ne doit plus lire le fichier
+        monkeypatch.setattr(analyzer, "_iter_text", lambda path: pytest.fail("cache miss"))
+        second = analyzer.parse_from_file(str(cv_file), "CAND_B")
+        assert second.id == "CAND_B"
+        assert second.skills == first.skills and second.raw_text == first.raw_text
+
+        other = CVAnalyzer(taxonomy=["react"], cache=cache)
+        assert other.taxonomy_version != analyzer.taxonomy_version
+        assert other.parse_from_file(str(cv_file), "CAND_C").skills == ["react"]
+
+    def test_parse_cache_not_shared_across_read_caps(self, tmp_path):
+        """Test qu'un parsing tronqué (max_chars, max_pages) n'est pas servi à un analyseur sans plafond."""
+        cv_file = tmp_path / "cv.txt"
+        cv_file.write_text("Basé à Lyon, 5 ans d'expérience.\nPython et SQL.", encoding="utf-8")
+        cache = ParseCache(str(tmp_path / "cache"))
+
+        capped = CVAnalyzer(cache=cache, max_chars=10).parse_from_file(str(cv_file), "CAND_A")
+        assert capped.skills == [] and capped.years_experience == 0.0
+        full = CVAnalyzer(cache=cache).parse_from_file(str(cv_file), "CAND_A")
+        assert full.skills == ["python", "sql"]
+        assert (full.years_experience, full.location) == (5.0, LocationEnum.LYON)
+        assert CVAnalyzer(max_pages=2).taxonomy_version not in (CVAnalyzer().taxonomy_version,
+                                                                  CVAnalyzer(max_chars=10).taxonomy_version)
+
+    def test_parse_cache_keeps_text_whatever_keep_raw_text(self, tmp_path):
+        """Test que le texte brut est en cache même si l'analyseur qui l'a écrit ne le garde pas."""
+        cv_file = tmp_path / "cv.txt"
+        cv_file.write_text("Python et SQL. 4 ans d'expérience.", encoding="utf-8")
+        cache = ParseCache(str(tmp_path / "cache"))
+
+        lean = CVAnalyzer(cache=cache, keep_raw_text=False).parse_from_file(str(cv_file), "CAND_A")
+        assert lean.raw_text is None
+        full = CVAnalyzer(cache=cache).parse_from_file(str(cv_file), "CAND_A")
+        assert full.raw_text == "Python et SQL. 4 ans d'expérience."
+        assert full.skills == lean.skills == ["python", "sql"]
+
+    def test_parse_cache_keeps_other_versions_unless_asked(self, tmp_path):
+        """Test que les entrées des autres taxonomies ne sont supprimées que sur demande."""
+        shared = ParseCache(str(tmp_path))
+        shared.put("a" * 64, "v1", {"text": "v1"})
+        shared.put("b" * 64, "v2", {"text": "v2"})
+        assert shared.get("a" * 64, "v1") == {"text": "v1"}
+
+        dedicated = ParseCache(str(tmp_path), purge_stale_versions=True)
+        dedicated.put("c" * 64, "v3", {"text": "v3"})
+        assert shared.get("a" * 64, "v1") is None and shared.get("b" * 64, "v2") is None
+        assert pickle.loads(pickle.dumps(dedicated)).purge_stale_versions
+
+    def test_parse_cache_lru_eviction(self, tmp_path):
+        """Test que le cache reste sous sa taille maximale en évinçant les entrées les plus anciennes."""
+        cache = ParseCache(str(tmp_path), max_bytes=2000)
+        for i in range(20):
+            cache.put(f"{i:064x}", "v1", {"text": "x" * 200})
+
+        total = sum(p.stat().st_size for p in tmp_path.glob("*/*/*.json"))
+        assert total <= 2000
+        assert cache.get(f"{19:064x}", "v1") is not None
+        assert cache.get(f"{0:064x}", "v1") is None
+
+    def test_pdf_streaming_respects_page_and_char_caps(self, tmp_path):
+        """Test l'extraction PDF page par page avec plafonds de pages et de caractères."""
+        pdf_path = tmp_path / "long_cv.pdf"
+        write_pdf(pdf_path, ["Python developer, 6 years", "Based in Lyon", "AWS and React"])
+
+        full = CVAnalyzer().parse_from_file(str(pdf_path), "CAND_PDF")
+        assert set(full.skills) == {"python", "aws", "react"}
+        assert full.location == LocationEnum.LYON
+        assert full.years_experience == 6.0
+
+        capped = CVAnalyzer(max_pages=2).parse_from_file(str(pdf_path), "CAND_PDF")
+        assert capped.skills == ["python"]
+        assert capped.location == LocationEnum.LYON
+
+        truncated = CVAnalyzer(max_chars=10).parse_from_file(str(pdf_path), "CAND_PDF")
+        assert truncated.raw_text == "Python dev"
+
 class TestMatchingEngine:
 
     def test_perfect_match_score(self, perfect_candidate, sample_job_offer):
@@ -142,6 +334,49 @@ class TestMatchingEngine:
         # Si tout le reste est parfait (1.0), le score sera 0.8
         assert score == 80.0
 
+    def test_evaluate_breakdown(self, junior_candidate, remote_candidate, sample_job_offer):
+        """Test que evaluate() reproduit compute_match et expose le détail utilisé par l'explication."""
+        engine = MatchingEngine()
+        match = engine.evaluate(junior_candidate, sample_job_offer)
+
+        assert match.score == engine.compute_match(junior_candidate, sample_job_offer)
+        assert match.subscores == {"skills": pytest.approx(2 / 3), "experience": 0.4, "location": 1.0}
+        assert match.missing_skills == ("machine learning",)
+        assert match.experience_gap == 3.0
+        assert match.location_compatible
+        assert match.explanation == engine.explain_score(junior_candidate, sample_job_offer, match.score)
+        assert "Compétences manquantes : machine learning." in match.explanation
+        assert "Expérience insuffisante (2.0 ans vs 5.0 requis)." in match.explanation
+
+        local_offer = JobOffer(id="JOB_LOCAL", title="Dev", required_skills=["aws", "python", "docker"],
+                               min_years_experience=0, location=LocationEnum.LYON, remote_allowed=False)
+        match = engine.evaluate(remote_candidate, local_offer)
+        assert match.missing_skills == ("aws", "docker")
+        assert match.experience_gap == 0.0
+        assert not match.location_compatible
+
+    def test_match_matrix_equals_pairwise(self, perfect_candidate, junior_candidate, remote_candidate, sample_job_offer):
+        """Test que la matrice vectorisée reproduit exactement compute_match."""
+        engine = MatchingEngine(weights={"skills": 0.45, "experience": 0.35, "location": 0.2})
+        offers = [
+            sample_job_offer,
+            JobOffer(id="JOB_LYON", title="Dev", required_skills=["Java", "sql", "aws"],
+                     min_years_experience=3.0, location=LocationEnum.LYON, remote_allowed=False),
+            JobOffer(id="JOB_OPEN", title="Stagiaire", required_skills=[],
+                     min_years_experience=0, location=LocationEnum.REMOTE, remote_allowed=True),
+            # Mêmes exigences d'expérience et de lieu que JOB_101 : colonnes partagées
+            JobOffer(id="JOB_ML", title="ML Engineer", required_skills=["python", "aws"],
+                     min_years_experience=5.0, location=LocationEnum.PARIS, remote_allowed=True),
+        ]
+        cvs = [perfect_candidate, junior_candidate, remote_candidate]
+
+        matrix = engine.compute_match_matrix(cvs, offers)
+
+        assert matrix.shape == (3, 4)
+        for i, cv in enumerate(cvs):
+            for j, offer in enumerate(offers):
+                assert matrix[i, j] == engine.compute_match(cv, offer)
+
 # ==========================================
 # TESTS MODULE C : RECOMMANDATION
 # ==========================================
@@ -178,4 +413,38 @@ class TestRecommendationSystem:
         
         assert len(results) == 1
         # Celui avec le meilleur score (Perfect ou Remote sont tous deux à 100, l'ordre dépend du tri stable de python)
-        assert results[0]['score'] == 100.0
\ No newline at end of file
+        assert results[0]['score'] == 100.0
+
+    def test_ties_broken_by_cv_id(self, sample_job_offer, perfect_candidate, remote_candidate):
+        """Test que les égalités de score sont départagées de façon déterministe par cv_id."""
+        reco = RecommendationSystem(MatchingEngine())
+
+        # Les deux candidats ont 100 : CAND_PERFECT < CAND_REMOTE quel que soit l'ordre d'entrée
+        for candidates in ([remote_candidate, perfect_candidate], [perfect_candidate, remote_candidate]):
+            results = reco.recommend_candidates(sample_job_offer, candidates, top_k=2)
+            assert [r["cv_id"] for r in results] == ["CAND_PERFECT", "CAND_REMOTE"]
+
+    def test_breakdown_computed_once_for_survivors(self, sample_job_offer, perfect_candidate,
+                                                  junior_candidate, monkeypatch):
+        """Test que le détail du scoring est réutilisé et que les résultats sont des dictionnaires complets."""
+        matcher = MatchingEngine()
+        calls = []
+        subscores = matcher._subscores
+        monkeypatch.setattr(matcher, "_subscores", lambda cv, offer: calls.append(cv.id) or subscores(cv, offer))
+
+        results = RecommendationSystem(matcher).recommend_candidates(
+            sample_job_offer, [junior_candidate, perfect_candidate], top_k=2)
+
+        assert sorted(calls) == ["CAND_JUNIOR", "CAND_PERFECT"]  # un seul calcul par candidat
+        junior = results[1]
+        assert junior["explanation"] == matcher.explain_score(junior_candidate, sample_job_offer, junior["score"])
+        assert dict(junior) == junior and "explanation" in list(junior)
+        assert junior["subscores"]["experience"] == 0.4
+        assert len(calls) == 2
+
+        # Seul le candidat retenu est expliqué
+        rendered = []
+        render = matcher_module._render_explanation
+        monkeypatch.setattr(matcher_module, "_render_explanation", lambda *args: rendered.append(args) or render(*args))
+        RecommendationSystem(matcher).recommend_candidates(sample_job_offer, [junior_candidate, perfect_candidate], top_k=1)
+        assert len(rendered) == 1
@@ -0,0 +1,59 @@
+import pytest
+
+from src.models import JobOffer, LocationEnum
+from src.services.analyzer import CVAnalyzer
+from src.services.index import CandidateIndex
+from src.services.matcher import MatchingEngine
+from src.services.recommender import RecommendationSystem
+from src.utils.metrics import MetricsRegistry, profile_request, set_registry
+
+
+@pytest.fixture
+def registry():
+    """Registre isolé, restauré après le test."""
+    fresh = MetricsRegistry()
+    previous = set_registry(fresh)
+    yield fresh
+    set_registry(previous)
+
+
+class TestMetrics:
+
+    def test_prometheus_export(self, registry):
+        registry.counter("files_total", "Fichiers").inc(2, format="pdf")
+        registry.histogram("stage_seconds", buckets=(0.1, 1.0)).observe(0.5, stage="scoring")
+
+        text = registry.export_prometheus()
+
+        assert '# TYPE files_total counter' in text
+        assert 'files_total{format="pdf"} 2' in text
+        assert 'stage_seconds_bucket{stage="scoring",le="0.1"} 0' in text
+        assert 'stage_seconds_bucket{stage="scoring",le="1.0"} 1' in text
+        assert 'stage_seconds_count{stage="scoring"} 1' in text
+
+    def test_pipeline_records_stages_and_counters(self, registry, tmp_path):
+        """Test que parsing et recommandation alimentent le registre (formats, étapes, candidats écartés)."""
+        analyzer = CVAnalyzer()
+        (tmp_path / "c1.txt").write_text("Python et SQL, 4 ans. Paris.", encoding="utf-8")
+        cv = analyzer.parse_from_file(str(tmp_path / "c1.txt"), "C1")
+        analyzer.parse_from_file(str(tmp_path / "absent.pdf"), "C2")
+        other = analyzer.parse_from_text("Excel. Lyon.", "C3")
+
+        offer = JobOffer(id="J1", title="Data", required_skills=["python"], min_years_experience=2.0,
+                         location=LocationEnum.PARIS, remote_allowed=False)
+        RecommendationSystem(MatchingEngine()).recommend_candidates(offer, CandidateIndex([cv, other]), top_k=1)
+
+        assert registry.counter("cv_files_parsed_total").value(format="txt") == 1
+        assert registry.counter("cv_files_failed_total").value(format="pdf") == 1
+        assert registry.counter("candidates_scored_total").value() == 1
+        assert registry.counter("candidates_pruned_total").value() == 1
+        stages = registry.histogram("pipeline_stage_seconds")
+        assert stages.count(stage="field_extraction") == 2
+        assert stages.count(stage="scoring") == 1
+
+    def test_profile_request_captures_cpu_and_memory(self):
+        with profile_request(memory=True, limit=5) as report:
+            CVAnalyzer().parse_from_text("Python " * 1000, "C1")
+
+        assert "parse_from_stream" in report.cpu_text
+        assert report.peak_memory > 0
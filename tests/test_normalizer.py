@@ -0,0 +1,85 @@
+import pickle
+
+import pytest
+from src.models import CV, JobOffer, LocationEnum, set_skill_normalizer
+from src.services.analyzer import CVAnalyzer
+from src.services import normalizer as normalizer_module
+from src.services.normalizer import SkillNormalizer
+
+TAXONOMY = ["python", "java", "javascript", "sql", "machine learning", "react", "scikit-learn", "go"]
+
+
+@pytest.fixture
+def normalizer():
+    return SkillNormalizer(TAXONOMY)
+
+
+@pytest.fixture
+def installed(normalizer):
+    """Installe le normaliseur pour CV et JobOffer le temps du test."""
+    previous = set_skill_normalizer(normalizer)
+    yield normalizer
+    set_skill_normalizer(previous)
+
+
+class TestSkillNormalizer:
+
+    def test_variants_are_mapped_to_taxonomy(self, normalizer):
+        raw = ["Pyhton", "ReactJS", "scikit learn", "Javascrpt", " SQL ", "kotlin", "go", "jo"]
+        assert normalizer.normalize_all(raw) == [
+            "python", "react", "scikit-learn", "javascript", "sql", "kotlin", "go", "jo"]
+        # Libellés inconnus : pas de correspondance, conservés par normalize_all
+        assert normalizer.match_all(["kotlin", "experience"]) == [None, None]
+
+    def test_alias_table_is_memoized_and_bounded(self):
+        normalizer = SkillNormalizer(TAXONOMY, max_aliases=3)
+        normalizer.normalize_all(["pyhton", "pyhton", "javva", "sqll"])
+        assert len(normalizer) == 3
+        normalizer.normalize("pyhton")  # variante récente : conservée lors de l'éviction
+        normalizer.normalize_all(["machin learning"])
+        assert len(normalizer) == 3
+        assert list(normalizer._resolved) == ["sqll", "pyhton", "machin learning"]
+
+    def test_resolution_is_chunked(self, monkeypatch):
+        """Test que les libellés inconnus sont comparés à la taxonomie par blocs bornés."""
+        raw = ["pyhton", "javva", "sqll", "reactt", "kotlin", "machin learning", "scikit lern"]
+        expected = SkillNormalizer(TAXONOMY).match_all(raw)
+        shapes = []
+        cdist = normalizer_module.process.cdist
+        monkeypatch.setattr(normalizer_module, "_CDIST_CHUNK", 3)
+        monkeypatch.setattr(normalizer_module.process, "cdist",
+                            lambda queries, *args, **kwargs: shapes.append(len(queries)) or cdist(queries, *args, **kwargs))
+        assert SkillNormalizer(TAXONOMY).match_all(raw) == expected
+        assert shapes == [3, 3, 1]
+
+    def test_version_tracks_configuration(self, normalizer):
+        assert normalizer.version == SkillNormalizer(TAXONOMY).version
+        assert normalizer.version != SkillNormalizer(TAXONOMY, score_cutoff=90).version
+        assert pickle.loads(pickle.dumps(normalizer)).normalize("pyhton") == "python"
+        # Le cache de parsing est invalidé quand le normaliseur change
+        assert CVAnalyzer(TAXONOMY, normalizer=normalizer).taxonomy_version != CVAnalyzer(TAXONOMY).taxonomy_version
+
+
+class TestSharedNormalization:
+
+    def test_models_use_installed_normalizer(self, installed):
+        cv = CV(id="C1", name="A", skills=["Pyhton", "python", "ReactJS"], years_experience=2.0,
+                location=LocationEnum.PARIS, availability_immediate=True)
+        offer = JobOffer(id="J1", title="Dev", required_skills=["Machine-Learning", "react.js"],
+                         min_years_experience=1.0, location=LocationEnum.PARIS, remote_allowed=False)
+        assert cv.skills == ["python", "react"]
+        assert offer.required_skills == ["machine learning", "react"]
+
+    def test_analyzer_detects_misspelled_skills(self, installed):
+        """Test que l'analyseur (qui reprend le normaliseur installé) rattrape les fautes de frappe."""
+        analyzer = CVAnalyzer(taxonomy=TAXONOMY)
+        cv = analyzer.parse_from_text("Dev Pyhton et ReactJS.\nMachine lerning (scikit learn), 4 ans.", "C1")
+        assert cv.skills == ["python", "react", "machine learning", "scikit-learn"]
+
+    def test_analyzer_ignores_common_words_close_to_skills(self, installed):
+        """Test que les mots courants proches d'une compétence ("reach", "trust") ne deviennent pas des compétences."""
+        analyzer = CVAnalyzer(taxonomy=TAXONOMY + ["rust", "docker"])
+        text = "I want to reach new goals. Trust, pythonic code, javanese food, lockers and goals."
+        assert analyzer.parse_from_text(text, "C1").skills == []
+        assert installed.match_tokens(["reach", "trust", "pythonic", "pyhton", "reactjs"]) == [
+            None, None, None, "python", "react"]
@@ -0,0 +1,110 @@
+import pickle
+import numpy as np
+import pytest
+from benchmarks.synthetic import SyntheticGenerator
+from src.models import HardConstraints, JobOffer, LocationEnum
+from src.services.index import CandidateIndex
+from src.services.matcher import MatchingEngine
+from src.services.planner import HardFilterPlanner
+from src.services.pool import CandidatePool
+from src.services.recommender import RecommendationSystem
+from src.services.score_table import ScoreTable
+from src.services.sharding import ShardedRecommender
+from src.services.snapshot import load_snapshot, save_snapshot
+
+CONSTRAINTS = HardConstraints(location_compatible=True, min_years_experience=3, availability_immediate=True)
+
+
+def admitted(cv, offer):
+    constraints = offer.hard_constraints
+    location_ok = cv.location == offer.location or (offer.remote_allowed and cv.location == LocationEnum.REMOTE)
+    return ((not constraints.location_compatible or location_ok)
+            and (constraints.min_years_experience is None or cv.years_experience >= constraints.min_years_experience)
+            and (not constraints.availability_immediate or cv.availability_immediate))
+
+
+def with_constraints(offer, constraints):
+    return JobOffer(offer.id, offer.title, offer.required_skills, offer.min_years_experience, offer.location,
+                    offer.remote_allowed, constraints)
+
+
+@pytest.fixture(scope="module")
+def data():
+    gen = SyntheticGenerator(seed=11)
+    return gen.cvs(1500), [with_constraints(offer, CONSTRAINTS) for offer in gen.offers(6)]
+
+
+class TestHardFilterPlanner:
+
+    def test_same_results_for_every_candidate_source(self, data):
+        """Test que seuls les candidats admis sont classés, quelle que soit la source."""
+        cvs, offers = data
+        recommender = RecommendationSystem(MatchingEngine())
+        pool, index, table = CandidatePool.from_cvs(cvs), CandidateIndex(cvs), ScoreTable(recommender.matcher, cvs, offers)
+        for offer in offers:
+            unconstrained = with_constraints(offer, None)
+            expected = recommender.recommend_candidates(
+                unconstrained, [cv for cv in cvs if admitted(cv, offer)], top_k=20)
+            expected_ids = [r["cv_id"] for r in expected]
+            for source in (cvs, pool, index, table):
+                results = recommender.recommend_candidates(offer, source, top_k=20)
+                assert [r["cv_id"] for r in results] == expected_ids
+                assert [r["score"] for r in results] == [r["score"] for r in expected]
+
+    def test_stats_and_selectivity_order(self, data):
+        cvs, offers = data
+        recommender = RecommendationSystem(MatchingEngine())
+        offer = offers[0]
+        recommender.recommend_candidates(offer, CandidatePool.from_cvs(cvs), top_k=5)
+        stats = recommender.last_query_stats
+        assert stats.offer_id == offer.id and stats.candidates == len(cvs)
+        assert stats.scored == sum(admitted(cv, offer) for cv in cvs)
+        assert stats.candidates - sum(stats.removed.values()) == stats.scored
+
+        # Le filtre le plus sélectif (estimé sur l'échantillon) est évalué en premier
+        planner = HardFilterPlanner(sample_size=len(cvs))
+        planner.apply(offer, cvs)
+        first = next(iter(planner.last_query_stats.removed))
+        pass_rates = {
+            "location": sum(admitted(cv, with_constraints(offer, HardConstraints(location_compatible=True)))
+                            for cv in cvs),
+            "experience": sum(cv.years_experience >= 3 for cv in cvs),
+            "availability": sum(cv.availability_immediate for cv in cvs),
+        }
+        assert first == min(pass_rates, key=pass_rates.get)
+
+    def test_without_constraints_nothing_removed(self, data):
+        cvs, _ = data
+        offer = JobOffer("JOB_X", "Dev", ["python"], 2, LocationEnum.PARIS, False)
+        planner = HardFilterPlanner()
+        assert planner.apply(offer, cvs) is None
+        assert (planner.last_query_stats.removed, planner.last_query_stats.scored) == ({}, len(cvs))
+
+    def test_mask_does_not_alias_pool_columns(self, data):
+        """Test que le masque renvoyé peut être modifié sans altérer le vivier."""
+        cvs, offers = data
+        pool = CandidatePool.from_cvs(cvs)
+        availability = pool.availability.copy()
+        offer = with_constraints(offers[0], HardConstraints(availability_immediate=True))
+        mask = HardFilterPlanner().apply(offer, pool)
+        assert not np.shares_memory(mask, pool.availability)
+        mask[:] = False
+        assert (pool.availability == availability).all()
+
+    def test_sharded_ranking_applies_constraints(self, data):
+        cvs, offers = data
+        matcher, pool = MatchingEngine(), CandidatePool.from_cvs(cvs)
+        expected = RecommendationSystem(matcher).recommend_candidates(offers[1], pool, top_k=10)
+        with ShardedRecommender.from_pool(matcher, pool, workers=1, shards=4) as sharded:
+            assert sharded.recommend_candidates(offers[1], top_k=10) == expected
+            assert sharded.last_query_stats.scored == sum(admitted(cv, offers[1]) for cv in cvs)
+
+    def test_constraints_survive_serialization(self, data, tmp_path):
+        """Test que les contraintes suivent l'offre (pickle pour les workers, instantanés)."""
+        _, offers = data
+        assert pickle.loads(pickle.dumps(offers[0])).hard_constraints == CONSTRAINTS
+        save_snapshot(str(tmp_path / "offers.snap"), offers, kind="offer")
+        assert load_snapshot(str(tmp_path / "offers.snap")) == offers
+        with pytest.raises(ValueError):
+            HardConstraints(min_years_experience=-1)
+
@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+import pytest
+from src.models import CV, HardConstraints, JobOffer, LocationEnum
+from src.services.matcher import MatchingEngine
+from src.services.pool import CandidatePool
+from src.services.recommender import RecommendationSystem
+from src.services.snapshot import SnapshotReader, save_snapshot
+
+SKILLS = ["python", "java", "sql", "machine learning", "react", "aws", "excel", "go"]
+
+
+@pytest.fixture
+def cvs():
+    rng = random.Random(7)
+    return [
+        CV(id=f"C{i:03d}", name=f"Candidat {i}", skills=rng.sample(SKILLS, rng.randint(0, 5)),
+           years_experience=rng.choice([0.0, 1.5, 3.0, 5.0, 8.0]), location=rng.choice(list(LocationEnum)),
+           availability_immediate=rng.random() < 0.5)
+        for i in range(60)
+    ]
+
+
+@pytest.fixture
+def offers():
+    return [
+        JobOffer(id="J1", title="Data", required_skills=["python", "sql", "machine learning"],
+                 min_years_experience=3.0, location=LocationEnum.PARIS, remote_allowed=True),
+        JobOffer(id="J2", title="Front", required_skills=["react", "kotlin"],
+                 min_years_experience=2.0, location=LocationEnum.LYON, remote_allowed=False),
+    ]
+
+
+class TestCandidatePool:
+
+    def test_roundtrip_conversion(self, cvs):
+        """Test que la conversion CV -> colonnes -> CV est sans perte (hors texte brut)."""
+        pool = CandidatePool.from_cvs(cvs)
+        assert len(pool) == len(cvs)
+        for original, restored in zip(cvs, pool.to_cvs()):
+            assert set(restored.skills) == set(original.skills)
+            assert (restored.id, restored.years_experience, restored.location, restored.availability_immediate) == \
+                   (original.id, original.years_experience, original.location, original.availability_immediate)
+
+    def test_bitmap_matches_packed_dense_layout(self, cvs):
+        """Test que les bits écrits directement suivent la disposition de np.packbits."""
+        cvs = cvs + [CV(id="C999", name="Candidat 999", skills=["kotlin", "go"], years_experience=1.0,
+                        location=LocationEnum.PARIS, availability_immediate=True)]
+        pool = CandidatePool.from_cvs(cvs)
+        dense = np.array([[skill in cv.skills for skill in pool.vocabulary] for cv in cvs])
+        assert pool.skill_bitmap.dtype == np.uint8 and len(pool.vocabulary) > 8
+        assert (pool.skill_bitmap == np.packbits(dense, axis=1)).all()
+
+    def test_memory_mapped_scoring_matches_pairwise(self, tmp_path, cvs, offers):
+        """Test que le scoring direct sur le vivier projeté en mémoire équivaut à compute_match."""
+        CandidatePool.from_cvs(cvs).save(str(tmp_path))
+        pool = CandidatePool.load(str(tmp_path))
+        assert isinstance(pool.skill_bitmap, np.memmap)
+
+        engine = MatchingEngine()
+        matrix = engine.compute_match_matrix(pool, offers)
+        expected = [[engine.compute_match(cv, offer) for offer in offers] for cv in cvs]
+        assert matrix.tolist() == expected
+
+    def test_recommender_accepts_pool(self, cvs, offers):
+        """Test que le classement sur le vivier est identique au classement sur la liste."""
+        reco = RecommendationSystem(MatchingEngine())
+        pool = CandidatePool.from_cvs(cvs)
+        for offer in offers:
+            from_pool = reco.recommend_candidates(offer, pool, top_k=10)
+            from_list = reco.recommend_candidates(offer, cvs, top_k=10)
+            assert [(r["cv_id"], r["score"]) for r in from_pool] == [(r["cv_id"], r["score"]) for r in from_list]
+
+
+class TestMultiOfferRanking:
+
+    def constrained_offers(self, offers):
+        strict = JobOffer(id="J3", title="Senior", required_skills=["go"], min_years_experience=5.0,
+                          location=LocationEnum.LYON, remote_allowed=True,
+                          hard_constraints=HardConstraints(location_compatible=True, min_years_experience=8.0,
+                                                           availability_immediate=True))
+        return offers + [strict]
+
+    def test_chunked_pool_matches_per_offer_ranking(self, tmp_path, cvs, offers):
+        """Test qu'une seule lecture par blocs du vivier donne le classement de chaque offre."""
+        offers = self.constrained_offers(offers)
+        CandidatePool.from_cvs(cvs).save(str(tmp_path))
+        pool = CandidatePool.load(str(tmp_path))
+        reco = RecommendationSystem(MatchingEngine())
+
+        results = reco.recommend_for_offers(offers, pool, top_k=10, chunk_size=7)
+        assert list(results) == [offer.id for offer in offers]
+        for offer in offers:
+            assert results[offer.id] == reco.recommend_candidates(offer, pool, top_k=10)
+        # Contraintes strictes : moins de survivants que top_k
+        assert len(results["J3"]) == reco.last_batch_stats["J3"].scored < 10
+        assert reco.last_batch_stats["J1"].candidates == len(cvs)
+
+    def test_streams_any_candidate_iterable(self, tmp_path, cvs, offers):
+        offers = self.constrained_offers(offers)
+        save_snapshot(str(tmp_path / "pool.snap"), cvs, chunk_size=10)
+        reco = RecommendationSystem(MatchingEngine())
+
+        results = reco.recommend_for_offers(offers, SnapshotReader(str(tmp_path / "pool.snap")), top_k=5,
+                                            chunk_size=16)
+        for offer in offers:
+            assert results[offer.id] == reco.recommend_candidates(offer, cvs, top_k=5)
+        assert reco.recommend_for_offers([], cvs) == {}
+        with pytest.raises(ValueError):
+            reco.recommend_for_offers(offers, cvs, chunk_size=0)
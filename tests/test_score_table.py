@@ -0,0 +1,79 @@
+import random
+
+import pytest
+from src.models import CV, JobOffer, LocationEnum
+from src.services.matcher import MatchingEngine
+from src.services.recommender import RecommendationSystem
+from src.services.score_table import ScoreTable
+
+SKILLS = ["python", "java", "sql", "machine learning", "react", "aws", "excel"]
+
+
+def random_cv(rng, i):
+    return CV(id=f"C{i:03d}", name=f"Candidat {i}", skills=rng.sample(SKILLS, rng.randint(0, 4)),
+              years_experience=rng.choice([0.0, 2.0, 4.0, 7.0]), location=rng.choice(list(LocationEnum)),
+              availability_immediate=True)
+
+
+def random_offer(rng, i):
+    return JobOffer(id=f"J{i:02d}", title="Poste", required_skills=rng.sample(SKILLS, rng.randint(0, 3)),
+                    min_years_experience=rng.choice([0.0, 3.0, 5.0]), location=rng.choice(list(LocationEnum)),
+                    remote_allowed=rng.random() < 0.5)
+
+
+@pytest.fixture
+def data():
+    rng = random.Random(11)
+    return [random_cv(rng, i) for i in range(40)], [random_offer(rng, i) for i in range(6)]
+
+
+def assert_matches_engine(table, matcher):
+    for cv in table.cvs():
+        for offer in table.offers():
+            assert table.score(cv.id, offer.id) == matcher.compute_match(cv, offer)
+
+
+class TestScoreTable:
+
+    def test_incremental_updates(self, data):
+        """Test que les ajouts, modifications et suppressions gardent la table égale à compute_match (avec croissance)."""
+        cvs, offers = data
+        matcher = MatchingEngine()
+        table = ScoreTable(matcher, cvs[:10], offers[:2], capacity=(4, 1))
+        table.upsert_cvs(cvs[10:])
+        for offer in offers[2:]:
+            table.upsert_offer(offer)
+        assert table.shape == (40, 6)
+        assert_matches_engine(table, matcher)
+
+        cvs[0].skills = ["python", "sql", "aws"]
+        table.upsert_cv(cvs[0])
+        offers[1].required_skills = ["react"]
+        table.upsert_offer(offers[1])
+        table.remove_cv(cvs[5].id)
+        table.remove_offer(offers[4].id)
+        table.upsert_cv(CV(id="NEW", name="Nouveau", skills=["excel"], years_experience=1.0,
+                           location=LocationEnum.LYON, availability_immediate=True))
+        assert table.shape == (40, 5)
+        assert "C005" not in table
+        assert_matches_engine(table, matcher)
+        with pytest.raises(KeyError):
+            table.score("C005", offers[0].id)
+
+    def test_set_weights_recombines_stored_subscores(self, data, monkeypatch):
+        cvs, offers = data
+        table = ScoreTable(MatchingEngine(), cvs, offers)
+        monkeypatch.setattr(table.matcher, "compute_subscore_matrices",
+                            lambda *args: pytest.fail("sub-scores must not be recomputed"))
+        weights = {"skills": 0.7, "experience": 0.2, "location": 0.1}
+        table.set_weights(weights)
+        assert_matches_engine(table, MatchingEngine(weights))
+
+    def test_ranked_list_matches_recommender(self, data):
+        cvs, offers = data
+        recommender = RecommendationSystem(MatchingEngine())
+        table = ScoreTable(recommender.matcher, cvs, offers)
+        for offer in offers:
+            expected = recommender.recommend_candidates(offer, cvs, top_k=7)
+            ranked = recommender.recommend_candidates(offer, table, top_k=7)
+            assert [(r["cv_id"], r["score"]) for r in ranked] == [(r["cv_id"], r["score"]) for r in expected]
@@ -0,0 +1,36 @@
+import pytest
+from benchmarks.synthetic import SyntheticGenerator
+from src.services.matcher import MatchingEngine
+from src.services.pool import CandidatePool
+from src.services.recommender import RecommendationSystem
+from src.services.sharding import ShardedRecommender
+
+
+@pytest.fixture(scope="module")
+def data():
+    gen = SyntheticGenerator(seed=5)
+    return CandidatePool.from_cvs(gen.cvs(3000)), gen.offers(8)
+
+
+class TestShardedRecommender:
+
+    def test_identical_to_single_process(self, data):
+        """Test que la fusion des top-k locaux donne exactement le classement mono-processus."""
+        pool, offers = data
+        matcher = MatchingEngine()
+        expected = [RecommendationSystem(matcher).recommend_candidates(offer, pool, top_k=25) for offer in offers]
+        with ShardedRecommender.from_pool(matcher, pool, workers=2, shards=7) as sharded:
+            assert len(sharded) == len(pool)
+            assert [sharded.recommend_candidates(offer, top_k=25) for offer in offers] == expected
+
+    def test_from_saved_directory(self, data, tmp_path):
+        pool, offers = data
+        pool.save(str(tmp_path))
+        matcher = MatchingEngine({"skills": 0.8, "experience": 0.1, "location": 0.1})
+        sharded = ShardedRecommender(matcher, str(tmp_path), workers=1, shards=3)
+        try:
+            results = sharded.recommend_candidates(offers[0], top_k=5)
+        finally:
+            sharded.close()
+        assert results == RecommendationSystem(matcher).recommend_candidates(offers[0], pool, top_k=5)
+        assert (tmp_path / "meta.json").exists()
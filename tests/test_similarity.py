@@ -0,0 +1,101 @@
+import pickle
+
+import numpy as np
+import pytest
+from src.models import CV, JobOffer, LocationEnum
+from src.services.index import CandidateIndex
+from src.services.matcher import MatchingEngine
+from src.services.recommender import RecommendationSystem
+from src.services.similarity import SkillSimilarityModel
+
+TAXONOMY = ["python", "java", "javascript", "typescript", "sql", "postgresql", "mysql",
+            "machine learning", "pytorch", "react", "react native", "aws", "excel"]
+
+
+@pytest.fixture(scope="module")
+def model():
+    return SkillSimilarityModel.build(TAXONOMY)
+
+
+def make_cv(cv_id, skills):
+    return CV(id=cv_id, name=cv_id, skills=skills, years_experience=5.0, location=LocationEnum.PARIS,
+              availability_immediate=True)
+
+
+@pytest.fixture
+def offer():
+    return JobOffer(id="J1", title="Data", required_skills=["sql", "machine learning"], min_years_experience=3.0,
+                    location=LocationEnum.LYON, remote_allowed=False)
+
+
+class TestSkillSimilarityModel:
+
+    def test_pruned_sparse_and_symmetric(self, model):
+        """Test que la matrice est creuse, symétrique, de diagonale 1, et respecte les relations imposées."""
+        dense = model.matrix.toarray()
+        assert np.allclose(dense, dense.T)
+        assert np.all(np.diag(dense) == 1.0)
+        assert model.nnz < len(model) ** 2 / 2
+        assert model.similarity("sql", "postgresql") == pytest.approx(0.8)
+        assert model.similarity("machine learning", "pytorch") == pytest.approx(0.6)
+        assert model.similarity("java", "javascript") == 0.0
+        assert model.similarity("python", "excel") == 0.0
+
+    def test_block_build_matches_single_block(self, model):
+        """Test que la construction par blocs de lignes donne la même matrice élaguée."""
+        blocked = SkillSimilarityModel.build(TAXONOMY, block_size=3)
+        assert blocked.skills == model.skills
+        assert (blocked.matrix != model.matrix).nnz == 0
+
+    def test_neighbor_cache_is_not_pickled(self, model, offer):
+        """Test que les identifiants internés (propres au processus) ne voyagent pas avec le modèle."""
+        engine = MatchingEngine(similarity=model)
+        cv = make_cv("C1", ["postgresql", "pytorch"])
+        expected = engine.compute_match(cv, offer)  # remplit le cache des voisins
+        copy = pickle.loads(pickle.dumps(model))
+        assert copy._neighbors == {}
+        assert MatchingEngine(similarity=copy).compute_match(cv, offer) == expected
+
+    def test_save_and_load(self, model, tmp_path):
+        path = tmp_path / "similarity.npz"
+        model.save(str(path))
+        loaded = SkillSimilarityModel.load(str(path))
+        assert loaded.skills == model.skills
+        assert (loaded.matrix != model.matrix).nnz == 0
+
+
+class TestSemanticMatching:
+
+    def test_partial_credit(self, model, offer):
+        """Test que les compétences proches rapportent un crédit partiel, et que le mode par défaut reste exact."""
+        cv = make_cv("C1", ["postgresql", "pytorch"])
+        exact = MatchingEngine().compute_match(cv, offer)
+        semantic = MatchingEngine(similarity=model).compute_match(cv, offer)
+        # Skills: (0.8 + 0.6) / 2 = 0.7 -> 0.5 * 0.7 + 0.3 = 65
+        assert exact == 30.0
+        assert semantic == pytest.approx(65.0)
+        # Le crédit partiel entre dans le sous-score, mais les compétences restent manquantes
+        match = MatchingEngine(similarity=model).evaluate(cv, offer)
+        assert match.score == semantic
+        assert match.skill_score == pytest.approx(0.7)
+        assert set(match.missing_skills) == set(offer.required_skills)
+
+    def test_matrix_equals_pairwise(self, model, offer):
+        engine = MatchingEngine(similarity=model)
+        cvs = [make_cv(f"C{i}", skills) for i, skills in enumerate(
+            [["postgresql"], ["sql", "pytorch"], ["mysql", "postgresql"], ["excel"], []])]
+        offers = [offer, JobOffer(id="J2", title="Front", required_skills=["react", "typescript"],
+                                  min_years_experience=1.0, location=LocationEnum.PARIS, remote_allowed=True)]
+        matrix = engine.compute_match_matrix(cvs, offers)
+        for i, cv in enumerate(cvs):
+            for j, o in enumerate(offers):
+                assert matrix[i, j] == engine.compute_match(cv, o)
+
+    def test_index_retrieves_related_candidates(self, model, offer):
+        """Test qu'un candidat sans compétence exacte mais avec une compétence proche n'est pas écarté par l'index."""
+        index = CandidateIndex([make_cv("C1", ["postgresql"]), make_cv("C2", ["excel"])])
+        assert index.candidates_for(offer) == []
+        assert [cv.id for cv in index.candidates_for(offer, similarity=model)] == ["C1"]
+
+        results = RecommendationSystem(MatchingEngine(similarity=model)).recommend_candidates(offer, index)
+        assert [r["cv_id"] for r in results] == ["C1"]
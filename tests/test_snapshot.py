@@ -0,0 +1,93 @@
+import struct
+
+import pytest
+from src.models import CV, HardConstraints, JobOffer, LocationEnum
+from src.services import snapshot
+from src.services.snapshot import (
+    SnapshotError, SnapshotReader, SnapshotWriter, load_snapshot, save_snapshot,
+)
+
+
+def make_cvs(count):
+    locations = list(LocationEnum)
+    return [CV(id=f"CAND_{i:04d}", name=f"Candidat {i}", skills=["python", "sql", f"skill{i % 7}"][: 1 + i % 3],
+               years_experience=float(i % 12), location=locations[i % 3], availability_immediate=bool(i % 2),
+               raw_text=f"CV {i}" if i % 5 else None)
+            for i in range(count)]
+
+
+class TestSnapshot:
+
+    def test_round_trip_across_frames(self, tmp_path):
+        """Test l'aller-retour (plusieurs trames, en-tête, lecture en flux)."""
+        cvs = make_cvs(23)
+        path = tmp_path / "pool.snap"
+        header = save_snapshot(str(path), cvs, taxonomy_version="v1", chunk_size=5)
+
+        reader = SnapshotReader(str(path))
+        assert header == reader.header
+        assert (reader.header.kind, len(reader), reader.frame_count) == ("cv", 23, 5)
+        assert list(reader) == cvs
+
+    def test_partial_reads(self, tmp_path):
+        cvs = make_cvs(50)
+        path = str(tmp_path / "pool.snap")
+        save_snapshot(path, cvs, chunk_size=8)
+        reader = SnapshotReader(path)
+        assert reader.read(13, 30) == cvs[13:30]
+        assert reader.read(45) == cvs[45:]
+        assert reader.read(60) == []
+        assert load_snapshot(path) == cvs
+
+    def test_offers_and_type_check(self, tmp_path):
+        offers = [JobOffer(id="JOB_1", title="Data", required_skills=["python"], min_years_experience=2,
+                           location=LocationEnum.LYON, remote_allowed=True)]
+        path = str(tmp_path / "offers.snap")
+        save_snapshot(path, offers, kind="offer")
+        assert load_snapshot(path) == offers
+
+        with pytest.raises(TypeError):
+            with SnapshotWriter(str(tmp_path / "bad.snap"), kind="offer") as writer:
+                writer.write(make_cvs(1)[0])
+        # Écriture abandonnée : ni destination ni fichier temporaire
+        assert [p.name for p in tmp_path.iterdir()] == ["offers.snap"]
+
+    def test_rejects_other_taxonomy_or_file(self, tmp_path):
+        """Test qu'une autre version de taxonomie ou un fichier étranger est refusé."""
+        path = tmp_path / "pool.snap"
+        save_snapshot(str(path), make_cvs(3), taxonomy_version="v1")
+        assert len(load_snapshot(str(path), expected_version="v1")) == 3
+        with pytest.raises(SnapshotError):
+            load_snapshot(str(path), expected_version="v2")
+
+        other = tmp_path / "other.bin"
+        other.write_bytes(b"not a snapshot at all, definitely")
+        with pytest.raises(SnapshotError):
+            SnapshotReader(str(other))
+
+    def test_format_version_identifies_old_files(self, tmp_path, monkeypatch):
+        """Test que les offres du format 1 (sans contraintes) restent lisibles, et qu'un format inconnu est refusé."""
+        offer = JobOffer(id="JOB_1", title="Data", required_skills=["python"], min_years_experience=2,
+                         location=LocationEnum.LYON, remote_allowed=True,
+                         hard_constraints=HardConstraints(min_years_experience=2))
+        current = tmp_path / "offers.snap"
+        save_snapshot(str(current), [offer], kind="offer")
+        assert SnapshotReader(str(current)).header.format_version == snapshot.SNAPSHOT_FORMAT_VERSION == 2
+
+        # Fichier du format 1 : enregistrements d'offre à six champs
+        old = tmp_path / "old.snap"
+        with monkeypatch.context() as patch:
+            patch.setattr(snapshot, "SNAPSHOT_FORMAT_VERSION", 1)
+            patch.setitem(snapshot._CODECS, "offer",
+                          (JobOffer, lambda o: snapshot._encode_offer(o)[:6], snapshot._decode_offer))
+            save_snapshot(str(old), [offer], kind="offer")
+        reader = SnapshotReader(str(old))
+        assert reader.header.format_version == 1
+        assert reader.read_all()[0].hard_constraints is None
+
+        # Format plus récent que le lecteur : refusé
+        data = bytearray(current.read_bytes())
+        struct.pack_into("<H", data, 8, snapshot.SNAPSHOT_FORMAT_VERSION + 1)
+        current.write_bytes(bytes(data))
+        with pytest.raises(SnapshotError):
+            SnapshotReader(str(current))